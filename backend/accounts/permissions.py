@@ -55,6 +55,10 @@ class RolePermission(BasePermission):
     def __init__(self, required_roles=None):
         self.required_roles = required_roles or []
 
+    def __call__(self):
+        # DRF instantiates each entry of permission_classes; return the configured instance
+        return self
+
     def has_permission(self, request, view):
         user = request.user
         if not (user and getattr(user, "is_authenticated", False)):
@@ -5,6 +5,7 @@ Serializers for applicant history and comprehensive tracking
 from rest_framework import serializers
 from applicants.models import Applicant
 from interviews.models import Interview, VideoResponse
+from interviews.streaming import stream_url
 from results.models import InterviewResult
 from processing.models import ProcessingQueue
 
@@ -35,13 +36,8 @@ class VideoResponseHistorySerializer(serializers.ModelSerializer):
         ]
     
     def get_video_url(self, obj):
-        """Get video file URL"""
-        if obj.video_file_path:
-            request = self.context.get('request')
-            if request:
-                return request.build_absolute_uri(obj.video_file_path.url)
-            return obj.video_file_path.url
-        return None
+        """Get the seekable playback URL (signed for <video> elements)"""
+        return stream_url(self.context.get('request'), obj)
 
     def get_ai_analysis_summary(self, obj):
         """Get AI analysis summary if available"""
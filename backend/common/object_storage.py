@@ -0,0 +1,143 @@
+"""
+S3-compatible object storage for interview videos
+
+With VIDEO_STORAGE_BACKEND = 's3' the browser uploads each recording straight
+to the bucket with a presigned PUT URL (see interviews/uploads.py), so web
+workers never handle video bytes. VideoResponse files are then served through
+presigned GET URLs. Celery workers download a temporary local copy when
+ffmpeg or OpenCV need a file (interviews.media_pipeline.local_video).
+
+Any S3-compatible server works: set OBJECT_STORAGE_ENDPOINT_URL to run
+against a local MinIO (see docs/DEV_NOTES.md), or leave it empty for AWS.
+boto3 is imported lazily and is only needed when the s3 backend is enabled.
+"""
+
+import base64
+import tempfile
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.files import File
+from django.core.files.storage import Storage, default_storage
+from django.utils.deconstruct import deconstructible
+
+
+def s3_enabled():
+    return getattr(settings, 'VIDEO_STORAGE_BACKEND', 'local') == 's3'
+
+
+@lru_cache(maxsize=1)
+def get_client():
+    try:
+        import boto3
+        from botocore.config import Config
+    except ImportError as e:
+        raise ImproperlyConfigured("VIDEO_STORAGE_BACKEND='s3' requires boto3 (pip install boto3)") from e
+
+    return boto3.client(
+        's3',
+        endpoint_url=settings.OBJECT_STORAGE_ENDPOINT_URL or None,
+        aws_access_key_id=settings.OBJECT_STORAGE_ACCESS_KEY or None,
+        aws_secret_access_key=settings.OBJECT_STORAGE_SECRET_KEY or None,
+        region_name=settings.OBJECT_STORAGE_REGION,
+        # Path-style addressing so MinIO and other self-hosted endpoints work without bucket DNS
+        config=Config(signature_version='s3v4', s3={'addressing_style': 'path'}),
+    )
+
+
+def _bucket():
+    return settings.OBJECT_STORAGE_BUCKET
+
+
+def sha256_base64(sha256_hex):
+    """S3 wants the SHA-256 checksum base64-encoded, clients send hex"""
+    return base64.b64encode(bytes.fromhex(sha256_hex)).decode()
+
+
+def presigned_put(key, content_type, sha256_hex):
+    """
+    URL and headers for a direct browser PUT of one object
+
+    The checksum is part of the signature: S3 rejects a body that does not
+    hash to it, so a corrupted upload never lands under the key.
+    """
+    checksum = sha256_base64(sha256_hex)
+    url = get_client().generate_presigned_url(
+        'put_object',
+        Params={
+            'Bucket': _bucket(),
+            'Key': key,
+            'ContentType': content_type,
+            'ChecksumSHA256': checksum,
+        },
+        ExpiresIn=settings.OBJECT_STORAGE_URL_EXPIRY,
+        HttpMethod='PUT',
+    )
+    return url, {'Content-Type': content_type, 'x-amz-checksum-sha256': checksum}
+
+
+def presigned_get(key):
+    return get_client().generate_presigned_url(
+        'get_object',
+        Params={'Bucket': _bucket(), 'Key': key},
+        ExpiresIn=settings.OBJECT_STORAGE_URL_EXPIRY,
+    )
+
+
+def head(key):
+    """{'size', 'checksum_sha256'} for an object, or None if it does not exist"""
+    try:
+        response = get_client().head_object(Bucket=_bucket(), Key=key, ChecksumMode='ENABLED')
+    except Exception as e:
+        # botocore ClientError; matched by its payload so botocore stays a lazy import
+        if getattr(e, 'response', {}).get('Error', {}).get('Code') in ('404', 'NoSuchKey', 'NotFound'):
+            return None
+        raise
+    return {'size': response['ContentLength'], 'checksum_sha256': response.get('ChecksumSHA256')}
+
+
+def download(key, path):
+    get_client().download_file(_bucket(), key, path)
+
+
+def delete(key):
+    get_client().delete_object(Bucket=_bucket(), Key=key)
+
+
+@deconstructible
+class S3VideoStorage(Storage):
+    """
+    Django storage over the video bucket
+
+    There is no local path; use interviews.media_pipeline.local_video to get
+    a file ffmpeg or OpenCV can open.
+    """
+
+    def _open(self, name, mode='rb'):
+        spooled = tempfile.SpooledTemporaryFile(max_size=settings.FILE_UPLOAD_MAX_MEMORY_SIZE)
+        get_client().download_fileobj(_bucket(), name, spooled)
+        spooled.seek(0)
+        return File(spooled, name=name)
+
+    def _save(self, name, content):
+        content.seek(0)
+        get_client().upload_fileobj(content, _bucket(), name)
+        return name
+
+    def exists(self, name):
+        return head(name) is not None
+
+    def size(self, name):
+        return head(name)['size']
+
+    def url(self, name):
+        return presigned_get(name)
+
+    def delete(self, name):
+        delete(name)
+
+
+def video_storage():
+    """Storage for VideoResponse uploads, chosen by VIDEO_STORAGE_BACKEND"""
+    return S3VideoStorage() if s3_enabled() else default_storage
@@ -0,0 +1,131 @@
+"""
+Shared token-bucket rate limiting for outbound AI API calls
+
+Every Celery worker calls Gemini and Deepgram directly, so provider quotas
+(requests per minute, tokens per minute) are shared by the whole fleet.
+Buckets live in Redis and are refilled and debited atomically by a Lua
+script, so all workers draw from the same budget. A caller that finds the
+bucket empty sleeps until enough capacity has refilled instead of sending a
+request that would come back as a 429 and cost a 60s+ task retry.
+
+Limits are configured per provider in RATE_LIMITS; a limit of 0 disables that
+bucket. Limiting fails open: if Redis is unavailable, or a caller has waited
+RATE_LIMIT_MAX_WAIT seconds, the call proceeds. Time spent waiting is recorded
+in monitoring.metrics as 'rate_limit.<provider>.wait_ms'.
+"""
+
+import logging
+import time
+
+from django.conf import settings
+
+from monitoring import metrics
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = 'rate_limit'
+METRIC_PREFIX = 'rate_limit'
+
+# KEYS: one hash per bucket. ARGV: now_ms, then (capacity, amount) per bucket.
+# Each bucket refills its full capacity over one minute. Debits all buckets
+# only if every one has room; otherwise returns the ms until they all would.
+TOKEN_BUCKET_SCRIPT = """
+local now = tonumber(ARGV[1])
+local levels = {}
+local wait = 0
+for i, key in ipairs(KEYS) do
+    local capacity = tonumber(ARGV[i * 2])
+    local amount = math.min(tonumber(ARGV[i * 2 + 1]), capacity)
+    local rate = capacity / 60000
+    local state = redis.call('HMGET', key, 'level', 'ts')
+    local level = tonumber(state[1]) or capacity
+    local ts = tonumber(state[2]) or now
+    level = math.min(capacity, level + math.max(0, now - ts) * rate)
+    levels[i] = level - amount
+    if level < amount then
+        wait = math.max(wait, math.ceil((amount - level) / rate))
+    end
+end
+if wait == 0 then
+    for i, key in ipairs(KEYS) do
+        redis.call('HSET', key, 'level', levels[i], 'ts', now)
+        redis.call('PEXPIRE', key, 120000)
+    end
+end
+return wait
+"""
+
+
+def _get_redis():
+    from django_redis import get_redis_connection
+    return get_redis_connection('default')
+
+
+def provider_limits(provider):
+    """(requests_per_minute, tokens_per_minute) for a provider; 0 means unlimited"""
+    limits = getattr(settings, 'RATE_LIMITS', {}).get(provider, {})
+    return int(limits.get('requests_per_minute', 0)), int(limits.get('tokens_per_minute', 0))
+
+
+def acquire(provider, tokens=0):
+    """
+    Block until the provider's buckets have room for one request of `tokens`
+
+    Returns the seconds spent asleep on an empty bucket. Never raises: rate limiting is an
+    optimisation, not a reason to fail an interview.
+    """
+    if not getattr(settings, 'RATE_LIMIT_ENABLED', True):
+        return 0.0
+
+    rpm, tpm = provider_limits(provider)
+    keys, args = [], []
+    if rpm > 0:
+        keys.append(f"{KEY_PREFIX}:{provider}:requests")
+        args.extend([rpm, 1])
+    if tpm > 0 and tokens > 0:
+        keys.append(f"{KEY_PREFIX}:{provider}:tokens")
+        args.extend([tpm, int(tokens)])
+    if not keys:
+        return 0.0
+
+    max_wait = getattr(settings, 'RATE_LIMIT_MAX_WAIT', 120)
+    started = time.monotonic()
+    slept = 0.0
+    try:
+        redis = _get_redis()
+        while True:
+            wait_ms = int(redis.eval(TOKEN_BUCKET_SCRIPT, len(keys), *keys, int(time.time() * 1000), *args))
+            if wait_ms <= 0:
+                break
+            if time.monotonic() - started + wait_ms / 1000 > max_wait:
+                logger.warning(f"{provider} rate limit wait exceeded {max_wait}s; sending request anyway")
+                break
+            time.sleep(wait_ms / 1000)
+            slept += wait_ms / 1000
+    except Exception as e:
+        logger.warning(f"{provider} rate limiter unavailable, not throttling: {e}")
+
+    metrics.increment(f"{METRIC_PREFIX}.{provider}.requests")
+    if slept:
+        # Only time spent asleep on an empty bucket; the script round trips are not throttling
+        metrics.increment(f"{METRIC_PREFIX}.{provider}.throttled")
+        metrics.increment(f"{METRIC_PREFIX}.{provider}.wait_ms", int(slept * 1000))
+    return slept
+
+
+def limiter_stats(providers=('gemini', 'deepgram')):
+    """Requests, throttled requests and total wait per provider"""
+    stats = {}
+    for provider in providers:
+        names = [f"{METRIC_PREFIX}.{provider}.{counter}" for counter in ('requests', 'throttled', 'wait_ms')]
+        requests, throttled, wait_ms = metrics.get_counters(names).values()
+        rpm, tpm = provider_limits(provider)
+        stats[provider] = {
+            'requests_per_minute': rpm,
+            'tokens_per_minute': tpm,
+            'requests': requests,
+            'throttled': throttled,
+            'total_wait_ms': wait_ms,
+            'avg_wait_ms': round(wait_ms / throttled) if throttled else 0,
+        }
+    return stats
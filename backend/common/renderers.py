@@ -0,0 +1,35 @@
+import json
+
+from rest_framework.renderers import BaseRenderer
+
+
+class EventStreamRenderer(BaseRenderer):
+    """
+    Lets Server-Sent Events endpoints accept `Accept: text/event-stream`.
+
+    Streaming views return a StreamingHttpResponse, which bypasses rendering;
+    error responses (auth, not found) are rendered as a single `error` event.
+    """
+
+    media_type = "text/event-stream"
+    format = "event-stream"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        return f"event: error\ndata: {json.dumps(data)}\n\n".encode(self.charset)
+
+
+class MediaStreamRenderer(BaseRenderer):
+    """
+    Lets media endpoints accept the `Accept: video/*` a <video> element sends.
+
+    Successful responses are FileResponses or redirects, which bypass
+    rendering; error responses are rendered as JSON.
+    """
+
+    media_type = "video/*"
+    format = "video"
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        return json.dumps(data).encode("utf-8")
@@ -1,6 +1,8 @@
 from rest_framework.routers import DefaultRouter
 from monitoring.views import TokenUsageViewSet, DailyTokenSummaryViewSet
+from processing.views import ProcessingStageViewSet
 
 system_router = DefaultRouter()
 system_router.register(r"token-usage", TokenUsageViewSet, basename="system-token-usage")
 system_router.register(r"token-summary", DailyTokenSummaryViewSet, basename="system-token-summary")
+system_router.register(r"processing-stages", ProcessingStageViewSet, basename="system-processing-stages")
@@ -3,6 +3,10 @@ ASGI config for core project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
 
+Serving under ASGI (e.g. ``uvicorn core.asgi:application``) lets the
+processing-events Server-Sent Events streams wait on Redis pub/sub in the
+event loop instead of holding a worker thread per connected applicant.
+
 For more information on this file, see
 https://docs.djangoproject.com/en/5.1/howto/deployment/asgi/
 """
@@ -1,5 +1,7 @@
 import os
+import logging
 from celery import Celery
+from celery.signals import worker_process_init
 
 # Set default Django settings module for Celery
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'core.settings')
@@ -14,6 +16,16 @@ app.config_from_object('django.conf:settings', namespace='CELERY')
 app.autodiscover_tasks()
 
 
+@worker_process_init.connect
+def warm_up_worker_process(**kwargs):
+    """Load the OpenCV face detector once per worker process instead of once per video"""
+    try:
+        from interviews.ai.face_detectors import warm_up_face_detector
+        warm_up_face_detector()
+    except Exception:
+        logging.getLogger(__name__).exception("Failed to warm up script detection face detector")
+
+
 @app.task(bind=True)
 def debug_task(self):
     """Debug task for testing Celery"""
@@ -242,6 +242,84 @@ CELERY_TASK_ACKS_LATE = os.getenv('CELERY_TASK_ACKS_LATE', 'True') == 'True'
 CELERY_TASK_TIME_LIMIT = int(os.getenv('CELERY_TASK_TIME_LIMIT', '900'))  # hard limit in seconds
 CELERY_TASK_SOFT_TIME_LIMIT = int(os.getenv('CELERY_TASK_SOFT_TIME_LIMIT', '840'))
 
+# Work is split across queues so each worker pool can use the right concurrency model
+# (worker commands in docs/DEV_NOTES.md):
+# - transcription: Deepgram uploads, ffmpeg runs in a subprocess; many threads
+# - media: OpenCV script detection, CPU-bound and on the submit critical path; prefork with
+#   one process per core
+# - transcode: video normalization (ffmpeg re-encode after upload), CPU-bound but not
+#   needed by submit; its own small pool so it never delays script detection
+# - io: Gemini calls, mostly waiting on the network; threads/gevent with high concurrency
+# - notifications: applicant emails, so SMTP stalls never delay analysis
+# - celery (default): pipeline orchestration and scoring
+TRANSCRIPTION_QUEUE = os.getenv('TRANSCRIPTION_QUEUE', 'transcription')
+MEDIA_QUEUE = os.getenv('MEDIA_QUEUE', 'media')
+TRANSCODE_QUEUE = os.getenv('TRANSCODE_QUEUE', 'transcode')
+IO_QUEUE = os.getenv('IO_QUEUE', 'io')
+NOTIFICATIONS_QUEUE = os.getenv('NOTIFICATIONS_QUEUE', 'notifications')
+CELERY_TASK_DEFAULT_QUEUE = 'celery'
+CELERY_TASK_ROUTES = {
+    'interviews.tasks.transcribe_video_response': {'queue': TRANSCRIPTION_QUEUE, 'routing_key': TRANSCRIPTION_QUEUE},
+    'interviews.tasks.ensure_transcript': {'queue': TRANSCRIPTION_QUEUE, 'routing_key': TRANSCRIPTION_QUEUE},
+    'interviews.tasks.normalize_video_response': {'queue': TRANSCODE_QUEUE, 'routing_key': TRANSCODE_QUEUE},
+    'interviews.tasks.detect_video_script_reading': {'queue': MEDIA_QUEUE, 'routing_key': MEDIA_QUEUE},
+    'interviews.tasks.analyze_single_video': {'queue': MEDIA_QUEUE, 'routing_key': MEDIA_QUEUE},
+    'interviews.tasks.analyze_interview_transcripts': {'queue': IO_QUEUE, 'routing_key': IO_QUEUE},
+    'notifications.tasks.*': {'queue': NOTIFICATIONS_QUEUE, 'routing_key': NOTIFICATIONS_QUEUE},
+}
+# Queues reported by /api/token-usage/queue-depth/
+MONITORED_QUEUES = [
+    CELERY_TASK_DEFAULT_QUEUE, TRANSCRIPTION_QUEUE, MEDIA_QUEUE, TRANSCODE_QUEUE, IO_QUEUE, NOTIFICATIONS_QUEUE,
+]
+# Completion estimates learned from recorded stage timings (processing/eta.py)
+ETA_WINDOW_HOURS = int(os.getenv('ETA_WINDOW_HOURS', '24'))
+ETA_PERCENTILE = float(os.getenv('ETA_PERCENTILE', '0.9'))
+ETA_MIN_SAMPLES = int(os.getenv('ETA_MIN_SAMPLES', '5'))
+ETA_DURATION_BUCKETS = [60, 180]  # video length bounds in seconds
+ETA_PIPELINE_CONCURRENCY = int(os.getenv('ETA_PIPELINE_CONCURRENCY', '4'))  # interviews processed at once
+ETA_REFRESH_SECONDS = int(os.getenv('ETA_REFRESH_SECONDS', '300'))
+# Processing status snapshots and Server-Sent Events (processing/status.py)
+PROCESSING_STATUS_TTL = int(os.getenv('PROCESSING_STATUS_TTL', '86400'))
+PROCESSING_EVENTS_MAX_SECONDS = int(os.getenv('PROCESSING_EVENTS_MAX_SECONDS', '300'))  # clients reconnect after this
+PROCESSING_EVENTS_HEARTBEAT = int(os.getenv('PROCESSING_EVENTS_HEARTBEAT', '15'))
+CELERY_BEAT_SCHEDULE = {
+    'refresh-eta-model': {
+        'task': 'processing.tasks.refresh_eta_model',
+        'schedule': ETA_REFRESH_SECONDS,
+    },
+    'cleanup-stale-uploads': {
+        'task': 'interviews.tasks.cleanup_stale_uploads',
+        'schedule': 3600,
+    },
+}
+# How long bulk processing waits for in-flight transcripts before transcribing inline;
+# ensure_transcript re-queues itself every poll interval rather than sleeping in a worker
+TRANSCRIPT_WAIT_TIMEOUT = int(os.getenv('TRANSCRIPT_WAIT_TIMEOUT', '120'))
+TRANSCRIPT_WAIT_POLL_INTERVAL = float(os.getenv('TRANSCRIPT_WAIT_POLL_INTERVAL', '5'))
+# Where a ScriptDetectionBatch runs; SCRIPT_DETECTION_TIMEOUT is one deadline per batch and
+# only the process pool can stop a detection that overruns it:
+# process (default, falls back to threads where a pool cannot fork) | thread | inline
+# The per-video pipeline task always runs inline and uses SCRIPT_DETECTION_TIMEOUT as its
+# Celery soft time limit (not enforced by the solo pool used on Windows)
+SCRIPT_DETECTION_EXECUTOR = os.getenv('SCRIPT_DETECTION_EXECUTOR', 'process')
+SCRIPT_DETECTION_MAX_WORKERS = int(os.getenv('SCRIPT_DETECTION_MAX_WORKERS', '0'))  # 0 = one per video, up to CPU count
+SCRIPT_DETECTION_TIMEOUT = int(os.getenv('SCRIPT_DETECTION_TIMEOUT', '300'))
+# Frames analyzed per second of video (0 = legacy decode of every frame, analyze every 3rd)
+SCRIPT_DETECTION_TARGET_FPS = float(os.getenv('SCRIPT_DETECTION_TARGET_FPS', '5'))
+# Analyzed frames are downscaled to this width before face detection (0 = full resolution)
+SCRIPT_DETECTION_MAX_WIDTH = int(os.getenv('SCRIPT_DETECTION_MAX_WIDTH', '320'))
+# Transcription writes a low-res MJPEG proxy in the same ffmpeg pass; script detection reads it
+ANALYSIS_PROXY_ENABLED = os.getenv('ANALYSIS_PROXY_ENABLED', 'True') == 'True'
+# Normalized rendition written after upload (interviews/media_pipeline.py): H.264/AAC,
+# constant frame rate, faststart MP4 used by transcription, detection and HR playback
+VIDEO_NORMALIZATION_ENABLED = os.getenv('VIDEO_NORMALIZATION_ENABLED', 'True') == 'True'
+VIDEO_NORMALIZE_FPS = int(os.getenv('VIDEO_NORMALIZE_FPS', '30'))
+VIDEO_NORMALIZE_MAX_HEIGHT = int(os.getenv('VIDEO_NORMALIZE_MAX_HEIGHT', '720'))
+VIDEO_NORMALIZE_PRESET = os.getenv('VIDEO_NORMALIZE_PRESET', 'veryfast')
+VIDEO_NORMALIZE_CRF = int(os.getenv('VIDEO_NORMALIZE_CRF', '23'))
+# ONNX/Caffe model files for the yunet and ssd face detectors (see docs/DEV_NOTES.md)
+FACE_DETECTOR_MODEL_DIR = os.getenv('FACE_DETECTOR_MODEL_DIR', str(BASE_DIR / 'models' / 'face_detection'))
+
 
 # ============================
 # EMAIL (SMTP) CONFIGURATION
@@ -263,6 +341,43 @@ DEFAULT_FROM_EMAIL = os.getenv('DEFAULT_FROM_EMAIL', EMAIL_HOST_USER or 'no-repl
 GEMINI_API_KEY = os.getenv('GEMINI_API_KEY', '')
 OPENAI_API_KEY = os.getenv('OPENAI_API_KEY', '')
 DEEPGRAM_API_KEY = os.getenv('DEEPGRAM_API_KEY', '')
+# Pipe ffmpeg audio straight into the Deepgram upload (no temp file, constant memory)
+DEEPGRAM_STREAM_AUDIO = os.getenv('DEEPGRAM_STREAM_AUDIO', 'True') == 'True'
+# Audio encoding used before transcription (see interviews/audio_profiles.py):
+# mp3_legacy | opus_16k | flac_16k | linear16_16k
+TRANSCRIPTION_AUDIO_PROFILE = os.getenv('TRANSCRIPTION_AUDIO_PROFILE', 'flac_16k')
+# Transcripts cached in Redis by video content hash + engine options (retries/reprocessing skip the API)
+TRANSCRIPT_CACHE_ENABLED = os.getenv('TRANSCRIPT_CACHE_ENABLED', 'True') == 'True'
+TRANSCRIPT_CACHE_TTL = int(os.getenv('TRANSCRIPT_CACHE_TTL', str(30 * 24 * 3600)))
+# Gemini responses cached by hash of (model, generation_config, prompt); LRU per process + Redis TTL
+LLM_RESPONSE_CACHE_ENABLED = os.getenv('LLM_RESPONSE_CACHE_ENABLED', 'True') == 'True'
+LLM_RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv('LLM_RESPONSE_CACHE_MAX_ENTRIES', '256'))
+LLM_RESPONSE_CACHE_TTL = int(os.getenv('LLM_RESPONSE_CACHE_TTL', str(24 * 3600)))
+# Concurrent per-transcript Gemini calls (batch fallback, coaching) and their per-call deadline in seconds
+LLM_FANOUT_MAX_CONCURRENCY = int(os.getenv('LLM_FANOUT_MAX_CONCURRENCY', '5'))
+LLM_CALL_TIMEOUT = int(os.getenv('LLM_CALL_TIMEOUT', '60'))
+# Combine analysis requests from interviews finishing together (same role) into one Gemini call
+ANALYSIS_MICROBATCH_ENABLED = os.getenv('ANALYSIS_MICROBATCH_ENABLED', 'false').lower() == 'true'
+ANALYSIS_MICROBATCH_WINDOW = float(os.getenv('ANALYSIS_MICROBATCH_WINDOW', '2.0'))  # seconds the oldest request may wait
+ANALYSIS_MICROBATCH_MAX_INTERVIEWS = int(os.getenv('ANALYSIS_MICROBATCH_MAX_INTERVIEWS', '8'))
+ANALYSIS_MICROBATCH_MAX_ITEMS = int(os.getenv('ANALYSIS_MICROBATCH_MAX_ITEMS', '40'))  # transcripts per combined request
+ANALYSIS_MICROBATCH_POLL_INTERVAL = float(os.getenv('ANALYSIS_MICROBATCH_POLL_INTERVAL', '0.2'))  # shortest re-check while another worker flushes
+# A queued interview holds its worker slot until a result arrives: at most WINDOW + 2 * LLM_CALL_TIMEOUT
+# (about 122s by default), plus one more 2 * LLM_CALL_TIMEOUT if a leader takes its job just as that
+# runs out; then it falls back to its own request. Task time limits must allow for this.
+# Fleet-wide token buckets for outbound AI calls (see common/rate_limit.py); 0 disables a bucket
+RATE_LIMIT_ENABLED = os.getenv('RATE_LIMIT_ENABLED', 'true').lower() == 'true'
+RATE_LIMIT_MAX_WAIT = int(os.getenv('RATE_LIMIT_MAX_WAIT', '120'))  # seconds before sending anyway
+RATE_LIMITS = {
+    'gemini': {
+        'requests_per_minute': int(os.getenv('GEMINI_REQUESTS_PER_MINUTE', '1000')),
+        'tokens_per_minute': int(os.getenv('GEMINI_TOKENS_PER_MINUTE', '1000000')),
+    },
+    'deepgram': {
+        'requests_per_minute': int(os.getenv('DEEPGRAM_REQUESTS_PER_MINUTE', '100')),
+        'tokens_per_minute': 0,  # Deepgram bills audio time, not tokens
+    },
+}
 
 
 # ============================
@@ -285,6 +400,33 @@ LOG_HR_AUTH = False
 # Training uploads
 TRAINING_MAX_UPLOAD_SIZE = int(os.getenv("TRAINING_MAX_UPLOAD_SIZE", str(25 * 1024 * 1024)))
 
+# Resumable chunked video uploads (interviews/uploads.py)
+VIDEO_UPLOAD_MAX_SIZE = int(os.getenv("VIDEO_UPLOAD_MAX_SIZE", str(500 * 1024 * 1024)))
+UPLOAD_CHUNK_SIZE = int(os.getenv("UPLOAD_CHUNK_SIZE", str(5 * 1024 * 1024)))  # suggested to clients
+UPLOAD_MAX_CHUNK_SIZE = int(os.getenv("UPLOAD_MAX_CHUNK_SIZE", str(16 * 1024 * 1024)))
+UPLOAD_STREAM_BLOCK_SIZE = 64 * 1024
+UPLOAD_CHUNK_LEASE_SECONDS = int(os.getenv("UPLOAD_CHUNK_LEASE_SECONDS", "300"))  # reclaimable after a worker dies mid-chunk
+UPLOAD_SESSION_TTL_HOURS = int(os.getenv("UPLOAD_SESSION_TTL_HOURS", "24"))
+
+# Video storage: 'local' (MEDIA_ROOT) or 's3' (any S3-compatible bucket, e.g. MinIO;
+# browsers upload with presigned URLs, see common/object_storage.py). 's3' needs boto3.
+VIDEO_STORAGE_BACKEND = os.getenv("VIDEO_STORAGE_BACKEND", "local")
+OBJECT_STORAGE_ENDPOINT_URL = os.getenv("OBJECT_STORAGE_ENDPOINT_URL", "")  # empty for AWS
+OBJECT_STORAGE_BUCKET = os.getenv("OBJECT_STORAGE_BUCKET", "interview-videos")
+OBJECT_STORAGE_ACCESS_KEY = os.getenv("OBJECT_STORAGE_ACCESS_KEY", "")
+OBJECT_STORAGE_SECRET_KEY = os.getenv("OBJECT_STORAGE_SECRET_KEY", "")
+OBJECT_STORAGE_REGION = os.getenv("OBJECT_STORAGE_REGION", "us-east-1")
+OBJECT_STORAGE_URL_EXPIRY = int(os.getenv("OBJECT_STORAGE_URL_EXPIRY", "3600"))
+VIDEO_DOWNLOAD_DIR = os.getenv("VIDEO_DOWNLOAD_DIR", "")  # worker temp copies; empty for the system temp dir
+
+# HR review playback (interviews/streaming.py). Offload lets the web server send the bytes:
+# '' (Django streams), 'x-accel-redirect' (nginx internal location at VIDEO_STREAM_ACCEL_PREFIX
+# aliased to MEDIA_ROOT) or 'x-sendfile' (Apache mod_xsendfile)
+VIDEO_STREAM_OFFLOAD = os.getenv("VIDEO_STREAM_OFFLOAD", "")
+VIDEO_STREAM_ACCEL_PREFIX = os.getenv("VIDEO_STREAM_ACCEL_PREFIX", "/protected-media/")
+VIDEO_STREAM_TOKEN_MAX_AGE = int(os.getenv("VIDEO_STREAM_TOKEN_MAX_AGE", str(4 * 3600)))  # signed playback links
+VIDEO_STREAM_MAX_AGE = int(os.getenv("VIDEO_STREAM_MAX_AGE", "3600"))  # browser cache, then revalidate
+
 
 # ============================
 # MEDIA FILES (for video uploads, documents)
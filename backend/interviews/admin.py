@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Interview, InterviewQuestion, VideoResponse, AIAnalysis, JobPosition
+from .models import Interview, InterviewQuestion, VideoResponse, UploadSession, AIAnalysis, JobPosition
 from .type_models import PositionType, QuestionType
 
 
@@ -86,11 +86,18 @@ class InterviewAdmin(admin.ModelAdmin):
 
 @admin.register(VideoResponse)
 class VideoResponseAdmin(admin.ModelAdmin):
-    list_display = ['interview', 'question', 'duration', 'processed', 'uploaded_at']
-    list_filter = ['processed', 'uploaded_at']
+    list_display = ['interview', 'question', 'duration', 'processed', 'normalization_status', 'uploaded_at']
+    list_filter = ['processed', 'normalization_status', 'uploaded_at']
     search_fields = ['interview__applicant__first_name', 'interview__applicant__last_name']
 
 
+@admin.register(UploadSession)
+class UploadSessionAdmin(admin.ModelAdmin):
+    list_display = ['id', 'interview', 'question', 'status', 'received_bytes', 'total_size', 'updated_at']
+    list_filter = ['status', 'created_at']
+    readonly_fields = ['created_at', 'updated_at']
+
+
 @admin.register(AIAnalysis)
 class AIAnalysisAdmin(admin.ModelAdmin):
     list_display = ['video_response', 'overall_score', 'recommendation', 'analyzed_at']
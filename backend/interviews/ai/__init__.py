@@ -3,5 +3,6 @@ AI-powered detection modules for video interview analysis
 """
 
 from .script_detection import detect_script_reading
+from .detection_pool import ScriptDetectionBatch, start_script_detection
 
-__all__ = ['detect_script_reading']
+__all__ = ['detect_script_reading', 'ScriptDetectionBatch', 'start_script_detection']
@@ -0,0 +1,152 @@
+"""
+Concurrent script reading detection
+
+Each detect_script_reading call decodes a whole video on a single core, so
+running them one after another dominated bulk interview processing. A
+ScriptDetectionBatch submits every video of an interview to a worker pool up
+front; the caller does other work (the Gemini batch analysis) and then joins
+the results before writing to the database.
+"""
+
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait
+
+from celery.exceptions import SoftTimeLimitExceeded
+from django.conf import settings
+
+from .face_detectors import get_configured_backend
+from .script_detection import detect_script_reading
+
+logger = logging.getLogger(__name__)
+
+EXECUTOR_PROCESS = 'process'
+EXECUTOR_THREAD = 'thread'
+EXECUTOR_INLINE = 'inline'
+
+
+def _failed_result(error):
+    """Result used when detection crashes or times out (matches the old inline fallback)"""
+    return {'status': 'clear', 'risk_score': 0, 'data': {'error': str(error)}}
+
+
+class ScriptDetectionBatch:
+    """
+    Script reading detection for a set of videos, running in the background
+
+    Args:
+        video_paths: dict of {video_response_id: video file path}
+        executor: 'process' | 'thread' | 'inline' (default: SCRIPT_DETECTION_EXECUTOR)
+        max_workers: pool size (default: SCRIPT_DETECTION_MAX_WORKERS, else one per video up to CPU count)
+    """
+
+    def __init__(self, video_paths, executor=None, max_workers=None):
+        self.video_paths = dict(video_paths)
+        self.executor_kind = executor or getattr(settings, 'SCRIPT_DETECTION_EXECUTOR', EXECUTOR_PROCESS)
+        configured_workers = max_workers or getattr(settings, 'SCRIPT_DETECTION_MAX_WORKERS', 0)
+        self.max_workers = max(1, configured_workers or min(len(self.video_paths), os.cpu_count() or 1))
+        # Resolved here so spawned children never need Django settings or the database
+        self.detection_kwargs = {
+            'target_fps': getattr(settings, 'SCRIPT_DETECTION_TARGET_FPS', None),
+            'max_width': getattr(settings, 'SCRIPT_DETECTION_MAX_WIDTH', None),
+            'detector': get_configured_backend(),
+        }
+        self._executor = None
+        self._futures = {}
+        self._start()
+
+    def _start(self):
+        if not self.video_paths or self.executor_kind == EXECUTOR_INLINE:
+            return
+
+        if self.executor_kind == EXECUTOR_PROCESS:
+            try:
+                # spawn keeps the children clear of the parent's DB connections and gRPC threads
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context('spawn'),
+                )
+                self._submit_all()
+                return
+            except (AssertionError, OSError, RuntimeError) as e:
+                # e.g. "daemonic processes are not allowed to have children" inside some worker pools
+                logger.warning(f"Process pool unavailable for script detection ({e}); falling back to threads")
+                self._shutdown()
+                self._futures = {}
+
+        # OpenCV releases the GIL while decoding, so threads still overlap well
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='script-detect')
+        self._submit_all()
+
+    def _submit_all(self):
+        for video_id, path in self.video_paths.items():
+            self._futures[video_id] = self._executor.submit(detect_script_reading, path, **self.detection_kwargs)
+
+    def results(self, timeout=None):
+        """
+        Wait for every video and return {video_response_id: detection result}
+
+        The timeout is one deadline for the whole batch. Videos that crash or
+        are still running when it passes get a 'clear' result carrying the
+        error; pool processes still working on them are terminated.
+        """
+        timeout = timeout if timeout is not None else getattr(settings, 'SCRIPT_DETECTION_TIMEOUT', None)
+        results = {}
+        try:
+            if self.executor_kind == EXECUTOR_INLINE or self._executor is None:
+                for video_id, path in self.video_paths.items():
+                    results[video_id] = self._run_inline(video_id, path)
+                return results
+
+            _, not_done = wait(self._futures.values(), timeout=timeout or None)
+            for video_id, future in self._futures.items():
+                if future in not_done:
+                    logger.error(f"Script detection timed out for video {video_id}")
+                    results[video_id] = _failed_result('Script detection timed out')
+                    continue
+                try:
+                    results[video_id] = future.result()
+                except Exception as e:
+                    logger.error(f"Script detection failed for video {video_id}: {e}")
+                    results[video_id] = _failed_result(e)
+            if not_done:
+                self._terminate()
+            return results
+        finally:
+            self._shutdown()
+
+    def _run_inline(self, video_id, path):
+        try:
+            return detect_script_reading(path, **self.detection_kwargs)
+        except SoftTimeLimitExceeded:
+            # Raised by the Celery task's soft_time_limit when running inline
+            logger.error(f"Script detection timed out for video {video_id}")
+            return _failed_result('Script detection timed out')
+        except Exception as e:
+            logger.error(f"Script detection failed for video {video_id}: {e}")
+            return _failed_result(e)
+
+    def cancel(self):
+        """Abandon the batch without waiting for pending videos"""
+        self._terminate()
+        self._shutdown()
+
+    def _terminate(self):
+        """Stop pool processes still decoding; threads cannot be stopped and finish in the background"""
+        if not isinstance(self._executor, ProcessPoolExecutor):
+            return
+        # ProcessPoolExecutor has no public way to stop running work before Python 3.14
+        for process in list((self._executor._processes or {}).values()):
+            if process.is_alive():
+                process.terminate()
+
+    def _shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+def start_script_detection(video_paths, **kwargs):
+    """Start detection for {video_response_id: path} and return the running batch"""
+    return ScriptDetectionBatch(video_paths, **kwargs)
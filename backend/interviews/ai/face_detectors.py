@@ -0,0 +1,180 @@
+"""
+Face detection backends for script reading detection
+
+All backends take a BGR frame and return face boxes as (x, y, w, h):
+- haar:  OpenCV Haar cascade (built in, no model files, noisy on webcams)
+- yunet: OpenCV FaceDetectorYN with the YuNet ONNX model
+- ssd:   OpenCV DNN ResNet-10 SSD (Caffe)
+
+DNN model files are not bundled; download them into FACE_DETECTOR_MODEL_DIR
+(see docs/DEV_NOTES.md). The active backend is chosen in SystemSettings and
+compared with `manage.py benchmark_face_detectors`.
+"""
+
+import logging
+import os
+import threading
+from abc import ABC, abstractmethod
+
+import cv2
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BACKEND = 'haar'
+YUNET_MODEL = 'face_detection_yunet_2023mar.onnx'
+SSD_PROTOTXT = 'deploy.prototxt'
+SSD_MODEL = 'res10_300x300_ssd_iter_140000.caffemodel'
+
+# Loaded detectors by backend name, one per process so the instance loaded at
+# worker_process_init is reused; RLock because a failed load falls back to Haar
+_detectors = {}
+_detectors_lock = threading.RLock()
+
+
+def _model_dir():
+    try:
+        from django.conf import settings
+        return str(getattr(settings, 'FACE_DETECTOR_MODEL_DIR', ''))
+    except Exception:
+        return os.getenv('FACE_DETECTOR_MODEL_DIR', '')
+
+
+def _model_path(filename, model_dir=None):
+    path = os.path.join(model_dir or _model_dir(), filename)
+    if not os.path.exists(path):
+        raise RuntimeError(f"Face detector model not found: {path}")
+    return path
+
+
+class FaceDetector(ABC):
+    """
+    Common interface: detect(frame) -> list of (x, y, w, h)
+
+    One instance is shared by every thread of a process; OpenCV detectors are
+    not thread-safe, so callers hold `lock` around detect().
+    """
+
+    name = ''
+
+    def __init__(self, model_dir=None):
+        self.lock = threading.Lock()
+
+    @abstractmethod
+    def detect(self, frame, min_size=30):
+        """Face boxes in a BGR frame, ignoring faces smaller than min_size pixels"""
+
+
+class HaarFaceDetector(FaceDetector):
+    name = 'haar'
+
+    def __init__(self, model_dir=None):
+        super().__init__(model_dir)
+        from .script_detection import FACE_CASCADE, get_cascade
+        self.cascade = get_cascade(FACE_CASCADE)
+
+    def detect(self, frame, min_size=30):
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        faces = self.cascade.detectMultiScale(
+            gray,
+            scaleFactor=1.1,
+            minNeighbors=5,
+            minSize=(min_size, min_size)
+        )
+        return [tuple(int(v) for v in face) for face in faces]
+
+
+class YuNetFaceDetector(FaceDetector):
+    name = 'yunet'
+    score_threshold = 0.7
+
+    def __init__(self, model_dir=None):
+        super().__init__(model_dir)
+        self.model = cv2.FaceDetectorYN.create(
+            _model_path(YUNET_MODEL, model_dir), '', (320, 320), self.score_threshold
+        )
+        self._input_size = (320, 320)
+
+    def detect(self, frame, min_size=30):
+        height, width = frame.shape[:2]
+        if self._input_size != (width, height):
+            self.model.setInputSize((width, height))
+            self._input_size = (width, height)
+        _, faces = self.model.detect(frame)
+        if faces is None:
+            return []
+        return [tuple(int(v) for v in face[:4]) for face in faces]
+
+
+class SSDFaceDetector(FaceDetector):
+    name = 'ssd'
+    confidence_threshold = 0.5
+
+    def __init__(self, model_dir=None):
+        super().__init__(model_dir)
+        self.net = cv2.dnn.readNetFromCaffe(
+            _model_path(SSD_PROTOTXT, model_dir), _model_path(SSD_MODEL, model_dir)
+        )
+        self.net.setPreferableBackend(cv2.dnn.DNN_BACKEND_OPENCV)
+        self.net.setPreferableTarget(cv2.dnn.DNN_TARGET_CPU)
+
+    def detect(self, frame, min_size=30):
+        height, width = frame.shape[:2]
+        blob = cv2.dnn.blobFromImage(frame, 1.0, (300, 300), (104.0, 177.0, 123.0))
+        self.net.setInput(blob)
+        detections = self.net.forward()[0, 0]
+        faces = []
+        for detection in detections:
+            if detection[2] < self.confidence_threshold:
+                continue
+            x1, y1, x2, y2 = (detection[3:7] * np.array([width, height, width, height])).astype(int)
+            x1, y1 = max(0, x1), max(0, y1)
+            if x2 > x1 and y2 > y1:
+                faces.append((int(x1), int(y1), int(x2 - x1), int(y2 - y1)))
+        return faces
+
+
+FACE_DETECTORS = {
+    HaarFaceDetector.name: HaarFaceDetector,
+    YuNetFaceDetector.name: YuNetFaceDetector,
+    SSDFaceDetector.name: SSDFaceDetector,
+}
+
+
+def get_face_detector(name=None, model_dir=None):
+    """
+    Return the process's detector for a backend, loading it on first use
+
+    Falls back to Haar when a DNN backend's model files are missing, so a
+    misconfigured deployment still produces script detection results.
+    """
+    name = name or DEFAULT_BACKEND
+    if name not in FACE_DETECTORS:
+        raise ValueError(f"Unknown face detector '{name}'. Choose one of: {', '.join(sorted(FACE_DETECTORS))}")
+
+    with _detectors_lock:
+        detector = _detectors.get(name)
+        if detector is None:
+            try:
+                detector = FACE_DETECTORS[name](model_dir)
+            except Exception as e:
+                if name == DEFAULT_BACKEND:
+                    raise
+                logger.error(f"Could not load '{name}' face detector ({e}); using {DEFAULT_BACKEND}")
+                detector = get_face_detector(DEFAULT_BACKEND)
+            _detectors[name] = detector
+        return detector
+
+
+def get_configured_backend():
+    """Backend selected in SystemSettings (Haar if settings are unavailable)"""
+    try:
+        from results.models import SystemSettings
+        return SystemSettings.get_settings().face_detector_backend or DEFAULT_BACKEND
+    except Exception:
+        return DEFAULT_BACKEND
+
+
+def warm_up_face_detector():
+    """Load the configured detector ahead of the first video (Celery worker_process_init)"""
+    get_face_detector(get_configured_backend())
@@ -6,16 +6,81 @@ Detects if applicant is reading from another screen or paper
 import cv2
 import numpy as np
 import logging
+import threading
+
+from .face_detectors import get_configured_backend, get_face_detector
 
 logger = logging.getLogger(__name__)
 
+FACE_CASCADE = 'haarcascade_frontalface_default.xml'
+
+# Loaded classifiers, shared by every thread of the process so the copy loaded
+# at worker_process_init is reused; the lock keeps threads from parsing twice
+_cascades = {}
+_cascades_lock = threading.Lock()
+
+# Sampling defaults; overridden by SCRIPT_DETECTION_TARGET_FPS / SCRIPT_DETECTION_MAX_WIDTH
+DEFAULT_TARGET_FPS = 5
+DEFAULT_MAX_WIDTH = 320
+# Scanning-per-minute thresholds were tuned when every 3rd frame was analyzed
+REFERENCE_FRAME_SKIP = 3
+# WebM from MediaRecorder often reports 0 or 1000 FPS
+FALLBACK_FPS = 30.0
+# Minimum face size in pixels at REFERENCE_WIDTH; narrower frames scale it down to MIN_FACE_FLOOR
+MIN_FACE = 30
+MIN_FACE_FLOOR = 20
+REFERENCE_WIDTH = 640
+
+
+def get_cascade(name=FACE_CASCADE):
+    """Return the process's CascadeClassifier, parsing the XML only on first use"""
+    with _cascades_lock:
+        classifier = _cascades.get(name)
+        if classifier is None:
+            classifier = cv2.CascadeClassifier(cv2.data.haarcascades + name)
+            if classifier.empty():
+                raise RuntimeError(f"Could not load cascade classifier: {name}")
+            _cascades[name] = classifier
+        return classifier
 
-def detect_script_reading(video_path):
+
+def _min_face_for(width):
+    """Minimum face size for a frame `width` pixels wide"""
+    return max(MIN_FACE_FLOOR, int(MIN_FACE * min(1.0, width / REFERENCE_WIDTH)))
+
+
+def _sampling_defaults():
+    """Target FPS and max width from Django settings, if configured"""
+    try:
+        from django.conf import settings
+        return (
+            getattr(settings, 'SCRIPT_DETECTION_TARGET_FPS', DEFAULT_TARGET_FPS),
+            getattr(settings, 'SCRIPT_DETECTION_MAX_WIDTH', DEFAULT_MAX_WIDTH),
+        )
+    except Exception:
+        return DEFAULT_TARGET_FPS, DEFAULT_MAX_WIDTH
+
+
+def _frame_skip_for(fps, target_fps):
+    """Analyze every Nth frame so roughly target_fps frames per second are analyzed"""
+    if not target_fps:
+        return REFERENCE_FRAME_SKIP
+    return max(1, int(round(fps / target_fps)))
+
+
+def detect_script_reading(video_path, target_fps=None, max_width=None, detector=None):
     """
     Analyze video for script reading patterns using OpenCV face detection
     
+    Skipped frames are only grabbed (demuxed), never decoded, and analyzed
+    frames are downscaled to max_width before face detection.
+    
     Args:
         video_path: Path to video file
+        target_fps: Frames analyzed per second of video (0 = legacy path: every
+            frame decoded, every 3rd analyzed at full resolution, reported FPS as is)
+        max_width: Downscale sampled frames to this width (0 = full resolution)
+        detector: Face detection backend, 'haar' | 'yunet' | 'ssd' (default: SystemSettings)
         
     Returns:
         dict: {
@@ -27,9 +92,8 @@ def detect_script_reading(video_path):
     try:
         logger.info(f"Starting script reading detection for: {video_path}")
         
-        # Initialize face and eye cascade classifiers (built into OpenCV)
-        face_cascade = cv2.CascadeClassifier(cv2.data.haarcascades + 'haarcascade_frontalface_default.xml')
-        eye_cascade = cv2.CascadeClassifier(cv2.data.haarcascades + 'haarcascade_eye.xml')
+        # Face detector, loaded once per worker
+        face_detector = get_face_detector(detector or get_configured_backend())
         
         # Open video
         video = cv2.VideoCapture(video_path)
@@ -37,8 +101,18 @@ def detect_script_reading(video_path):
             logger.error(f"Could not open video: {video_path}")
             return _default_result("error", "Could not open video file")
         
+        if target_fps is None or max_width is None:
+            default_fps, default_width = _sampling_defaults()
+            target_fps = default_fps if target_fps is None else target_fps
+            max_width = default_width if max_width is None else max_width
+        
+        # target_fps=0 keeps the original decode-everything path, unchanged, for comparison
+        decode_all = not target_fps
+        
         # Get video properties
         fps = video.get(cv2.CAP_PROP_FPS)
+        if not decode_all and (not fps or fps <= 0 or fps > 240):
+            fps = FALLBACK_FPS
         total_frames = int(video.get(cv2.CAP_PROP_FRAME_COUNT))
         
         logger.info(f"Video properties: {total_frames} frames at {fps} FPS")
@@ -60,13 +134,17 @@ def detect_script_reading(video_path):
         previous_horizontal_zone = None
         previous_vertical_zone = None
         
-        # Sample every 3rd frame for performance (still ~10 FPS analysis)
-        frame_skip = 3
+        # Sample ~target_fps frames per second; grab() demuxes without decoding
+        frame_skip = _frame_skip_for(fps, target_fps)
         frame_count = 0
+        min_face = MIN_FACE
         
         while video.isOpened():
-            ret, frame = video.read()
-            if not ret:
+            if decode_all:
+                ret, frame = video.read()
+                if not ret:
+                    break
+            elif not video.grab():
                 break
             
             frame_count += 1
@@ -75,18 +153,24 @@ def detect_script_reading(video_path):
             if frame_count % frame_skip != 0:
                 continue
             
+            if not decode_all:
+                ret, frame = video.retrieve()
+                if not ret:
+                    break
+            
             processed_frames += 1
             
-            # Convert to grayscale for detection
-            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+            # Downscale before the cascade; zones below are relative to frame size
+            if not decode_all and max_width and frame.shape[1] > max_width:
+                scale = max_width / frame.shape[1]
+                frame = cv2.resize(frame, (max_width, int(frame.shape[0] * scale)), interpolation=cv2.INTER_AREA)
+            if not decode_all:
+                # From the analyzed width, so a small proxy and a downscaled original agree
+                min_face = _min_face_for(frame.shape[1])
             
             # Detect faces
-            faces = face_cascade.detectMultiScale(
-                gray,
-                scaleFactor=1.1,
-                minNeighbors=5,
-                minSize=(30, 30)
-            )
+            with face_detector.lock:
+                faces = face_detector.detect(frame, min_size=min_face)
             
             if len(faces) == 0:
                 # No face detected - might be looking away
@@ -198,7 +282,8 @@ def detect_script_reading(video_path):
             flags.append(f"Frequent gaze to {primary_direction} ({max_direction_percent:.1f}%)")
         
         # Factor 3: Horizontal scanning (20% weight)
-        scanning_frequency = horizontal_movements / (processed_frames / fps) * 60  # per minute
+        # Normalized to the every-3rd-frame rate the thresholds were tuned on
+        scanning_frequency = horizontal_movements / (processed_frames * frame_skip / REFERENCE_FRAME_SKIP / fps) * 60  # per minute
         if scanning_frequency > 15:
             risk_score += 20
             flags.append(f"High horizontal scanning ({int(scanning_frequency)}/min - reading pattern)")
@@ -237,6 +322,7 @@ def detect_script_reading(video_path):
                 'vertical_scanning_count': vertical_movements,
                 'primary_off_camera_direction': primary_direction,
                 'confidence': _calculate_confidence(face_detected_frames, processed_frames),
+                'frames_analyzed': processed_frames,
                 'flags': flags
             }
         }
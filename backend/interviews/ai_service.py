@@ -8,6 +8,106 @@ import json
 from typing import Dict, Any
 import google.generativeai as genai
 from django.conf import settings
+from common import rate_limit
+from interviews.llm_cache import get_response_cache
+from interviews.llm_fanout import bounded_map
+
+
+ANALYSIS_SCORE_FIELDS = [
+    'sentiment_score',
+    'confidence_score',
+    'speech_clarity_score',
+    'content_relevance_score',
+    'overall_score',
+]
+RECOMMENDATIONS = {'pass', 'review', 'fail'}
+# Rough token cost reserved for an uploaded audio/video part (about 4 minutes of audio)
+MEDIA_TOKEN_ESTIMATE = 8000
+
+
+def _validate_batch_item(item) -> Dict[str, Any] | None:
+    """
+    Normalize one element of a batch response, or return None if unusable
+    
+    Scores must be numeric (clamped to 0-100) and the recommendation one of
+    pass/review/fail; anything else is re-requested individually.
+    """
+    if not isinstance(item, dict):
+        return None
+    analysis = dict(item)
+    for field in ANALYSIS_SCORE_FIELDS:
+        try:
+            analysis[field] = max(0, min(100, int(round(float(item[field])))))
+        except (KeyError, TypeError, ValueError):
+            return None
+    recommendation = str(item.get('recommendation', '')).strip().lower()
+    if recommendation not in RECOMMENDATIONS:
+        return None
+    analysis['recommendation'] = recommendation
+    analysis.setdefault('analysis_summary', '')
+    return analysis
+
+
+def _match_batch_items(items, tags: list) -> tuple:
+    """
+    Assign validated batch response items to their transcripts
+    
+    Items are matched by their video_id tag. Untagged items are only trusted
+    by position when the array has the expected length.
+    
+    Returns (analyses, missing): analyses in tag order with None for gaps,
+    and the indexes that still need analysis.
+    """
+    if isinstance(items, dict):
+        # Tolerate {"results": [...]} wrappers and single-object replies
+        items = next((value for value in items.values() if isinstance(value, list)), [items])
+    if not isinstance(items, list):
+        items = []
+    
+    analyses = [None] * len(tags)
+    index_by_tag = {tag: i for i, tag in enumerate(tags)}
+    untagged = []
+    for position, item in enumerate(items):
+        analysis = _validate_batch_item(item)
+        if analysis is None:
+            continue
+        tag = item.get('video_id')
+        if tag is None:
+            untagged.append((position, analysis))
+        elif str(tag) in index_by_tag and analyses[index_by_tag[str(tag)]] is None:
+            analyses[index_by_tag[str(tag)]] = analysis
+    
+    if len(items) == len(tags):
+        for position, analysis in untagged:
+            if analyses[position] is None:
+                analyses[position] = analysis
+    
+    missing = [i for i, analysis in enumerate(analyses) if analysis is None]
+    return analyses, missing
+
+
+def _usage_shares(interview_id, interview_ids, count: int) -> list:
+    """(interview_id, fraction of the tokens) pairs to log for one batch request"""
+    if not interview_ids:
+        return [(interview_id, 1.0)]
+    shares = {}
+    for owner in interview_ids:
+        shares[owner] = shares.get(owner, 0) + 1 / count
+    return list(shares.items())
+
+
+def _failed_analysis(error) -> Dict[str, Any]:
+    """Neutral 'review' scores used when Gemini analysis fails or times out"""
+    return {
+        'sentiment_score': 50.0,
+        'confidence_score': 50.0,
+        'speech_clarity_score': 50.0,
+        'content_relevance_score': 50.0,
+        'overall_score': 50.0,
+        'recommendation': 'review',
+        'analysis_summary': f'Analysis failed: {str(error)}',
+        'error': str(error)
+    }
 
 
 class AIAnalysisService:
@@ -21,12 +121,24 @@ class AIAnalysisService:
         
         genai.configure(api_key=api_key)
         # Using stable Gemini 2.5 Flash model
-        self.model = genai.GenerativeModel('gemini-2.5-flash')
+        self.model_name = 'gemini-2.5-flash'
+        self.model = genai.GenerativeModel(self.model_name)
+        self.response_cache = get_response_cache()
+    
+    def _generate_content(self, contents, generation_config=None):
+        """Call Gemini after reserving capacity in the shared rate limiter"""
+        parts = contents if isinstance(contents, list) else [contents]
+        # Same estimate as _log_token_usage: 1 token ≈ 4 characters
+        estimated_tokens = sum(
+            len(part) // 4 if isinstance(part, str) else MEDIA_TOKEN_ESTIMATE for part in parts
+        )
+        rate_limit.acquire('gemini', tokens=estimated_tokens)
+        return self.model.generate_content(contents, generation_config=generation_config)
     
     def _log_token_usage(self, operation_type, prompt, response_text, response_time, 
                         interview_id=None, video_response_id=None, response_obj=None, 
-                        success=True, error=""):
-        """Log token usage to monitoring system"""
+                        success=True, error="", share=1.0):
+        """Log token usage to monitoring system (`share` of the request's tokens, for combined batches)"""
         try:
             from monitoring.models import TokenUsage
             
@@ -47,8 +159,8 @@ class AIAnalysisService:
                 operation_type=operation_type,
                 interview_id=interview_id,
                 video_response_id=video_response_id,
-                input_tokens=input_tokens,
-                output_tokens=output_tokens,
+                input_tokens=round(input_tokens * share),
+                output_tokens=round(output_tokens * share),
                 model_name='gemini-2.5-flash',
                 api_response_time=response_time,
                 prompt_length=len(prompt),
@@ -203,35 +315,30 @@ Do NOT include explanations outside JSON.
         import time
         start_time = time.time()
         
+        generation_config = {
+            'temperature': 0.3,  # Lower temperature for more consistent scoring
+            'response_mime_type': 'application/json'
+        }
+        
         try:
-            # Generate content with Gemini
-            response = self.model.generate_content(
-                prompt,
-                generation_config={
-                    'temperature': 0.3,  # Lower temperature for more consistent scoring
-                    'response_mime_type': 'application/json'
-                }
-            )
+            # Identical prompts (retries, recalculations) reuse the cached response
+            cache_key, response_text = self.response_cache.lookup(self.model_name, generation_config, prompt)
+            response = None
+            if response_text is None:
+                # Generate content with Gemini
+                response = self._generate_content(prompt, generation_config=generation_config)
+                response_text = response.text
             
             # Parse the JSON response
-            analysis = json.loads(response.text)
+            analysis = json.loads(response_text)
             
             # Validate required fields
-            required_fields = ['sentiment_score', 'confidence_score', 'speech_clarity_score', 
-                             'content_relevance_score', 'overall_score', 'recommendation']
-            for field in required_fields:
+            for field in ANALYSIS_SCORE_FIELDS + ['recommendation']:
                 if field not in analysis:
                     raise ValueError(f"Missing required field: {field}")
 
             # Clamp numeric scores to integers in [0, 100]
-            score_fields = [
-                'sentiment_score',
-                'confidence_score',
-                'speech_clarity_score',
-                'content_relevance_score',
-                'overall_score',
-            ]
-            for field in score_fields:
+            for field in ANALYSIS_SCORE_FIELDS:
                 raw_value = analysis.get(field)
                 try:
                     normalized = int(round(float(raw_value)))
@@ -239,16 +346,18 @@ Do NOT include explanations outside JSON.
                     normalized = 0
                 analysis[field] = max(0, min(100, normalized))
             
-            # Log token usage
-            response_time = time.time() - start_time
-            self._log_token_usage(
-                operation_type='analysis',
-                prompt=prompt,
-                response_text=response.text,
-                response_time=response_time,
-                success=True,
-                response_obj=response
-            )
+            # Log token usage (cache hits cost nothing)
+            if response is not None:
+                response_time = time.time() - start_time
+                self._log_token_usage(
+                    operation_type='analysis',
+                    prompt=prompt,
+                    response_text=response_text,
+                    response_time=response_time,
+                    success=True,
+                    response_obj=response
+                )
+                self.response_cache.store(cache_key, response_text)
             
             return analysis
             
@@ -265,16 +374,7 @@ Do NOT include explanations outside JSON.
             )
             
             # Return default low scores if analysis fails
-            return {
-                'sentiment_score': 50.0,
-                'confidence_score': 50.0,
-                'speech_clarity_score': 50.0,
-                'content_relevance_score': 50.0,
-                'overall_score': 50.0,
-                'recommendation': 'review',
-                'analysis_summary': f'Analysis failed: {str(e)}',
-                'error': str(e)
-            }
+            return _failed_analysis(e)
     
     def transcribe_video(self, video_file_path: str, video_response_id: int = None) -> str:
         """
@@ -289,18 +389,32 @@ Do NOT include explanations outside JSON.
             Transcribed text
         """
         import time
+        from interviews.audio_profiles import get_audio_profile
+        from interviews.transcript_cache import get_cached_transcript, store_transcript
         start_time = time.time()
         
+        # Unchanged file + same model: reuse the earlier transcript
+        cache_key, cached = get_cached_transcript(
+            video_file_path, 'gemini', {'model': self.model_name, 'audio_profile': get_audio_profile().name}
+        )
+        if cached is not None:
+            print(f"♻️ Transcript cache hit for video {video_response_id}")
+            return cached
+        
         # Try direct video upload first
         try:
-            return self._transcribe_video_direct(video_file_path, video_response_id, start_time)
+            transcript = self._transcribe_video_direct(video_file_path, video_response_id, start_time)
+            store_transcript(cache_key, transcript)
+            return transcript
         except Exception as video_error:
             print(f"⚠️ Direct video transcription failed: {video_error}")
             print(f"🔄 Attempting audio extraction fallback...")
             
             # Fallback: Extract audio and transcribe
             try:
-                return self._transcribe_audio_extracted(video_file_path, video_response_id, start_time)
+                transcript = self._transcribe_audio_extracted(video_file_path, video_response_id, start_time)
+                store_transcript(cache_key, transcript)
+                return transcript
             except Exception as audio_error:
                 print(f"❌ Audio extraction also failed: {audio_error}")
                 # Final fallback: return a message indicating no audio
@@ -352,7 +466,7 @@ Do NOT include explanations outside JSON.
         print(f"🎯 Generating transcription...")
         prompt = "Transcribe the spoken content from this video. Return only the transcribed text."
         
-        response = self.model.generate_content(
+        response = self._generate_content(
             [prompt, video_file],
             generation_config={'temperature': 0.1}
         )
@@ -381,19 +495,30 @@ Do NOT include explanations outside JSON.
         import time
         import os
         import tempfile
+        from interviews.audio_profiles import get_audio_profile
+        
+        profile = get_audio_profile()
         
         # Try moviepy first
         audio_path = None
         try:
-            print(f"🎵 Attempting audio extraction with moviepy...")
+            print(f"🎵 Attempting audio extraction with moviepy ({profile.name})...")
             from moviepy.editor import VideoFileClip
             
             # Extract audio to temporary file
-            with tempfile.NamedTemporaryFile(suffix='.mp3', delete=False) as temp_audio:
+            with tempfile.NamedTemporaryFile(suffix=profile.suffix, delete=False) as temp_audio:
                 audio_path = temp_audio.name
             
             video = VideoFileClip(video_file_path)
-            video.audio.write_audiofile(audio_path, logger=None, verbose=False)
+            video.audio.write_audiofile(
+                audio_path,
+                fps=profile.sample_rate,
+                codec=profile.codec,
+                bitrate=profile.bitrate,
+                ffmpeg_params=['-ac', str(profile.channels)],
+                logger=None,
+                verbose=False,
+            )
             video.close()
             
             print(f"✓ Audio extracted with moviepy: {audio_path}")
@@ -403,12 +528,12 @@ Do NOT include explanations outside JSON.
             try:
                 import ffmpeg
                 
-                with tempfile.NamedTemporaryFile(suffix='.mp3', delete=False) as temp_audio:
+                with tempfile.NamedTemporaryFile(suffix=profile.suffix, delete=False) as temp_audio:
                     audio_path = temp_audio.name
                 
                 # Extract audio using ffmpeg
                 stream = ffmpeg.input(video_file_path)
-                stream = ffmpeg.output(stream, audio_path, acodec='libmp3lame', ar='44100', ac=2)
+                stream = ffmpeg.output(stream, audio_path, **profile.ffmpeg_output_kwargs())
                 ffmpeg.run(stream, capture_stdout=True, capture_stderr=True, overwrite_output=True)
                 
                 print(f"✓ Audio extracted with ffmpeg: {audio_path}")
@@ -431,7 +556,7 @@ Do NOT include explanations outside JSON.
             print(f"📤 Uploading audio to Gemini...")
             
             # Upload audio file
-            audio_file = genai.upload_file(path=audio_path)
+            audio_file = genai.upload_file(path=audio_path, mime_type=profile.mimetype)
             
             # Wait for processing
             max_wait_time = 30
@@ -455,7 +580,7 @@ Do NOT include explanations outside JSON.
             print(f"🎯 Transcribing audio...")
             prompt = "Transcribe the spoken content from this audio. Return only the transcribed text."
             
-            response = self.model.generate_content(
+            response = self._generate_content(
                 [prompt, audio_file],
                 generation_config={'temperature': 0.1}
             )
@@ -498,17 +623,24 @@ Do NOT include explanations outside JSON.
         role_context: str | None = None,
         role_profile: str | None = None,
         core_competencies: str | None = None,
+        interview_ids: list | None = None,
     ) -> list:
         """
         Analyze multiple transcripts in a SINGLE API call for maximum speed
         OPTIMIZED: 5x faster than individual calls
         
+        Each result is tagged with its video_id and validated on its own;
+        only missing or invalid items are re-requested individually.
+        
         Args:
             transcripts_data: List of dicts with:
+                - video_id: ID used to tag the result (defaults to position)
                 - transcript_text: The transcribed text
                 - question_text: The interview question
                 - question_type: Type of question
             interview_id: Optional ID to link token usage
+            interview_ids: Interview ID of each transcript when the batch combines
+                interviews; token usage is split between them by transcript count
         
         Returns:
             List of analysis results in same order
@@ -516,6 +648,9 @@ Do NOT include explanations outside JSON.
         import time
         import json
         
+        usage_shares = _usage_shares(interview_id, interview_ids, len(transcripts_data))
+        tags = [str(data.get('video_id', i)) for i, data in enumerate(transcripts_data, 1)]
+        
         # Build batch prompt with all questions
         batch_prompt = f"""You are an expert HR interviewer analyzing multiple video interview responses.
 Analyze ALL responses and return a JSON array with results for each in order.
@@ -543,9 +678,9 @@ For each response, provide scores (0-100) for:
 """
         
         # Add each Q&A to the prompt
-        for i, data in enumerate(transcripts_data, 1):
+        for i, (data, tag) in enumerate(zip(transcripts_data, tags), 1):
             batch_prompt += f"""
-=== RESPONSE {i} ===
+=== RESPONSE {i} (video_id: {tag}) ===
 Question: {data['question_text']}
 Type: {data['question_type']}
 Competency: {data.get('question_competency', 'N/A')}
@@ -553,10 +688,12 @@ Answer: {data.get('transcript', data.get('transcript_text', ''))}
 
 """
         
-        batch_prompt += """
-Return ONLY a JSON array with {len(transcripts_data)} objects, one for each response in order:
+        batch_prompt += f"""
+Return ONLY a JSON array with {len(transcripts_data)} objects, one for each response in order.
+Copy each response's video_id into its object:
 [
-  {
+  {{
+    "video_id": "<video_id of the response>",
     "sentiment_score": <number>,
     "confidence_score": <number>,
     "speech_clarity_score": <number>,
@@ -564,91 +701,111 @@ Return ONLY a JSON array with {len(transcripts_data)} objects, one for each resp
     "overall_score": <number>,
     "recommendation": "<pass|review|fail>",
     "analysis_summary": "<explanation>"
-  },
+  }},
   ... (repeat for all responses)
 ]
 """
         
         start_time = time.time()
+        generation_config = {
+            'temperature': 0.3,
+            'response_mime_type': 'application/json'
+        }
         
         try:
-            print(f"📊 Batch analyzing {len(transcripts_data)} transcripts in single API call...")
-            
-            response = self.model.generate_content(
-                batch_prompt,
-                generation_config={
-                    'temperature': 0.3,
-                    'response_mime_type': 'application/json'
-                }
-            )
-            
-            response_time = time.time() - start_time
-            print(f"✅ Batch analysis completed in {response_time:.2f}s")
+            cache_key, response_text = self.response_cache.lookup(self.model_name, generation_config, batch_prompt)
+            response = None
+            if response_text is not None:
+                print(f"♻️ Batch analysis served from response cache")
+            else:
+                print(f"📊 Batch analyzing {len(transcripts_data)} transcripts in single API call...")
+                
+                response = self._generate_content(batch_prompt, generation_config=generation_config)
+                response_text = response.text
+                
+                response_time = time.time() - start_time
+                print(f"✅ Batch analysis completed in {response_time:.2f}s")
             
-            # Parse JSON array
-            analyses = json.loads(response.text)
+            # Parse JSON array, validating each element against its video_id
+            analyses, missing = _match_batch_items(json.loads(response_text), tags)
             
-            # Log token usage
-            self._log_token_usage(
-                operation_type='analysis',
-                prompt=batch_prompt,
-                response_text=response.text,
-                response_time=response_time,
-                interview_id=interview_id,
-                success=True,
-                response_obj=response
-            )
-            
-            # Ensure we got the right number of results
-            if len(analyses) != len(transcripts_data):
-                print(f"⚠️ Expected {len(transcripts_data)} results, got {len(analyses)}")
-                # Fall back to individual analysis if batch fails
-                return [
-                    self.analyze_transcript(
-                        d.get('transcript_text') or d.get('transcript', ''),
-                        d.get('question_text', ''),
-                        d.get('question_type', ''),
-                        role_name=role_name,
-                        role_code=role_code,
-                        role_context=role_context,
-                        question_competency=d.get('question_competency'),
-                        role_profile=role_profile,
-                        core_competencies=core_competencies,
+            # Log token usage (cache hits cost nothing)
+            if response is not None:
+                for owner, share in usage_shares:
+                    self._log_token_usage(
+                        operation_type='analysis',
+                        prompt=batch_prompt,
+                        response_text=response_text,
+                        response_time=response_time,
+                        interview_id=owner,
+                        success=True,
+                        response_obj=response,
+                        share=share
                     )
-                    for d in transcripts_data
-                ]
             
+            # Keep valid items; re-request only the missing/invalid ones
+            if missing:
+                print(f"⚠️ {len(missing)} of {len(tags)} batch results missing or invalid, re-requesting those only")
+                repaired = self._analyze_individually(
+                    [transcripts_data[i] for i in missing],
+                    role_name=role_name,
+                    role_code=role_code,
+                    role_context=role_context,
+                    role_profile=role_profile,
+                    core_competencies=core_competencies,
+                )
+                for i, analysis in zip(missing, repaired):
+                    analyses[i] = analysis
+            
+            # Only a response whose every item validated is reusable as-is
+            if not missing:
+                self.response_cache.store(cache_key, response_text)
             return analyses
             
         except Exception as e:
             # Log failed batch analysis
             response_time = time.time() - start_time
-            self._log_token_usage(
-                operation_type='analysis',
-                prompt=batch_prompt,
-                response_text="",
-                response_time=response_time,
-                interview_id=interview_id,
-                success=False,
-                error=str(e)
-            )
+            for owner, share in usage_shares:
+                self._log_token_usage(
+                    operation_type='analysis',
+                    prompt=batch_prompt,
+                    response_text="",
+                    response_time=response_time,
+                    interview_id=owner,
+                    success=False,
+                    error=str(e),
+                    share=share
+                )
             
             print(f"❌ Batch analysis failed: {e}. Falling back to individual analysis...")
             # Fallback: analyze individually
-            return [
-                self.analyze_transcript(
-                    d.get('transcript_text') or d.get('transcript', ''),
-                    d.get('question_text', ''),
-                    d.get('question_type', ''),
-                    role_name=role_name,
-                    role_code=role_code,
-                    role_context=role_context,
-                    question_competency=d.get('question_competency'),
-                    role_profile=role_profile,
-                    core_competencies=core_competencies,
-                )
-                for d in transcripts_data
-            ]
+            return self._analyze_individually(
+                transcripts_data,
+                role_name=role_name,
+                role_code=role_code,
+                role_context=role_context,
+                role_profile=role_profile,
+                core_competencies=core_competencies,
+            )
+    
+    def _analyze_individually(self, transcripts_data: list, **role_kwargs) -> list:
+        """
+        Per-transcript fallback for batch analysis
+        
+        Calls run concurrently (bounded by LLM_FANOUT_MAX_CONCURRENCY), so the
+        fallback costs about one round-trip. Calls over LLM_CALL_TIMEOUT get
+        the default 'review' scores.
+        """
+        def analyze_one(d):
+            return self.analyze_transcript(
+                d.get('transcript_text') or d.get('transcript', ''),
+                d.get('question_text', ''),
+                d.get('question_type', ''),
+                question_competency=d.get('question_competency'),
+                **role_kwargs,
+            )
+        
+        return bounded_map(analyze_one, transcripts_data, on_error=lambda d, e: _failed_analysis(e))
     
     def batch_transcribe_and_analyze(
         self,
@@ -812,7 +969,7 @@ Return ONLY a JSON array with {len(transcripts_data)} objects, one for each resp
         """
         
         try:
-            response = self.model.generate_content(
+            response = self._generate_content(
                 prompt,
                 generation_config={'temperature': 0.7, 'response_mime_type': 'application/json'}
             )
@@ -0,0 +1,251 @@
+"""
+Cross-interview micro-batching of transcript analysis
+
+During peaks many interviews finish at once and each process_complete_interview
+task sends its own Gemini request, which runs into per-minute request limits.
+With ANALYSIS_MICROBATCH_ENABLED, a task queues its transcript set in Redis
+instead, keyed by role context so every interview in a batch shares the same
+prompt header. The worker that fills the queue
+(ANALYSIS_MICROBATCH_MAX_INTERVIEWS), or whose entry has waited
+ANALYSIS_MICROBATCH_WINDOW, takes a short lock, pops a batch (bounded by
+_MAX_ITEMS), sends one combined batch_analyze_transcripts request, and pushes
+each interview's slice of the results to a per-job Redis list. Results are
+matched by the video_id tags in the batch prompt, so demultiplexing is
+positional over already-validated items.
+
+Waiting workers block on their result list (BLPOP) rather than polling. If
+the leader's request fails it pushes a failure marker so every follower goes
+direct at once; if the leader dies, followers stop waiting when its lock
+expires. A job is popped by a leader or withdrawn by its owner in one Lua
+script each, so a job whose leader is still running is waited for, never
+analyzed twice.
+
+Any Redis problem, or no result within the wait budget, falls back to the
+direct per-interview request, so batching can only add bounded latency.
+"""
+
+import hashlib
+import json
+import logging
+import time
+import uuid
+
+from django.conf import settings
+
+from monitoring import metrics
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = 'analysis_batch'
+METRIC_PREFIX = 'analysis_microbatch'
+RESULT_TTL = 600
+
+# KEYS: pending list. ARGV: max_interviews, max_items.
+# Pops the oldest jobs that fit the size bounds in one step, so a job is
+# either taken by a leader or withdrawn by its owner, never both.
+TAKE_JOBS_SCRIPT = """
+local raw_jobs = redis.call('LRANGE', KEYS[1], 0, tonumber(ARGV[1]) - 1)
+local jobs = {}
+local total_items = 0
+for _, raw in ipairs(raw_jobs) do
+    local count = #cjson.decode(raw)['items']
+    if #jobs > 0 and total_items + count > tonumber(ARGV[2]) then
+        break
+    end
+    jobs[#jobs + 1] = raw
+    total_items = total_items + count
+end
+if #jobs > 0 then
+    redis.call('LTRIM', KEYS[1], #jobs, -1)
+end
+return jobs
+"""
+
+# KEYS: pending list, flush lock. ARGV: the job payload.
+# Returns {1, 0} if the job was still pending and is now withdrawn, otherwise
+# {0, ms the current leader's lock has left}; the job is then in its batch.
+WITHDRAW_SCRIPT = """
+if redis.call('LREM', KEYS[1], 1, ARGV[1]) == 1 then
+    return {1, 0}
+end
+return {0, redis.call('PTTL', KEYS[2])}
+"""
+
+
+def _setting(name, default):
+    return getattr(settings, f'ANALYSIS_MICROBATCH_{name}', default)
+
+
+def _get_redis():
+    from django_redis import get_redis_connection
+    return get_redis_connection('default')
+
+
+def _group_key(role_kwargs):
+    fingerprint = hashlib.sha256(json.dumps(role_kwargs, sort_keys=True, default=str).encode()).hexdigest()[:16]
+    return f"{KEY_PREFIX}:pending:{fingerprint}"
+
+
+def analyze_transcripts(ai_service, transcripts_data, interview_id=None, **role_kwargs):
+    """
+    Analyze one interview's transcripts, micro-batched with other interviews when enabled
+
+    Same contract as AIAnalysisService.batch_analyze_transcripts: returns one
+    analysis per transcript, in order.
+    """
+    if not _setting('ENABLED', False) or not transcripts_data:
+        return ai_service.batch_analyze_transcripts(transcripts_data, interview_id=interview_id, **role_kwargs)
+
+    try:
+        batcher = MicroBatcher(_get_redis(), ai_service, role_kwargs)
+        analyses = batcher.submit_and_wait(interview_id, transcripts_data)
+    except Exception as e:
+        logger.warning(f"Analysis micro-batching unavailable for interview {interview_id}: {e}")
+        analyses = None
+
+    if analyses is None:
+        metrics.increment(f"{METRIC_PREFIX}.direct")
+        return ai_service.batch_analyze_transcripts(transcripts_data, interview_id=interview_id, **role_kwargs)
+    return analyses
+
+
+class MicroBatcher:
+    """Leader/follower aggregation of transcript sets sharing one role context"""
+
+    def __init__(self, redis, ai_service, role_kwargs):
+        self.redis = redis
+        self.ai_service = ai_service
+        self.role_kwargs = role_kwargs
+        self.pending_key = _group_key(role_kwargs)
+        self.lock_key = f"{self.pending_key}:lock"
+        self.window = float(_setting('WINDOW', 2.0))
+        self.max_interviews = int(_setting('MAX_INTERVIEWS', 8))
+        self.max_items = int(_setting('MAX_ITEMS', 40))
+        self.poll_interval = float(_setting('POLL_INTERVAL', 0.2))
+        self.lock_ttl = int(getattr(settings, 'LLM_CALL_TIMEOUT', 60)) * 2
+
+    def submit_and_wait(self, interview_id, transcripts_data):
+        """Queue this interview's transcripts; return its analyses or None to go direct"""
+        job_id = uuid.uuid4().hex
+        enqueued_at = time.time()
+        payload = json.dumps({
+            'job_id': job_id,
+            'interview_id': interview_id,
+            'enqueued_at': enqueued_at,
+            'items': transcripts_data,
+        }, default=str)
+        self.redis.rpush(self.pending_key, payload)
+        if self.redis.llen(self.pending_key) >= self.max_interviews:
+            self._try_flush()
+
+        result_key = f"{KEY_PREFIX}:result:{job_id}"
+        # Our own window, plus one LLM call if another worker already took our job
+        deadline = enqueued_at + self.window + self.lock_ttl
+        # Nothing is due before our window closes: block until then unless a leader answers
+        timeout = enqueued_at + self.window - time.time()
+
+        while True:
+            done, analyses = self._wait_result(result_key, timeout)
+            if done:
+                if analyses is not None:
+                    metrics.increment(f"{METRIC_PREFIX}.wait_ms", int((time.time() - enqueued_at) * 1000))
+                return analyses
+            if time.time() >= deadline:
+                break
+            flushed = self._try_flush()
+            if flushed is None:
+                # Another worker is flushing: wait for as long as its lock lives
+                timeout = min(max(self._lock_remaining(), self.poll_interval), deadline - time.time())
+            elif flushed:
+                # Our job was in the batch unless the size bounds left it for the next one
+                timeout = 0
+            else:
+                # Nothing pending and no result: a leader took our job and died
+                break
+
+        withdrawn, lock_ttl_ms = self.redis.eval(WITHDRAW_SCRIPT, 2, self.pending_key, self.lock_key, payload)
+        if withdrawn:
+            return None
+        # A leader took the job after all: its result is coming, never run it twice
+        done, analyses = self._wait_result(result_key, max(lock_ttl_ms, 0) / 1000)
+        return analyses if done else None
+
+    def _wait_result(self, result_key, timeout):
+        """(True, analyses) once a leader answered, analyses None if its request failed; (False, None) on timeout"""
+        if timeout > 0:
+            popped = self.redis.blpop(result_key, timeout=timeout)
+            raw = popped[1] if popped else None
+        else:
+            raw = self.redis.lpop(result_key)
+        if raw is None:
+            return False, None
+        return True, json.loads(raw)
+
+    def _lock_remaining(self):
+        return max(self.redis.pttl(self.lock_key), 0) / 1000
+
+    def _try_flush(self):
+        """Analyze one batch; returns the number of jobs taken, None if another worker holds the lock"""
+        token = uuid.uuid4().hex
+        if not self.redis.set(self.lock_key, token, nx=True, ex=self.lock_ttl):
+            return None
+        try:
+            jobs = self._take_jobs()
+            if jobs:
+                self._analyze_jobs(jobs)
+            return len(jobs)
+        finally:
+            if self.redis.get(self.lock_key) in (token, token.encode()):
+                self.redis.delete(self.lock_key)
+
+    def _take_jobs(self):
+        """Pop the oldest jobs that fit the size bounds, atomically with respect to withdrawals"""
+        raw_jobs = self.redis.eval(TAKE_JOBS_SCRIPT, 1, self.pending_key, self.max_interviews, self.max_items)
+        return [json.loads(raw) for raw in raw_jobs]
+
+    def _analyze_jobs(self, jobs):
+        combined = [item for job in jobs for item in job['items']]
+        logger.info(f"Micro-batch analyzing {len(combined)} transcripts from {len(jobs)} interviews")
+        metrics.increment(f"{METRIC_PREFIX}.flushes")
+        metrics.increment(f"{METRIC_PREFIX}.interviews", len(jobs))
+
+        try:
+            analyses = self.ai_service.batch_analyze_transcripts(
+                combined,
+                interview_ids=[job['interview_id'] for job in jobs for _ in job['items']],
+                **self.role_kwargs,
+            )
+        except BaseException:
+            # Release the followers at once; each sends its own request
+            for job in jobs:
+                self._publish_result(job['job_id'], None)
+            raise
+
+        offset = 0
+        for job in jobs:
+            count = len(job['items'])
+            self._publish_result(job['job_id'], analyses[offset:offset + count])
+            offset += count
+
+    def _publish_result(self, job_id, analyses):
+        result_key = f"{KEY_PREFIX}:result:{job_id}"
+        self.redis.rpush(result_key, json.dumps(analyses, default=str))
+        self.redis.expire(result_key, RESULT_TTL)
+
+
+def microbatch_stats():
+    counters = metrics.get_counters([
+        f"{METRIC_PREFIX}.flushes",
+        f"{METRIC_PREFIX}.interviews",
+        f"{METRIC_PREFIX}.wait_ms",
+        f"{METRIC_PREFIX}.direct",
+    ])
+    flushes = counters[f"{METRIC_PREFIX}.flushes"]
+    interviews = counters[f"{METRIC_PREFIX}.interviews"]
+    return {
+        'flushes': flushes,
+        'interviews_batched': interviews,
+        'avg_interviews_per_request': round(interviews / flushes, 2) if flushes else 0.0,
+        'avg_wait_ms': round(counters[f"{METRIC_PREFIX}.wait_ms"] / interviews) if interviews else 0,
+        'direct_fallbacks': counters[f"{METRIC_PREFIX}.direct"],
+    }
@@ -0,0 +1,123 @@
+"""
+Audio extraction profiles for speech transcription
+
+Speech recognition only needs mono audio at 16kHz; the original pipeline
+encoded stereo 44.1kHz MP3, which is several times larger and slower to
+encode. Profiles describe the ffmpeg encoding used before audio is sent to
+Deepgram or Gemini. Select one with the TRANSCRIPTION_AUDIO_PROFILE setting
+and compare them with `manage.py benchmark_audio_profiles`.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from django.conf import settings
+
+
+@dataclass(frozen=True)
+class AudioProfile:
+    """ffmpeg encoding parameters for one extraction profile"""
+
+    name: str
+    codec: str
+    container: str
+    sample_rate: int
+    channels: int
+    mimetype: str
+    suffix: str
+    bitrate: Optional[str] = None
+
+    def ffmpeg_output_kwargs(self) -> Dict[str, object]:
+        """Keyword arguments for ffmpeg.output(); drops the video stream"""
+        kwargs = {
+            'format': self.container,
+            'acodec': self.codec,
+            'ac': self.channels,
+            'ar': str(self.sample_rate),
+            'vn': None,
+        }
+        if self.bitrate:
+            kwargs['ab'] = self.bitrate
+        return kwargs
+
+
+AUDIO_PROFILES = {
+    # Original behaviour, kept as the benchmark baseline
+    'mp3_legacy': AudioProfile(
+        name='mp3_legacy',
+        codec='libmp3lame',
+        container='mp3',
+        sample_rate=44100,
+        channels=2,
+        bitrate='128k',
+        mimetype='audio/mp3',
+        suffix='.mp3',
+    ),
+    'opus_16k': AudioProfile(
+        name='opus_16k',
+        codec='libopus',
+        container='ogg',
+        sample_rate=16000,
+        channels=1,
+        bitrate='24k',
+        mimetype='audio/ogg',
+        suffix='.ogg',
+    ),
+    'flac_16k': AudioProfile(
+        name='flac_16k',
+        codec='flac',
+        container='flac',
+        sample_rate=16000,
+        channels=1,
+        mimetype='audio/flac',
+        suffix='.flac',
+    ),
+    'linear16_16k': AudioProfile(
+        name='linear16_16k',
+        codec='pcm_s16le',
+        container='wav',
+        sample_rate=16000,
+        channels=1,
+        mimetype='audio/wav',
+        suffix='.wav',
+    ),
+}
+
+DEFAULT_AUDIO_PROFILE = 'flac_16k'
+
+
+def get_audio_profile(name: Optional[str] = None) -> AudioProfile:
+    """Return the named profile, or the one configured in settings"""
+    name = name or getattr(settings, 'TRANSCRIPTION_AUDIO_PROFILE', DEFAULT_AUDIO_PROFILE)
+    try:
+        return AUDIO_PROFILES[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown audio profile '{name}'. Choose one of: {', '.join(sorted(AUDIO_PROFILES))}"
+        )
+
+
+def _normalize_words(text: str) -> list:
+    return re.findall(r"[a-z0-9']+", (text or '').lower())
+
+
+def word_error_rate(reference: str, hypothesis: str) -> float:
+    """
+    Word error rate of hypothesis against reference (0.0 = identical)
+
+    Standard Levenshtein distance over words, case and punctuation insensitive.
+    """
+    ref = _normalize_words(reference)
+    hyp = _normalize_words(hypothesis)
+    if not ref:
+        return 0.0 if not hyp else 1.0
+
+    previous = list(range(len(hyp) + 1))
+    for i, ref_word in enumerate(ref, 1):
+        current = [i] + [0] * len(hyp)
+        for j, hyp_word in enumerate(hyp, 1):
+            substitution = previous[j - 1] + (ref_word != hyp_word)
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, substitution)
+        previous = current
+    return previous[-1] / len(ref)
@@ -2,7 +2,7 @@
 Deepgram Speech-to-Text Service for Interview Video Transcription
 
 This service handles:
-1. Audio extraction from video files
+1. Audio extraction from video files (streamed through an ffmpeg pipe by default)
 2. Transcription using Deepgram API
 3. Token/cost tracking
 """
@@ -10,14 +10,22 @@ This service handles:
 import os
 import time
 import tempfile
-from typing import Dict, Any
+from typing import Dict, Any, Iterator
+import ffmpeg
 from django.conf import settings
 from deepgram import DeepgramClient, PrerecordedOptions, FileSource
+from common import rate_limit
+from interviews.audio_profiles import AudioProfile, get_audio_profile
+from interviews.media_pipeline import build_proxy_output, build_speech_outputs, remove_proxy
+from interviews.transcript_cache import get_cached_transcript, store_transcript
 
 
 class DeepgramTranscriptionService:
     """Service class for Deepgram-powered video transcription"""
     
+    # Size of each audio chunk read from the ffmpeg pipe and sent upstream
+    STREAM_CHUNK_SIZE = 64 * 1024
+    
     def __init__(self):
         """Initialize Deepgram client"""
         api_key = settings.DEEPGRAM_API_KEY
@@ -25,15 +33,20 @@ class DeepgramTranscriptionService:
             raise ValueError("DEEPGRAM_API_KEY not configured in settings")
         
         self.client = DeepgramClient(api_key)
+        self.stream_audio = getattr(settings, 'DEEPGRAM_STREAM_AUDIO', True)
+        self.audio_profile = get_audio_profile()
         print("✓ Deepgram client initialized")
     
-    def transcribe_video(self, video_file_path: str, video_response_id: int = None) -> Dict[str, Any]:
+    def transcribe_video(self, video_file_path: str, video_response_id: int = None,
+                         proxy_path: str = None) -> Dict[str, Any]:
         """
         Extract audio from video and transcribe using Deepgram
         
         Args:
             video_file_path: Path to video file
             video_response_id: Optional ID for logging
+            proxy_path: Optional path; the same ffmpeg pass also writes the
+                low-res script detection proxy there
             
         Returns:
             Dict with:
@@ -45,15 +58,29 @@ class DeepgramTranscriptionService:
         """
         start_time = time.time()
         audio_path = None
+        audio_stream = None
+        
+        # Unchanged file + same options: reuse the earlier transcript
+        cache_key, cached = get_cached_transcript(video_file_path, 'deepgram', self._cache_options())
+        if cached is not None:
+            print(f"♻️ Transcript cache hit for video {video_response_id}")
+            if proxy_path:
+                self._write_proxy(video_file_path, proxy_path)
+            return {**cached, 'processing_time': time.time() - start_time, 'cached': True}
         
         try:
             print(f"\n🎤 Starting Deepgram transcription for video {video_response_id}...")
             
-            # Step 1: Extract audio from video
-            audio_path = self._extract_audio(video_file_path)
-            
-            # Step 2: Transcribe audio with Deepgram
-            result = self._transcribe_audio(audio_path)
+            if self.stream_audio:
+                # Steps 1+2: Pipe ffmpeg output straight into the Deepgram request body
+                audio_stream = self._stream_audio(video_file_path, proxy_path=proxy_path)
+                result = self._transcribe_stream(audio_stream, self.audio_profile)
+            else:
+                # Step 1: Extract audio from video
+                audio_path = self._extract_audio(video_file_path, proxy_path=proxy_path)
+                
+                # Step 2: Transcribe audio with Deepgram
+                result = self._transcribe_audio(audio_path, self.audio_profile)
             
             processing_time = time.time() - start_time
             
@@ -73,6 +100,7 @@ class DeepgramTranscriptionService:
                 processing_time=processing_time
             )
             
+            store_transcript(cache_key, transcript_data)
             return transcript_data
             
         except Exception as e:
@@ -92,6 +120,10 @@ class DeepgramTranscriptionService:
             raise Exception(f"Transcription failed: {str(e)}")
             
         finally:
+            # Stop ffmpeg if Deepgram returned before draining the pipe
+            if audio_stream is not None:
+                audio_stream.close()
+            
             # Clean up temp audio file
             if audio_path and os.path.exists(audio_path):
                 try:
@@ -100,28 +132,34 @@ class DeepgramTranscriptionService:
                 except Exception as cleanup_error:
                     print(f"⚠️ Failed to clean up temp file: {cleanup_error}")
     
-    def _extract_audio(self, video_file_path: str) -> str:
+    def _write_proxy(self, video_file_path: str, proxy_path: str) -> None:
+        """
+        Write the script detection proxy without extracting audio (transcript cache hits)
+
+        Best effort: without a proxy, detection reads the upload itself.
+        """
+        try:
+            build_proxy_output(video_file_path, proxy_path).overwrite_output().run(quiet=True)
+        except Exception as e:
+            remove_proxy(proxy_path)
+            print(f"⚠️ Could not write detection proxy: {e}")
+    
+    def _extract_audio(self, video_file_path: str, profile: AudioProfile = None,
+                       proxy_path: str = None) -> str:
         """
         Extract audio from video file using ffmpeg
         
-        Returns path to temporary audio file
+        Returns path to temporary audio file encoded with the given profile
         """
-        import ffmpeg
-        
-        print(f"🎵 Extracting audio from video...")
+        profile = profile or self.audio_profile
+        print(f"🎵 Extracting audio from video ({profile.name})...")
         
         # Create temp file for audio
-        with tempfile.NamedTemporaryFile(suffix='.mp3', delete=False) as temp_audio:
+        with tempfile.NamedTemporaryFile(suffix=profile.suffix, delete=False) as temp_audio:
             audio_path = temp_audio.name
         
         try:
-            # Extract audio using ffmpeg (mp3 format, 44.1kHz, stereo)
-            stream = ffmpeg.input(video_file_path)
-            stream = ffmpeg.output(stream, audio_path, 
-                                 acodec='libmp3lame', 
-                                 ar='44100',  # Sample rate
-                                 ac=2,        # Stereo
-                                 ab='128k')   # Bitrate
+            stream = build_speech_outputs(video_file_path, audio_path, profile, proxy_path)
             ffmpeg.run(stream, capture_stdout=True, capture_stderr=True, overwrite_output=True)
             
             print(f"✓ Audio extracted: {audio_path}")
@@ -131,31 +169,100 @@ class DeepgramTranscriptionService:
             stderr = e.stderr.decode() if e.stderr else 'Unknown error'
             raise Exception(f"Failed to extract audio: {stderr}")
     
-    def _transcribe_audio(self, audio_path: str) -> Any:
+    def _stream_audio(self, video_file_path: str, profile: AudioProfile = None,
+                      proxy_path: str = None) -> Iterator[bytes]:
         """
-        Transcribe audio file using Deepgram API
+        Extract speech audio through an ffmpeg pipe using the given profile
+        
+        Yields fixed-size chunks so no temp file is written and memory stays
+        constant regardless of video length. Raises if ffmpeg exits non-zero.
+        """
+        profile = profile or self.audio_profile
+        print(f"🎵 Streaming audio from video ({profile.name})...")
+        
+        process = (
+            build_speech_outputs(video_file_path, 'pipe:', profile, proxy_path)
+            .global_args('-nostdin', '-loglevel', 'error')
+            .run_async(pipe_stdout=True, pipe_stderr=True, overwrite_output=True)
+        )
+        
+        try:
+            while True:
+                chunk = process.stdout.read(self.STREAM_CHUNK_SIZE)
+                if not chunk:
+                    break
+                yield chunk
+            
+            process.stdout.close()
+            stderr = process.stderr.read()
+            if process.wait() != 0:
+                raise Exception(f"Failed to extract audio: {stderr.decode(errors='replace') or 'Unknown error'}")
+        finally:
+            # Stop ffmpeg if the upload was aborted mid-stream
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+    
+    def _transcribe_stream(self, audio_chunks: Iterator[bytes], profile: AudioProfile = None) -> Any:
+        """
+        Transcribe a chunked audio stream using Deepgram API
+        
+        The SDK hands the iterator to httpx, which sends it with chunked
+        transfer encoding instead of buffering the whole file.
         
         Returns Deepgram response object
         """
-        print(f"🎯 Transcribing audio with Deepgram...")
+        print(f"🎯 Transcribing streamed audio with Deepgram...")
         
-        # Read audio file
-        with open(audio_path, 'rb') as audio_file:
-            audio_bytes = audio_file.read()
-
-        # Configure Deepgram options (use simple kwargs to avoid typing.Union instantiation issues)
-        options = PrerecordedOptions(
+        source: FileSource = {"stream": audio_chunks}
+        
+        rate_limit.acquire('deepgram')
+        response = self.client.listen.rest.v("1").transcribe_file(
+            source=source,
+            options=self._transcription_options(),
+            headers={"Content-Type": (profile or self.audio_profile).mimetype},
+        )
+        
+        return response
+    
+    def _cache_options(self) -> Dict[str, Any]:
+        """Everything besides the video bytes that changes the transcript"""
+        return {
+            'options': self._transcription_options().to_dict(),
+            'audio_profile': self.audio_profile.name,
+        }
+    
+    def _transcription_options(self) -> PrerecordedOptions:
+        """Deepgram options shared by the buffered and streaming paths"""
+        # Use simple kwargs to avoid typing.Union instantiation issues
+        return PrerecordedOptions(
             model="nova-2",              # Latest model
             smart_format=True,           # Automatic punctuation and formatting
             language="en",               # English
             diarize=False,               # Single speaker (applicant)
             punctuate=True,              # Add punctuation
         )
+    
+    def _transcribe_audio(self, audio_path: str, profile: AudioProfile = None) -> Any:
+        """
+        Transcribe audio file using Deepgram API
+        
+        Returns Deepgram response object
+        """
+        print(f"🎯 Transcribing audio with Deepgram...")
+        
+        # Read audio file
+        with open(audio_path, 'rb') as audio_file:
+            audio_bytes = audio_file.read()
+
+        # Configure Deepgram options
+        options = self._transcription_options()
 
         # Create file source as a plain dict per SDK examples
-        source: FileSource = {"buffer": audio_bytes, "mimetype": "audio/mp3"}
+        source: FileSource = {"buffer": audio_bytes, "mimetype": (profile or self.audio_profile).mimetype}
 
         # Transcribe
+        rate_limit.acquire('deepgram')
         response = self.client.listen.rest.v("1").transcribe_file(
             source=source,
             options=options,
@@ -0,0 +1,118 @@
+"""
+Gemini response cache keyed by prompt fingerprint
+
+Retries of process_complete_interview, reprocessing runs and HR-triggered
+recalculations send byte-identical prompts. Successful responses are cached
+under a hash of (model, generation_config, prompt) in two tiers:
+
+- a per-process LRU, bounded by LLM_RESPONSE_CACHE_MAX_ENTRIES, for repeats
+  inside one worker (e.g. batch fallback re-asking single questions)
+- the shared Django cache (Redis) with LLM_RESPONSE_CACHE_TTL, so a retry
+  picked up by another worker still hits
+
+Only validated responses are stored; callers decide that by calling store().
+"""
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import cache
+
+from monitoring import metrics
+
+KEY_PREFIX = 'llm_response'
+METRIC_PREFIX = 'llm_cache'
+
+
+def prompt_fingerprint(model_name, generation_config, prompt):
+    payload = json.dumps(
+        {'model': model_name, 'config': generation_config or {}, 'prompt': prompt},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class ResponseCache:
+    """Two-tier (local LRU + shared TTL) cache of Gemini response text"""
+
+    def __init__(self, max_entries=None, ttl=None):
+        self.max_entries = max_entries if max_entries is not None else getattr(
+            settings, 'LLM_RESPONSE_CACHE_MAX_ENTRIES', 256
+        )
+        self.ttl = ttl if ttl is not None else getattr(settings, 'LLM_RESPONSE_CACHE_TTL', 24 * 3600)
+        self._local = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self):
+        return getattr(settings, 'LLM_RESPONSE_CACHE_ENABLED', True) and self.max_entries > 0
+
+    def lookup(self, model_name, generation_config, prompt):
+        """Return (key, cached response text or None)"""
+        if not self.enabled:
+            return None, None
+
+        key = f"{KEY_PREFIX}:{prompt_fingerprint(model_name, generation_config, prompt)}"
+        text = self._get_local(key)
+        if text is None:
+            try:
+                text = cache.get(key)
+            except Exception:
+                text = None  # Cache failure is not critical
+            if text is not None:
+                self._set_local(key, text)
+
+        metrics.increment(f"{METRIC_PREFIX}.{'hit' if text is not None else 'miss'}")
+        return key, text
+
+    def store(self, key, text):
+        if not key or text is None:
+            return
+        self._set_local(key, text)
+        try:
+            cache.set(key, text, timeout=self.ttl)
+        except Exception:
+            pass  # Cache failure is not critical
+
+    def clear_local(self):
+        with self._lock:
+            self._local.clear()
+
+    def _get_local(self, key):
+        with self._lock:
+            entry = self._local.get(key)
+            if entry is None:
+                return None
+            expires_at, text = entry
+            if expires_at < time.monotonic():
+                del self._local[key]
+                return None
+            self._local.move_to_end(key)
+            return text
+
+    def _set_local(self, key, text):
+        with self._lock:
+            self._local[key] = (time.monotonic() + self.ttl, text)
+            self._local.move_to_end(key)
+            while len(self._local) > self.max_entries:
+                self._local.popitem(last=False)
+
+
+def cache_stats():
+    return metrics.hit_rate_summary(METRIC_PREFIX)
+
+
+# Singleton instance (one LRU per process)
+_response_cache = None
+
+def get_response_cache() -> ResponseCache:
+    """Get or create the process-wide response cache"""
+    global _response_cache
+    if _response_cache is None:
+        _response_cache = ResponseCache()
+    return _response_cache
@@ -0,0 +1,81 @@
+"""
+Bounded concurrent fan-out for blocking Gemini calls
+
+The Gemini SDK calls are synchronous, so fan-out uses a thread pool rather
+than asyncio. Concurrency is capped by LLM_FANOUT_MAX_CONCURRENCY and every
+call gets a deadline of LLM_CALL_TIMEOUT seconds (per wave of workers), so a
+5-question fallback costs about one round-trip instead of five.
+"""
+
+import logging
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+
+from django.conf import settings
+from django.db import connection
+
+logger = logging.getLogger(__name__)
+
+
+class LLMCallTimeout(TimeoutError):
+    """A fanned-out call did not finish before its deadline"""
+
+
+def _run_in_worker(func, item):
+    try:
+        return func(item)
+    finally:
+        # Worker threads open their own DB connection (token usage logging)
+        connection.close()
+
+
+def bounded_map(func, items, max_workers=None, timeout=None, on_error=None):
+    """
+    Call func(item) for every item concurrently and return results in order
+
+    Args:
+        func: Callable taking one item
+        items: Iterable of inputs
+        max_workers: Concurrency limit (default: LLM_FANOUT_MAX_CONCURRENCY)
+        timeout: Seconds allowed per call (default: LLM_CALL_TIMEOUT). Calls
+            queued behind a full pool get one extra timeout per wave.
+        on_error: on_error(item, exc) supplies the result for a call that
+            raised or timed out; without it the first error is raised.
+    """
+    items = list(items)
+    if not items:
+        return []
+
+    limit = max_workers or getattr(settings, 'LLM_FANOUT_MAX_CONCURRENCY', 5)
+    timeout = timeout if timeout is not None else getattr(settings, 'LLM_CALL_TIMEOUT', 60)
+    workers = max(1, min(limit, len(items)))
+    deadline = time.monotonic() + timeout * math.ceil(len(items) / workers)
+
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='llm-fanout')
+    try:
+        futures = [executor.submit(_run_in_worker, func, item) for item in items]
+        results = []
+        for item, future in zip(items, futures):
+            try:
+                results.append(future.result(timeout=max(0, deadline - time.monotonic())))
+            except FutureTimeoutError:
+                future.cancel()
+                error = LLMCallTimeout(f"LLM call exceeded timeout of {timeout}s")
+                if on_error is None:
+                    raise error
+                logger.warning(str(error))
+                results.append(on_error(item, error))
+            except Exception as e:
+                if on_error is None:
+                    raise
+                results.append(on_error(item, e))
+        return results
+    finally:
+        # Don't block on calls that overran their deadline
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def call_with_timeout(func, timeout=None):
+    """Run a single blocking call with the LLM deadline; raises LLMCallTimeout"""
+    return bounded_map(lambda _: func(), [None], max_workers=1, timeout=timeout)[0]
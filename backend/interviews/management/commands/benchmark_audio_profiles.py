@@ -0,0 +1,123 @@
+"""
+Benchmark audio extraction profiles for transcription
+
+For each video in a fixture directory and each profile, measures ffmpeg
+encode time and encoded size. With --transcribe it also sends the audio to
+Deepgram and reports word error rate against `<video>.txt` when present,
+otherwise against the mp3_legacy transcript (the original pipeline).
+
+    python manage.py benchmark_audio_profiles path/to/fixtures --transcribe
+"""
+import json
+import os
+import time
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from interviews.audio_profiles import AUDIO_PROFILES, get_audio_profile, word_error_rate
+
+VIDEO_EXTENSIONS = {'.webm', '.mp4', '.mov', '.mkv'}
+BASELINE_PROFILE = 'mp3_legacy'
+
+
+class Command(BaseCommand):
+    help = 'Compare encode time, upload size and transcript WER of audio extraction profiles'
+
+    def add_arguments(self, parser):
+        parser.add_argument('fixtures_dir', type=str, help='Directory containing sample interview videos')
+        parser.add_argument(
+            '--profiles',
+            nargs='+',
+            default=sorted(AUDIO_PROFILES),
+            help='Profiles to benchmark (default: all)',
+        )
+        parser.add_argument(
+            '--transcribe',
+            action='store_true',
+            help='Also transcribe with Deepgram and report word error rate',
+        )
+        parser.add_argument('--json', action='store_true', help='Print raw results as JSON')
+
+    def handle(self, *args, **options):
+        fixtures_dir = Path(options['fixtures_dir'])
+        if not fixtures_dir.is_dir():
+            raise CommandError(f"Fixture directory not found: {fixtures_dir}")
+
+        videos = sorted(p for p in fixtures_dir.iterdir() if p.suffix.lower() in VIDEO_EXTENSIONS)
+        if not videos:
+            raise CommandError(f"No videos found in {fixtures_dir}")
+
+        profile_names = list(options['profiles'])
+        profiles = [get_audio_profile(name) for name in profile_names]
+        transcribe = options['transcribe']
+        if transcribe and BASELINE_PROFILE not in profile_names:
+            profiles.insert(0, get_audio_profile(BASELINE_PROFILE))
+
+        from interviews.deepgram_service import DeepgramTranscriptionService
+
+        # Bypass __init__ when only encoding so no API key is needed
+        if transcribe:
+            service = DeepgramTranscriptionService()
+        else:
+            service = DeepgramTranscriptionService.__new__(DeepgramTranscriptionService)
+        rows = []
+
+        for video in videos:
+            reference_path = video.with_suffix('.txt')
+            reference = reference_path.read_text().strip() if reference_path.exists() else None
+            transcripts = {}
+
+            for profile in profiles:
+                start = time.perf_counter()
+                audio_path = service._extract_audio(str(video), profile)
+                encode_seconds = time.perf_counter() - start
+                try:
+                    row = {
+                        'video': video.name,
+                        'profile': profile.name,
+                        'encode_seconds': round(encode_seconds, 3),
+                        'audio_bytes': os.path.getsize(audio_path),
+                    }
+                    if transcribe:
+                        response = service._transcribe_audio(audio_path, profile)
+                        parsed = service._parse_deepgram_response(response, 0)
+                        transcripts[profile.name] = parsed['transcript']
+                        row['confidence'] = round(parsed['confidence'], 3)
+                    rows.append(row)
+                finally:
+                    os.unlink(audio_path)
+
+            if transcribe:
+                baseline = reference if reference is not None else transcripts.get(BASELINE_PROFILE, '')
+                for row in rows:
+                    if row['video'] == video.name:
+                        row['wer'] = round(word_error_rate(baseline, transcripts[row['profile']]), 4)
+                        row['wer_reference'] = 'fixture' if reference is not None else BASELINE_PROFILE
+
+        if options['json']:
+            self.stdout.write(json.dumps(rows, indent=2))
+            return
+
+        self._print_summary(rows, profiles, transcribe)
+
+    def _print_summary(self, rows, profiles, transcribe):
+        header = f"{'profile':<14}{'avg encode s':>14}{'avg KiB':>12}{'size vs mp3':>13}"
+        if transcribe:
+            header += f"{'avg WER':>10}"
+        self.stdout.write(header)
+        self.stdout.write('-' * len(header))
+
+        baseline_rows = [r for r in rows if r['profile'] == BASELINE_PROFILE]
+        baseline_bytes = sum(r['audio_bytes'] for r in baseline_rows) / len(baseline_rows) if baseline_rows else None
+
+        for profile in profiles:
+            profile_rows = [r for r in rows if r['profile'] == profile.name]
+            avg_encode = sum(r['encode_seconds'] for r in profile_rows) / len(profile_rows)
+            avg_bytes = sum(r['audio_bytes'] for r in profile_rows) / len(profile_rows)
+            ratio = f"{avg_bytes / baseline_bytes:.2f}x" if baseline_bytes else 'n/a'
+            line = f"{profile.name:<14}{avg_encode:>14.3f}{avg_bytes / 1024:>12.1f}{ratio:>13}"
+            if transcribe:
+                avg_wer = sum(r['wer'] for r in profile_rows) / len(profile_rows)
+                line += f"{avg_wer:>10.3f}"
+            self.stdout.write(line)
@@ -0,0 +1,106 @@
+"""
+Benchmark face detection backends used by script reading detection
+
+Samples frames from every video in a fixture directory (the same way
+detect_script_reading does) and runs each backend on identical frames,
+reporting per-frame latency and the share of frames with a detected face.
+
+    python manage.py benchmark_face_detectors path/to/fixtures --backends haar yunet ssd
+"""
+import json
+import statistics
+import time
+from pathlib import Path
+
+import cv2
+from django.core.management.base import BaseCommand, CommandError
+
+from interviews.ai.face_detectors import FACE_DETECTORS, get_face_detector
+from interviews.ai.script_detection import FALLBACK_FPS, _frame_skip_for
+
+VIDEO_EXTENSIONS = {'.webm', '.mp4', '.mov', '.mkv'}
+
+
+class Command(BaseCommand):
+    help = 'Compare per-frame latency and detection rate of face detection backends'
+
+    def add_arguments(self, parser):
+        parser.add_argument('fixtures_dir', type=str, help='Directory containing sample interview videos')
+        parser.add_argument('--backends', nargs='+', default=sorted(FACE_DETECTORS), choices=sorted(FACE_DETECTORS))
+        parser.add_argument('--target-fps', type=float, default=5.0)
+        parser.add_argument('--max-width', type=int, default=320, help='Downscale width (0 = full resolution)')
+        parser.add_argument('--model-dir', type=str, default=None, help='Override FACE_DETECTOR_MODEL_DIR')
+        parser.add_argument('--json', action='store_true', help='Print raw results as JSON')
+
+    def handle(self, *args, **options):
+        fixtures_dir = Path(options['fixtures_dir'])
+        if not fixtures_dir.is_dir():
+            raise CommandError(f"Fixture directory not found: {fixtures_dir}")
+
+        videos = sorted(p for p in fixtures_dir.iterdir() if p.suffix.lower() in VIDEO_EXTENSIONS)
+        if not videos:
+            raise CommandError(f"No videos found in {fixtures_dir}")
+
+        detectors = {}
+        for name in options['backends']:
+            detector = get_face_detector(name, model_dir=options['model_dir'])
+            if detector.name != name:
+                self.stderr.write(f"Skipping {name}: model files not available")
+                continue
+            detectors[name] = detector
+
+        frames = []
+        for video in videos:
+            frames.extend(self._sample_frames(str(video), options['target_fps'], options['max_width']))
+        if not frames:
+            raise CommandError("Could not decode any frames from the fixtures")
+
+        results = {}
+        for name, detector in detectors.items():
+            latencies = []
+            detected = 0
+            for frame in frames:
+                start = time.perf_counter()
+                faces = detector.detect(frame)
+                latencies.append((time.perf_counter() - start) * 1000)
+                detected += bool(faces)
+            results[name] = {
+                'frames': len(frames),
+                'mean_ms': round(statistics.mean(latencies), 2),
+                'p95_ms': round(sorted(latencies)[int(0.95 * (len(latencies) - 1))], 2),
+                'detection_rate': round(detected / len(frames), 3),
+            }
+
+        if options['json']:
+            self.stdout.write(json.dumps(results, indent=2))
+            return
+
+        header = f"{'backend':<10}{'frames':>8}{'mean ms':>10}{'p95 ms':>10}{'detection rate':>16}"
+        self.stdout.write(header)
+        self.stdout.write('-' * len(header))
+        for name, row in results.items():
+            self.stdout.write(
+                f"{name:<10}{row['frames']:>8}{row['mean_ms']:>10.2f}{row['p95_ms']:>10.2f}{row['detection_rate']:>16.1%}"
+            )
+
+    def _sample_frames(self, path, target_fps, max_width):
+        video = cv2.VideoCapture(path)
+        fps = video.get(cv2.CAP_PROP_FPS)
+        if not fps or fps <= 0 or fps > 240:
+            fps = FALLBACK_FPS
+        frame_skip = _frame_skip_for(fps, target_fps)
+        frames = []
+        count = 0
+        while video.grab():
+            count += 1
+            if count % frame_skip != 0:
+                continue
+            ret, frame = video.retrieve()
+            if not ret:
+                break
+            if max_width and frame.shape[1] > max_width:
+                scale = max_width / frame.shape[1]
+                frame = cv2.resize(frame, (max_width, int(frame.shape[0] * scale)), interpolation=cv2.INTER_AREA)
+            frames.append(frame)
+        video.release()
+        return frames
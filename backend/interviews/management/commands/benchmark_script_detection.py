@@ -0,0 +1,91 @@
+"""
+Benchmark script reading detection sampling modes
+
+Runs detect_script_reading over every video in a fixture directory with the
+legacy path (decode every frame, analyze every 3rd at full resolution) and
+with each requested target FPS, then reports throughput and how closely
+risk_score and status agree with the legacy result.
+
+    python manage.py benchmark_script_detection path/to/fixtures --target-fps 3 5 --max-width 320
+"""
+import json
+import time
+from pathlib import Path
+
+import cv2
+from django.core.management.base import BaseCommand, CommandError
+
+from interviews.ai.script_detection import detect_script_reading
+
+VIDEO_EXTENSIONS = {'.webm', '.mp4', '.mov', '.mkv'}
+
+
+class Command(BaseCommand):
+    help = 'Compare speed and risk_score agreement of script detection sampling modes'
+
+    def add_arguments(self, parser):
+        parser.add_argument('fixtures_dir', type=str, help='Directory containing sample interview videos')
+        parser.add_argument('--target-fps', nargs='+', type=float, default=[3.0, 5.0])
+        parser.add_argument('--max-width', type=int, default=320, help='Downscale width for sampled modes (0 = off)')
+        parser.add_argument('--json', action='store_true', help='Print raw results as JSON')
+
+    def handle(self, *args, **options):
+        fixtures_dir = Path(options['fixtures_dir'])
+        if not fixtures_dir.is_dir():
+            raise CommandError(f"Fixture directory not found: {fixtures_dir}")
+
+        videos = sorted(p for p in fixtures_dir.iterdir() if p.suffix.lower() in VIDEO_EXTENSIONS)
+        if not videos:
+            raise CommandError(f"No videos found in {fixtures_dir}")
+
+        modes = [('legacy', 0, 0)] + [
+            (f"{fps:g}fps@{options['max_width'] or 'full'}", fps, options['max_width'])
+            for fps in options['target_fps']
+        ]
+        rows = []
+
+        for video in videos:
+            capture = cv2.VideoCapture(str(video))
+            source_frames = int(capture.get(cv2.CAP_PROP_FRAME_COUNT))
+            capture.release()
+
+            legacy = None
+            for mode, target_fps, max_width in modes:
+                start = time.perf_counter()
+                result = detect_script_reading(str(video), target_fps=target_fps, max_width=max_width)
+                elapsed = time.perf_counter() - start
+                if legacy is None:
+                    legacy = result
+
+                rows.append({
+                    'video': video.name,
+                    'mode': mode,
+                    'seconds': round(elapsed, 3),
+                    'source_fps': round(source_frames / elapsed, 1) if elapsed and source_frames > 0 else None,
+                    'frames_analyzed': result['data'].get('frames_analyzed', 0),
+                    'status': result['status'],
+                    'risk_score': result['risk_score'],
+                    'risk_delta': abs(result['risk_score'] - legacy['risk_score']),
+                    'status_match': result['status'] == legacy['status'],
+                })
+
+        if options['json']:
+            self.stdout.write(json.dumps(rows, indent=2))
+            return
+
+        header = f"{'mode':<16}{'avg s':>9}{'src frames/s':>14}{'speedup':>9}{'mean |Δrisk|':>14}{'status agree':>14}"
+        self.stdout.write(header)
+        self.stdout.write('-' * len(header))
+        legacy_seconds = sum(r['seconds'] for r in rows if r['mode'] == 'legacy')
+        for mode, _, _ in modes:
+            mode_rows = [r for r in rows if r['mode'] == mode]
+            seconds = sum(r['seconds'] for r in mode_rows)
+            throughputs = [r['source_fps'] for r in mode_rows if r['source_fps']]
+            throughput = sum(throughputs) / len(throughputs) if throughputs else 0
+            speedup = legacy_seconds / seconds if seconds else 0
+            delta = sum(r['risk_delta'] for r in mode_rows) / len(mode_rows)
+            agree = sum(r['status_match'] for r in mode_rows)
+            self.stdout.write(
+                f"{mode:<16}{seconds / len(mode_rows):>9.2f}{throughput:>14.1f}{speedup:>8.1f}x"
+                f"{delta:>14.1f}{f'{agree}/{len(mode_rows)}':>14}"
+            )
@@ -0,0 +1,220 @@
+"""
+Single-pass media demux for uploaded interview videos
+
+Transcription (ffmpeg) and script detection (OpenCV) used to decode every
+video separately. The transcription worker now runs one ffmpeg process with
+two outputs: the speech audio stream for Deepgram and a small low-frame-rate
+MJPEG proxy that script detection reads instead of the original upload. A
+transcript cache hit skips that pass, so the proxy is written on its own.
+Script detection deletes the proxy once it has read it.
+
+Uploads kept in object storage (VIDEO_STORAGE_BACKEND = 's3') have no local
+path; local_video downloads a temporary copy for the duration of a step.
+
+Browsers record whatever container and codec they support, often variable
+frame rate webm. After upload a worker on the transcode queue writes a
+normalized rendition (H.264/AAC, constant frame rate, height capped,
+faststart MP4), remuxing without re-encoding when the streams already
+qualify. Transcription, detection and HR playback use it once ready and the
+original until then.
+"""
+
+import os
+import tempfile
+from contextlib import contextmanager
+
+import ffmpeg
+from django.conf import settings
+
+PROXY_DIR = 'analysis_proxies'
+PROXY_SUFFIX = '.avi'
+
+
+def proxy_enabled():
+    return getattr(settings, 'ANALYSIS_PROXY_ENABLED', True)
+
+
+def proxy_name_for(video_response_id):
+    """Storage-relative name of the analysis proxy for a video response"""
+    return f"{PROXY_DIR}/{video_response_id}{PROXY_SUFFIX}"
+
+
+def proxy_path_for(video_response_id):
+    """Absolute path for the proxy, creating the directory if needed"""
+    path = os.path.join(settings.MEDIA_ROOT, proxy_name_for(video_response_id))
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    return path
+
+
+def proxy_written(proxy_path):
+    """True if ffmpeg produced a non-empty proxy at proxy_path"""
+    return bool(proxy_path) and os.path.exists(proxy_path) and os.path.getsize(proxy_path) > 0
+
+
+def remove_proxy(proxy_path):
+    """Delete a proxy file (complete or partial); True if one was there"""
+    try:
+        os.remove(proxy_path)
+        return True
+    except (FileNotFoundError, TypeError):
+        return False
+
+
+def discard_proxy(video_response_id):
+    """Delete a video's proxy once script detection has read it"""
+    return remove_proxy(os.path.join(settings.MEDIA_ROOT, proxy_name_for(video_response_id)))
+
+
+def normalization_enabled():
+    return getattr(settings, 'VIDEO_NORMALIZATION_ENABLED', True)
+
+
+def _frame_rate(rate):
+    numerator, _, denominator = (rate or '').partition('/')
+    try:
+        return float(numerator) / float(denominator or 1)
+    except (ValueError, ZeroDivisionError):
+        return 0.0
+
+
+def _stream(probe, codec_type):
+    return next((s for s in probe.get('streams', []) if s.get('codec_type') == codec_type), None)
+
+
+def normalization_plan(probe):
+    """
+    How to normalize a file given its ffprobe output
+
+    'remux' when the streams already qualify and only the container changes,
+    'transcode' otherwise, None when there is no video stream to normalize.
+    """
+    video = _stream(probe, 'video')
+    if video is None:
+        return None
+    audio = _stream(probe, 'audio')
+    max_height = getattr(settings, 'VIDEO_NORMALIZE_MAX_HEIGHT', 720)
+    max_fps = getattr(settings, 'VIDEO_NORMALIZE_FPS', 30)
+
+    frame_rate = _frame_rate(video.get('r_frame_rate'))
+    constant = frame_rate > 0 and abs(frame_rate - _frame_rate(video.get('avg_frame_rate'))) < 0.01
+    if (
+        video.get('codec_name') == 'h264'
+        and video.get('pix_fmt') == 'yuv420p'
+        and (video.get('height') or 0) <= max_height
+        and constant
+        and frame_rate <= max_fps + 0.01
+        and (audio is None or audio.get('codec_name') == 'aac')
+    ):
+        return 'remux'
+    return 'transcode'
+
+
+def build_normalize_output(video_file_path, output_path, probe, plan):
+    """ffmpeg graph writing the normalized MP4 for a plan from normalization_plan"""
+    source = ffmpeg.input(video_file_path)
+    if plan == 'remux':
+        return source.output(output_path, format='mp4', c='copy', movflags='+faststart')
+
+    max_height = getattr(settings, 'VIDEO_NORMALIZE_MAX_HEIGHT', 720)
+    video = source.video.filter('fps', fps=getattr(settings, 'VIDEO_NORMALIZE_FPS', 30))
+    if (_stream(probe, 'video').get('height') or 0) > max_height:
+        video = video.filter('scale', -2, max_height)
+    streams = [video, source.audio] if _stream(probe, 'audio') else [video]
+    return ffmpeg.output(
+        *streams, output_path,
+        format='mp4',
+        vcodec='libx264',
+        preset=getattr(settings, 'VIDEO_NORMALIZE_PRESET', 'veryfast'),
+        crf=getattr(settings, 'VIDEO_NORMALIZE_CRF', 23),
+        pix_fmt='yuv420p',
+        acodec='aac',
+        movflags='+faststart',
+    )
+
+
+def build_speech_outputs(video_file_path, audio_target, profile, proxy_path=None):
+    """
+    ffmpeg graph writing speech audio to audio_target ('pipe:' or a file)
+
+    With proxy_path the same decode also writes the detection proxy, sampled
+    to SCRIPT_DETECTION_TARGET_FPS and scaled to SCRIPT_DETECTION_MAX_WIDTH.
+    """
+    source = ffmpeg.input(video_file_path)
+    if not proxy_path:
+        return source.output(audio_target, **profile.ffmpeg_output_kwargs())
+
+    audio = source.audio.output(audio_target, **profile.ffmpeg_output_kwargs())
+    return ffmpeg.merge_outputs(audio, _proxy_output(source, proxy_path))
+
+
+def build_proxy_output(video_file_path, proxy_path):
+    """ffmpeg graph writing only the detection proxy, for when transcription needs no decode"""
+    return _proxy_output(ffmpeg.input(video_file_path), proxy_path)
+
+
+def _proxy_output(source, proxy_path):
+    target_fps = getattr(settings, 'SCRIPT_DETECTION_TARGET_FPS', 5) or 5
+    max_width = getattr(settings, 'SCRIPT_DETECTION_MAX_WIDTH', 320) or 320
+    return (
+        source.video
+        .filter('fps', fps=target_fps)
+        .filter('scale', max_width, -2)
+        .output(proxy_path, format='avi', vcodec='mjpeg', an=None, **{'q:v': 5})
+    )
+
+
+@contextmanager
+def local_video(video_response, original=False):
+    """
+    Local filesystem path of the video for ffmpeg / OpenCV
+
+    The normalized rendition when ready, unless original=True. Files on local
+    storage are used in place; files in object storage are downloaded to
+    VIDEO_DOWNLOAD_DIR and removed when the block exits.
+    """
+    video_file = video_response.video_file_path if original else video_response.playback_file
+    try:
+        local_path = video_file.path
+    except NotImplementedError:
+        local_path = None
+    if local_path:
+        yield local_path
+        return
+
+    from common import object_storage
+
+    extension = os.path.splitext(video_file.name)[1]
+    fd, path = tempfile.mkstemp(suffix=extension, dir=getattr(settings, 'VIDEO_DOWNLOAD_DIR', None) or None)
+    os.close(fd)
+    try:
+        object_storage.download(video_file.name, path)
+        yield path
+    finally:
+        os.remove(path)
+
+
+def _proxy_path(video_response):
+    proxy = getattr(video_response, 'analysis_proxy', None)
+    if proxy:
+        try:
+            if os.path.exists(proxy.path):
+                return proxy.path
+        except (NotImplementedError, ValueError):
+            pass
+    return None
+
+
+def detection_source(video_response):
+    """Path script detection should read: the proxy when present, else the (normalized) upload"""
+    return _proxy_path(video_response) or video_response.playback_file.path
+
+
+@contextmanager
+def detection_input(video_response):
+    """detection_source that also works for uploads in object storage"""
+    proxy_path = _proxy_path(video_response)
+    if proxy_path:
+        yield proxy_path
+        return
+    with local_video(video_response) as path:
+        yield path
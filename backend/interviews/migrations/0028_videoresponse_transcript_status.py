@@ -0,0 +1,43 @@
+from django.db import migrations, models
+
+
+def mark_existing_transcripts_ready(apps, schema_editor):
+    VideoResponse = apps.get_model("interviews", "VideoResponse")
+    VideoResponse.objects.exclude(transcript="").update(transcript_status="ready")
+    VideoResponse.objects.filter(transcript="", status="analyzed").update(transcript_status="ready")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("interviews", "0027_interview_email_queue_fields"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="videoresponse",
+            name="transcript_status",
+            field=models.CharField(
+                choices=[
+                    ("pending", "Pending"),
+                    ("processing", "Processing"),
+                    ("ready", "Ready"),
+                    ("failed", "Failed"),
+                ],
+                default="pending",
+                help_text="Readiness of the transcript produced by the transcription worker",
+                max_length=20,
+            ),
+        ),
+        migrations.AddField(
+            model_name="videoresponse",
+            name="transcript_error",
+            field=models.TextField(blank=True, help_text="Last transcription error, if any"),
+        ),
+        migrations.AddField(
+            model_name="videoresponse",
+            name="transcribed_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.RunPython(mark_existing_transcripts_ready, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,21 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("interviews", "0028_videoresponse_transcript_status"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="videoresponse",
+            name="analysis_proxy",
+            field=models.FileField(
+                blank=True,
+                help_text="Low-res frame proxy written during transcription, read by script detection",
+                null=True,
+                upload_to="analysis_proxies/",
+            ),
+        ),
+    ]
@@ -0,0 +1,70 @@
+import uuid
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("interviews", "0029_videoresponse_analysis_proxy"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="UploadSession",
+            fields=[
+                ("id", models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ("duration", models.DurationField(help_text="Duration of the video response")),
+                ("file_name", models.CharField(help_text="Storage name chunks are appended to", max_length=255)),
+                ("total_size", models.BigIntegerField(help_text="Declared size of the complete file in bytes")),
+                (
+                    "received_bytes",
+                    models.BigIntegerField(default=0, help_text="Bytes written so far; the next chunk's offset"),
+                ),
+                ("checksum", models.CharField(help_text="Declared SHA-256 of the complete file (hex)", max_length=64)),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[("uploading", "Uploading"), ("completed", "Completed"), ("failed", "Failed")],
+                        default="uploading",
+                        max_length=20,
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "interview",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="upload_sessions",
+                        to="interviews.interview",
+                    ),
+                ),
+                (
+                    "question",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="upload_sessions",
+                        to="interviews.interviewquestion",
+                    ),
+                ),
+                (
+                    "video_response",
+                    models.OneToOneField(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="upload_session",
+                        to="interviews.videoresponse",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Upload Session",
+                "verbose_name_plural": "Upload Sessions",
+                "db_table": "upload_sessions",
+                "indexes": [models.Index(fields=["status", "updated_at"], name="idx_upload_status_updated")],
+            },
+        ),
+    ]
@@ -0,0 +1,26 @@
+import common.object_storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("interviews", "0030_uploadsession"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="uploadsession",
+            name="storage",
+            field=models.CharField(
+                choices=[("local", "Chunked through the API"), ("s3", "Presigned direct to object storage")],
+                default="local",
+                max_length=10,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="videoresponse",
+            name="video_file_path",
+            field=models.FileField(storage=common.object_storage.video_storage, upload_to="video_responses/%Y/%m/%d/"),
+        ),
+    ]
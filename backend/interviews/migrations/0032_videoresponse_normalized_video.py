@@ -0,0 +1,33 @@
+import common.object_storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("interviews", "0031_video_object_storage"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="videoresponse",
+            name="normalized_video",
+            field=models.FileField(
+                blank=True,
+                help_text="Constant frame rate, faststart MP4 rendition of the upload",
+                null=True,
+                storage=common.object_storage.video_storage,
+                upload_to="video_normalized/%Y/%m/%d/",
+            ),
+        ),
+        migrations.AddField(
+            model_name="videoresponse",
+            name="normalization_status",
+            field=models.CharField(
+                choices=[("pending", "Pending"), ("ready", "Ready"), ("failed", "Failed"), ("skipped", "Skipped")],
+                default="pending",
+                help_text="State of the normalized rendition; consumers fall back to the original until 'ready'",
+                max_length=20,
+            ),
+        ),
+    ]
@@ -0,0 +1,20 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("interviews", "0032_videoresponse_normalized_video"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="uploadsession",
+            name="chunk_lease_until",
+            field=models.DateTimeField(
+                blank=True,
+                help_text="Set while a chunk request is writing; other chunks are rejected until it passes",
+                null=True,
+            ),
+        ),
+    ]
@@ -1,9 +1,12 @@
+import uuid
+
 from django.db import models
 from django.conf import settings
 from applicants.models import Applicant, OfficeLocation
 from .type_models import PositionType, QuestionType
 from django.utils.functional import cached_property
 from django.utils import timezone
+from common.object_storage import video_storage
 
 # Controlled competency list for initial interview screening
 COMPETENCY_CHOICES = [
@@ -268,29 +271,29 @@ class Interview(models.Model):
                     result.hr_decision_at = timezone.now()
                 result.save(update_fields=["hr_decision", "hr_decision_at"])
     
-    def check_authenticity(self):
+    def check_authenticity(self, script_reading_statuses=None):
         """
         Check if any video responses are flagged for script reading
         Updates authenticity_flag and authenticity_status
+        
+        Pass script_reading_statuses when the caller already has the video
+        responses in memory to skip re-reading them.
         """
-        suspicious_count = self.video_responses.filter(
-            script_reading_status='suspicious'
-        ).count()
-        high_risk_count = self.video_responses.filter(
-            script_reading_status='high_risk'
-        ).count()
+        if script_reading_statuses is None:
+            script_reading_statuses = self.video_responses.values_list('script_reading_status', flat=True)
+        statuses = set(script_reading_statuses)
         
-        if high_risk_count > 0:
+        if 'high_risk' in statuses:
             self.authenticity_flag = True
             self.authenticity_status = 'under_investigation'
-        elif suspicious_count > 0:
+        elif 'suspicious' in statuses:
             self.authenticity_flag = True
             self.authenticity_status = 'under_investigation'
         else:
             self.authenticity_flag = False
             self.authenticity_status = 'verified'
         
-        self.save()
+        self.save(update_fields=['authenticity_flag', 'authenticity_status'])
         return self.authenticity_status
     
     @cached_property
@@ -363,13 +366,55 @@ class VideoResponse(models.Model):
     
     interview = models.ForeignKey(Interview, on_delete=models.CASCADE, related_name='video_responses')
     question = models.ForeignKey(InterviewQuestion, on_delete=models.CASCADE, related_name='responses')
-    video_file_path = models.FileField(upload_to='video_responses/%Y/%m/%d/')
+    video_file_path = models.FileField(upload_to='video_responses/%Y/%m/%d/', storage=video_storage)
     duration = models.DurationField(help_text="Duration of the video response")
     uploaded_at = models.DateTimeField(auto_now_add=True)
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='uploaded')
     
+    TRANSCRIPT_STATUS_CHOICES = [
+        ('pending', 'Pending'),
+        ('processing', 'Processing'),
+        ('ready', 'Ready'),
+        ('failed', 'Failed'),
+    ]
+
     # AI Analysis fields (stored directly for quick access)
     transcript = models.TextField(blank=True, help_text="Transcribed text from video")
+    transcript_status = models.CharField(
+        max_length=20,
+        choices=TRANSCRIPT_STATUS_CHOICES,
+        default='pending',
+        help_text="Readiness of the transcript produced by the transcription worker"
+    )
+    transcript_error = models.TextField(blank=True, help_text="Last transcription error, if any")
+    transcribed_at = models.DateTimeField(null=True, blank=True)
+    analysis_proxy = models.FileField(
+        upload_to='analysis_proxies/',
+        null=True,
+        blank=True,
+        help_text="Low-res frame proxy written during transcription, read by script detection"
+    )
+
+    NORMALIZATION_STATUS_CHOICES = [
+        ('pending', 'Pending'),
+        ('ready', 'Ready'),
+        ('failed', 'Failed'),
+        ('skipped', 'Skipped'),
+    ]
+
+    normalized_video = models.FileField(
+        upload_to='video_normalized/%Y/%m/%d/',
+        storage=video_storage,
+        null=True,
+        blank=True,
+        help_text="Constant frame rate, faststart MP4 rendition of the upload"
+    )
+    normalization_status = models.CharField(
+        max_length=20,
+        choices=NORMALIZATION_STATUS_CHOICES,
+        default='pending',
+        help_text="State of the normalized rendition; consumers fall back to the original until 'ready'"
+    )
     ai_score = models.FloatField(null=True, blank=True, help_text="AI-generated score (0-100)")
     sentiment = models.FloatField(null=True, blank=True, help_text="Sentiment score")
     
@@ -427,13 +472,77 @@ class VideoResponse(models.Model):
     
     def __str__(self):
         return f"Response: {self.interview.applicant.full_name} - Q{self.question.order}"
-    
+
+    @property
+    def playback_file(self):
+        """Normalized rendition when ready, else the original upload"""
+        if self.normalization_status == 'ready' and self.normalized_video:
+            return self.normalized_video
+        return self.video_file_path
+
+    @property
+    def transcript_ready(self):
+        """True once the transcription worker has finished (even with an empty transcript)"""
+        return self.transcript_status == 'ready'
+
     @property
     def final_score(self):
         """Return HR override score if exists, otherwise AI score"""
         return self.hr_override_score if self.hr_override_score is not None else self.ai_score
 
 
+class UploadSession(models.Model):
+    """Resumable chunked upload of one video response (see interviews/uploads.py)"""
+    
+    STATUS_CHOICES = [
+        ('uploading', 'Uploading'),
+        ('completed', 'Completed'),
+        ('failed', 'Failed'),
+    ]
+    
+    STORAGE_CHOICES = [
+        ('local', 'Chunked through the API'),
+        ('s3', 'Presigned direct to object storage'),
+    ]
+    
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    interview = models.ForeignKey(Interview, on_delete=models.CASCADE, related_name='upload_sessions')
+    question = models.ForeignKey(InterviewQuestion, on_delete=models.CASCADE, related_name='upload_sessions')
+    duration = models.DurationField(help_text="Duration of the video response")
+    file_name = models.CharField(max_length=255, help_text="Storage name chunks are appended to")
+    total_size = models.BigIntegerField(help_text="Declared size of the complete file in bytes")
+    received_bytes = models.BigIntegerField(default=0, help_text="Bytes written so far; the next chunk's offset")
+    chunk_lease_until = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text="Set while a chunk request is writing; other chunks are rejected until it passes"
+    )
+    checksum = models.CharField(max_length=64, help_text="Declared SHA-256 of the complete file (hex)")
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='uploading')
+    storage = models.CharField(max_length=10, choices=STORAGE_CHOICES, default='local')
+    video_response = models.OneToOneField(
+        VideoResponse,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='upload_session'
+    )
+    
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    
+    class Meta:
+        db_table = 'upload_sessions'
+        verbose_name = 'Upload Session'
+        verbose_name_plural = 'Upload Sessions'
+        indexes = [
+            models.Index(fields=['status', 'updated_at'], name='idx_upload_status_updated'),
+        ]
+    
+    def __str__(self):
+        return f"Upload {self.id} - interview {self.interview_id} ({self.received_bytes}/{self.total_size})"
+
+
 class AIAnalysis(models.Model):
     """Model for AI analysis results of video responses"""
     
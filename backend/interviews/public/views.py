@@ -17,7 +17,8 @@ from .serializers import (
     PublicInterviewSerializer,
     PublicJobPositionSerializer,
 )
-from interviews.tasks import process_complete_interview
+from interviews.tasks import enqueue_transcription, process_complete_interview
+from interviews.uploads import ChunkedUploadMixin
 from interviews.question_selection import select_questions_for_interview, select_questions_for_interview_with_metadata
 
 logger = logging.getLogger(__name__)
@@ -92,7 +93,7 @@ class PublicInterviewCreateView(generics.CreateAPIView):
         return Response(serializer.data, status=status.HTTP_201_CREATED)
 
 
-class PublicInterviewViewSet(viewsets.ModelViewSet):
+class PublicInterviewViewSet(ChunkedUploadMixin, viewsets.ModelViewSet):
     permission_classes = [AllowAny]
     authentication_classes = []
     serializer_class = PublicInterviewSerializer
@@ -158,6 +159,10 @@ class PublicInterviewViewSet(viewsets.ModelViewSet):
             duration=serializer.validated_data["duration"],
             status="uploaded",
         )
+        return Response(self.video_response_created(interview, video_response), status=status.HTTP_201_CREATED)
+
+    def video_response_created(self, interview, video_response):
+        """Post-upload steps shared by video-response and chunked uploads; returns the response payload"""
         now = timezone.now()
         if interview.status == "pending":
             interview.status = "in_progress"
@@ -166,37 +171,43 @@ class PublicInterviewViewSet(viewsets.ModelViewSet):
         interview.current_question_index = _next_question_index(interview, answered_ids)
         interview.save(update_fields=["status", "last_activity_at", "current_question_index"])
 
-        transcript_error = None
-        transcript_text = ""
-
-        try:
-            from interviews.deepgram_service import get_deepgram_service
+        # Transcription runs on the dedicated transcription queue; the upload returns immediately
+        enqueue_transcription(video_response.id)
 
-            deepgram_service = get_deepgram_service()
-            transcript_data = deepgram_service.transcribe_video(
-                video_response.video_file_path.path, video_response_id=video_response.id
-            )
-            transcript_text = transcript_data.get("transcript", "") or ""
-            video_response.transcript = transcript_text
-            video_response.save()
-        except Exception as exc:  # noqa: BLE001 - log and return consistent contract
-            transcript_error = str(exc)
-            transcript_text = ""
-            video_response.transcript = ""
-            video_response.save()
-
-        response_payload = {
+        return {
             "video_response": {
                 "id": video_response.id,
                 "question_id": video_response.question_id,
-                "transcript": transcript_text,
+                "transcript": video_response.transcript,
                 "status": video_response.status,
+                "transcript_status": video_response.transcript_status,
             },
-            "transcript_ready": bool(transcript_text),
-            "transcription_error": transcript_error,
+            "transcript_ready": video_response.transcript_ready,
+            "transcription_error": None,
         }
 
-        return Response(response_payload, status=status.HTTP_201_CREATED)
+    @action(
+        detail=True,
+        methods=["get"],
+        url_path="transcripts",
+        permission_classes=[AllowAny],
+        authentication_classes=[],
+    )
+    def transcripts(self, request, pk=None):
+        interview = self.get_object()
+        # Unauthenticated: the stored error text stays internal, only the failure is reported
+        rows = interview.video_responses.values("id", "question_id", "transcript_status")
+        payload = [
+            {
+                "id": row["id"],
+                "question_id": row["question_id"],
+                "transcript_status": row["transcript_status"],
+                "transcript_ready": row["transcript_status"] == "ready",
+                "transcription_failed": row["transcript_status"] == "failed",
+            }
+            for row in rows
+        ]
+        return Response({"video_responses": payload}, status=status.HTTP_200_OK)
 
     @action(
         detail=True,
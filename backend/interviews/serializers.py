@@ -13,6 +13,7 @@ from .type_serializers import JobCategorySerializer, QuestionTypeSerializer
 from applicants.serializers import ApplicantListSerializer
 from applicants.models import OfficeLocation
 from django.db.models import Q
+from django.conf import settings
 from applicants.models import Applicant
 
 
@@ -237,6 +238,7 @@ class VideoResponseSerializer(serializers.ModelSerializer):
             'uploaded_at',
             'status',
             'transcript',
+            'transcript_status',
             'ai_score',
             'sentiment',
             'hr_override_score',
@@ -255,6 +257,7 @@ class VideoResponseSerializer(serializers.ModelSerializer):
             'uploaded_at',
             'status',
             'transcript',
+            'transcript_status',
             'ai_score',
             'sentiment',
             'hr_reviewed_at',
@@ -285,6 +288,21 @@ class VideoResponseCreateSerializer(serializers.Serializer):
         return value
 
 
+class UploadSessionCreateSerializer(serializers.Serializer):
+    """Serializer for starting a resumable chunked video upload"""
+    
+    question_id = serializers.IntegerField(required=True)
+    duration = serializers.DurationField(required=True)
+    file_name = serializers.CharField(required=False, allow_blank=True, max_length=255)
+    total_size = serializers.IntegerField(required=True, min_value=1)
+    checksum = serializers.RegexField(r'^[0-9a-fA-F]{64}$', required=True, help_text="SHA-256 of the file (hex)")
+    
+    def validate_total_size(self, value):
+        if value > settings.VIDEO_UPLOAD_MAX_SIZE:
+            raise serializers.ValidationError(f"Video is larger than {settings.VIDEO_UPLOAD_MAX_SIZE} bytes.")
+        return value
+
+
 class HRDecisionSerializer(serializers.Serializer):
     """Serializer for HR interview decision updates"""
 
@@ -585,7 +603,9 @@ class ProcessingStatusResponseSerializer(serializers.Serializer):
     
     status = serializers.CharField()
     progress = ProcessingProgressSerializer()
+    stage = serializers.DictField(allow_null=True, help_text="Last stage transition: name, status, video_response_id")
     estimated_time_remaining = serializers.CharField()
+    estimated_seconds_remaining = serializers.IntegerField()
     message = serializers.CharField(required=False)
 
 
@@ -0,0 +1,241 @@
+"""
+Video playback for HR review
+
+    GET /api/video-responses/{id}/stream/?token=...
+
+Review payloads link here (stream_url) instead of the raw media URL, which is
+only served by Django when DEBUG. A <video> element cannot send the JWT
+header, so each link carries a short-lived signed token bound to the video
+and the HR user; a normal Authorization header works as well. The token is
+stamped with the start of the current half of VIDEO_STREAM_TOKEN_MAX_AGE
+rather than the signing time, so review payloads return the same URL for
+that long and the browser cache keeps hitting.
+
+Playback seeks with Range requests. Depending on where the file is:
+- object storage: redirect to a presigned GET URL, the bucket answers ranges
+- VIDEO_STREAM_OFFLOAD = 'x-accel-redirect' / 'x-sendfile': only the headers
+  are produced here; nginx (internal location at VIDEO_STREAM_ACCEL_PREFIX)
+  or Apache sends the bytes and handles Range / If-Range itself
+- otherwise a FileResponse (sendfile under gunicorn for full responses) with
+  single-range 206 support, If-Range validation and 304s.
+
+Responses carry ETag, Last-Modified and a private Cache-Control, so the
+browser revalidates instead of downloading an answer again.
+"""
+
+import mimetypes
+import os
+import re
+import time
+from urllib.parse import quote
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core import signing
+from django.http import FileResponse, HttpResponse, HttpResponseRedirect
+from django.shortcuts import get_object_or_404
+from django.urls import reverse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, parse_http_date_safe
+from rest_framework import exceptions
+from rest_framework.authentication import BaseAuthentication
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.renderers import JSONRenderer
+from rest_framework.views import APIView
+from rest_framework_simplejwt.authentication import JWTAuthentication
+
+from common.permissions import IsHRUser
+from common.renderers import MediaStreamRenderer
+from .models import VideoResponse
+
+TOKEN_SALT = 'interviews.video-stream'
+RANGE_PATTERN = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+
+def stream_token(video_response_id, user, now=None):
+    """
+    Signed playback token, identical for every call within one issue window
+
+    A token issued at the end of its window is still valid for half of
+    VIDEO_STREAM_TOKEN_MAX_AGE.
+    """
+    window = max(1, settings.VIDEO_STREAM_TOKEN_MAX_AGE // 2)
+    now = time.time() if now is None else now
+    issued = int(now // window) * window
+    return signing.Signer(salt=TOKEN_SALT).sign_object(
+        {'video_response_id': video_response_id, 'user_id': user.pk, 'issued': issued}
+    )
+
+
+def stream_url(request, video_response, absolute=True):
+    """Playback URL for the review payloads, signed for the requesting user; None without a file"""
+    if not video_response.playback_file:
+        return None
+    url = reverse('video-response-stream', args=[video_response.id])
+    user = getattr(request, 'user', None)
+    if user is not None and user.is_authenticated:
+        url = f"{url}?token={stream_token(video_response.id, user)}"
+    return request.build_absolute_uri(url) if absolute and request is not None else url
+
+
+class StreamTokenAuthentication(BaseAuthentication):
+    """Authenticates the ?token= of a stream_url; request.auth holds the signed payload"""
+
+    def authenticate(self, request):
+        token = request.query_params.get('token')
+        if not token:
+            return None
+        try:
+            payload = signing.Signer(salt=TOKEN_SALT).unsign_object(token)
+        except signing.BadSignature:
+            raise exceptions.AuthenticationFailed('Invalid video token')
+        if time.time() - payload.get('issued', 0) > settings.VIDEO_STREAM_TOKEN_MAX_AGE:
+            raise exceptions.AuthenticationFailed('Video link expired; reload the review')
+
+        user = get_user_model().objects.filter(pk=payload.get('user_id'), is_active=True).first()
+        if user is None:
+            raise exceptions.AuthenticationFailed('Invalid video token')
+        return user, payload
+
+
+def parse_range(header, size):
+    """
+    (start, end) inclusive for a single `bytes=` range, None to serve the whole file
+
+    Raises ValueError when the range cannot be satisfied. Multiple ranges are
+    answered with the whole file, which RFC 9110 allows.
+    """
+    match = RANGE_PATTERN.match(header.strip())
+    if not match:
+        return None
+    first, last = match.groups()
+    if not first and not last:
+        return None
+    if not first:
+        # Suffix range: the last N bytes
+        length = int(last)
+        if length == 0:
+            raise ValueError('Empty suffix range')
+        return max(0, size - length), size - 1
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or end < start:
+        raise ValueError('Range not satisfiable')
+    return start, end
+
+
+def if_range_matches(request, etag, last_modified):
+    """True if a Range may be honoured: no If-Range, or it names the current version"""
+    if_range = request.headers.get('If-Range')
+    if not if_range:
+        return True
+    if if_range.startswith('W/'):
+        # Weak validators never satisfy If-Range
+        return False
+    if if_range.startswith('"'):
+        return if_range == etag
+    return parse_http_date_safe(if_range) == int(last_modified)
+
+
+class RangeFile:
+    """Read-only view of `length` bytes of a file; FileResponse streams it to the end"""
+
+    def __init__(self, file, start, length):
+        file.seek(start)
+        self.file = file
+        self.remaining = length
+
+    def read(self, size=-1):
+        if self.remaining <= 0:
+            return b''
+        size = self.remaining if size is None or size < 0 else min(size, self.remaining)
+        data = self.file.read(size)
+        self.remaining -= len(data)
+        return data
+
+    def close(self):
+        self.file.close()
+
+
+def _validators(path):
+    stat = os.stat(path)
+    return f'"{int(stat.st_mtime):x}-{stat.st_size:x}"', stat.st_mtime, stat.st_size
+
+
+def _cache_headers(response, etag, last_modified):
+    response['ETag'] = etag
+    response['Last-Modified'] = http_date(last_modified)
+    response['Accept-Ranges'] = 'bytes'
+    patch_cache_control(response, private=True, max_age=settings.VIDEO_STREAM_MAX_AGE)
+    return response
+
+
+def _offload_response(field_file, path, content_type):
+    offload = settings.VIDEO_STREAM_OFFLOAD
+    response = HttpResponse(content_type=content_type)
+    if offload == 'x-accel-redirect':
+        response['X-Accel-Redirect'] = settings.VIDEO_STREAM_ACCEL_PREFIX.rstrip('/') + '/' + quote(field_file.name)
+    else:
+        response['X-Sendfile'] = path
+    return response
+
+
+def stream_file(request, field_file):
+    """Response playing field_file, honouring Range / If-Range and conditional headers"""
+    try:
+        path = field_file.path
+    except NotImplementedError:
+        # Object storage: the presigned URL supports ranges directly
+        response = HttpResponseRedirect(field_file.url)
+        patch_cache_control(response, private=True, no_store=True)
+        return response
+
+    try:
+        etag, last_modified, size = _validators(path)
+    except FileNotFoundError:
+        return HttpResponse(status=404)
+
+    conditional = get_conditional_response(request, etag=etag, last_modified=int(last_modified))
+    if conditional is not None:
+        return _cache_headers(conditional, etag, last_modified)
+
+    content_type = mimetypes.guess_type(field_file.name)[0] or 'application/octet-stream'
+    if settings.VIDEO_STREAM_OFFLOAD:
+        return _cache_headers(_offload_response(field_file, path, content_type), etag, last_modified)
+
+    byte_range = None
+    range_header = request.headers.get('Range')
+    if range_header and if_range_matches(request, etag, last_modified):
+        try:
+            byte_range = parse_range(range_header, size)
+        except ValueError:
+            response = HttpResponse(status=416)
+            response['Content-Range'] = f'bytes */{size}'
+            return _cache_headers(response, etag, last_modified)
+
+    if byte_range is None:
+        response = FileResponse(open(path, 'rb'), content_type=content_type)
+        return _cache_headers(response, etag, last_modified)
+
+    start, end = byte_range
+    length = end - start + 1
+    response = FileResponse(RangeFile(open(path, 'rb'), start, length), status=206, content_type=content_type)
+    response['Content-Length'] = str(length)
+    response['Content-Range'] = f'bytes {start}-{end}/{size}'
+    return _cache_headers(response, etag, last_modified)
+
+
+class VideoResponseStreamView(APIView):
+    """Seekable playback of one video response (the normalized rendition once ready)"""
+
+    authentication_classes = [JWTAuthentication, StreamTokenAuthentication]
+    permission_classes = [IsAuthenticated, IsHRUser]
+    renderer_classes = [JSONRenderer, MediaStreamRenderer]
+
+    def get(self, request, pk):
+        if isinstance(request.auth, dict) and request.auth.get('video_response_id') != pk:
+            raise exceptions.PermissionDenied('Token is for another video')
+        video_response = get_object_or_404(VideoResponse, pk=pk)
+        if not video_response.playback_file:
+            return HttpResponse(status=404)
+        return stream_file(request, video_response.playback_file)
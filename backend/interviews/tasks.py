@@ -2,10 +2,12 @@
 Celery tasks for bulk interview processing
 """
 
-from celery import shared_task, group
+from celery import shared_task, group, chain, chord
+from django.conf import settings
 from django.utils import timezone
 from django.db import transaction
 import logging
+import os
 import time
 
 logger = logging.getLogger(__name__)
@@ -16,247 +18,630 @@ def process_complete_interview(self, interview_id):
     """
     Process all video responses in BULK after interview submission
     
-    Workflow:
-    1. Get all video responses for interview
-    2. Transcribe all videos in parallel (using batch_transcribe_and_analyze)
-    3. Analyze all transcripts in ONE API call
-    4. Detect script reading for each video
-    5. Save results and calculate score
+    Marks the interview as processing and launches the stage pipeline
+    (see build_interview_pipeline):
+    1. ensure_transcript - one task per video, skips videos the transcription
+       worker already finished
+    2. analyze_interview_transcripts - ONE Gemini batch call for all transcripts,
+       in parallel with detect_video_script_reading - one task per video
+    3. finalize_interview - chord callback: authenticity, scoring, result, notification
     
-    Benefits:
-    - Faster: Parallel transcription + Single API call for analysis
-    - Cost-effective: Fewer API calls
-    - Consistent: Uses same optimized logic as synchronous fallback
+    Every stage persists its output before returning and retries on its own,
+    so a failure only redoes the failed stage, and stages can be routed to
+    different worker pools (OpenCV on CPU workers, API calls on IO workers).
     """
-    from interviews.models import Interview, VideoResponse, AIAnalysis
+    from interviews.models import Interview
     from processing.models import ProcessingQueue
-    from interviews.ai_service import get_ai_service
-    from interviews.ai import detect_script_reading
+    from processing.status import publish as publish_status
     
-    monotonic_start = time.monotonic()
-    interview = None
-    queue_entry = None
-
     try:
         interview = Interview.objects.get(id=interview_id)
     except Interview.DoesNotExist:
         logger.error(f"Interview {interview_id} not found")
         raise
 
+    logger.info(f"AI analysis started for interview {interview_id}")
+
+    # Guard against duplicate processing runs
+    if interview.status in ['processing', 'completed']:
+        logger.info(f"Interview {interview_id} already in status '{interview.status}', continuing with processing run.")
+
+    # Get processing queue entry
+    queue_entry = ProcessingQueue.objects.filter(
+        interview=interview,
+        processing_type='bulk_analysis'
+    ).order_by('-created_at').first()
+    if queue_entry:
+        queue_entry.status = 'processing'
+        queue_entry.started_at = timezone.now()
+        queue_entry.celery_task_id = self.request.id or ''
+        queue_entry.save(update_fields=['status', 'started_at', 'celery_task_id'])
+        publish_status(queue_entry)
+    else:
+        logger.warning(f"No processing queue found for interview {interview_id}")
+    
+    # Update interview status
+    interview.status = 'processing'
+    interview.save(update_fields=['status'])
+    
+    video_response_ids = list(interview.video_responses.order_by('id').values_list('id', flat=True))
+    pipeline = build_interview_pipeline(interview_id, video_response_ids)
+    
+    # Synchronous callers (e.g. run_pending_interview_analysis) run every stage in-process
+    if self.request.is_eager:
+        pipeline.apply()
+        return {'status': 'success', 'interview_id': interview_id, 'videos_processed': len(video_response_ids)}
+    
+    pipeline.apply_async()
+    return {'status': 'queued', 'interview_id': interview_id, 'videos_processed': len(video_response_ids)}
+
+# Single public entry point for background analysis
+analyze_interview = process_complete_interview
+
+
+def build_interview_pipeline(interview_id, video_response_ids):
+    """
+    Celery canvas for one interview
+    
+    chain(
+        group(ensure_transcript per video),
+        chord([analyze_interview_transcripts] + [detect_video_script_reading per video],
+              finalize_interview),
+    )
+    All signatures are immutable: stages hand over state through the database,
+    not through task results, which is what makes each one resumable.
+    """
+    finalize = finalize_interview.si(interview_id)
+    on_error = mark_interview_failed.si(interview_id)
+    if not video_response_ids:
+        return finalize.on_error(on_error)
+    
+    transcription = group(ensure_transcript.si(vr_id) for vr_id in video_response_ids)
+    analysis = group(
+        [analyze_interview_transcripts.si(interview_id)]
+        + [detect_video_script_reading.si(vr_id) for vr_id in video_response_ids]
+    )
+    return chain(transcription, chord(analysis, finalize)).on_error(on_error)
+
+
+@shared_task(bind=True, max_retries=3)
+def ensure_transcript(self, video_response_id, waited=0, failures=0):
+    """
+    Pipeline stage: make sure one video has a settled transcript
+    
+    While the upload-triggered transcription is still queued or running,
+    the task re-queues itself every TRANSCRIPT_WAIT_POLL_INTERVAL seconds
+    instead of sleeping, so it never holds a worker slot that transcription
+    needs. It only transcribes inline once TRANSCRIPT_WAIT_TIMEOUT has passed
+    or the upload transcription failed. A video that cannot be transcribed is
+    marked failed rather than failing the pipeline; analysis treats it as a
+    technical issue.
+    """
+    from django.conf import settings
+    from interviews.models import VideoResponse
+    
+    try:
+        video_response = VideoResponse.objects.get(id=video_response_id)
+    except VideoResponse.DoesNotExist:
+        logger.error(f"VideoResponse {video_response_id} not found for transcription")
+        return {'status': 'missing', 'video_response_id': video_response_id}
+    
+    if video_response.transcript_ready:
+        return {'status': 'skipped', 'video_response_id': video_response_id}
+    
+    if video_response.transcript_status in ('pending', 'processing') and waited < settings.TRANSCRIPT_WAIT_TIMEOUT:
+        poll_interval = settings.TRANSCRIPT_WAIT_POLL_INTERVAL
+        raise self.retry(
+            kwargs={'waited': waited + poll_interval, 'failures': failures},
+            countdown=poll_interval,
+            max_retries=None,
+        )
+    
+    logger.warning(f"Video {video_response_id} has no transcript after {waited}s, transcribing now...")
     try:
-        logger.info(f"AI analysis started for interview {interview_id}")
+        transcript = transcribe_and_store(video_response, task=self)
+    except Exception as e:
+        logger.error(f"Failed to transcribe video {video_response_id}: {e}")
+        if failures < self.max_retries:
+            raise self.retry(
+                exc=e,
+                kwargs={'waited': waited, 'failures': failures + 1},
+                countdown=10 * (failures + 1),
+                max_retries=None,
+            )
+        VideoResponse.objects.filter(id=video_response_id).update(
+            transcript='',
+            transcript_status='failed',
+            transcript_error=str(e),
+        )
+        return {'status': 'failed', 'video_response_id': video_response_id, 'error': str(e)}
+    
+    return {'status': 'success', 'video_response_id': video_response_id, 'transcript_length': len(transcript)}
 
-        # Guard against duplicate processing runs
-        if interview.status in ['processing', 'completed']:
-            logger.info(f"Interview {interview_id} already in status '{interview.status}', continuing with processing run.")
 
-        # Get processing queue entry
-        try:
-            queue_entry = ProcessingQueue.objects.filter(
-                interview=interview,
-                processing_type='bulk_analysis'
-            ).latest('created_at')
-            
-            queue_entry.status = 'processing'
-            queue_entry.started_at = timezone.now()
-            queue_entry.save(update_fields=['status', 'started_at'])
-        except ProcessingQueue.DoesNotExist:
-            logger.warning(f"No processing queue found for interview {interview_id}")
-            queue_entry = None
-        
-        # Update interview status
-        interview.status = 'processing'
-        interview.save(update_fields=['status'])
-        
-        # Get all video responses
-        video_responses = list(interview.video_responses.all())
-        logger.info(f"Found {len(video_responses)} video responses to process")
-        
-        # Check if transcripts are already available (from upload step)
-        from interviews.deepgram_service import get_deepgram_service
-        
-        videos_needing_transcription = [vr for vr in video_responses if not vr.transcript]
-        
-        # Transcribe any videos that don't have transcripts yet (fallback)
-        if videos_needing_transcription:
-            logger.warning(f"Found {len(videos_needing_transcription)} videos without transcripts, transcribing now...")
-            deepgram_service = get_deepgram_service()
-            for vr in videos_needing_transcription:
-                try:
-                    transcript_data = deepgram_service.transcribe_video(
-                        vr.video_file_path.path,
-                        video_response_id=vr.id
-                    )
-                    vr.transcript = transcript_data['transcript']
-                    vr.save()
-                    logger.info(f"Transcribed video {vr.id}")
-                except Exception as trans_error:
-                    logger.error(f"Failed to transcribe video {vr.id}: {trans_error}")
-                    vr.transcript = ""
-                    vr.save()
+@shared_task(bind=True, max_retries=3)
+def analyze_interview_transcripts(self, interview_id):
+    """
+    Pipeline stage: analyze all transcripts of an interview in ONE API call
+    
+    Results are upserted, so a retry simply rewrites them.
+    """
+    from interviews.models import Interview
+    from interviews.ai_service import get_ai_service
+    from interviews import analysis_batcher
+    from interviews.scoring import get_role_prompt_context
+    from processing.tracking import track_stage
+    
+    try:
+        with track_stage('llm_analysis', interview_id=interview_id, task=self) as stage:
+            interview = Interview.objects.select_related('position_type').get(id=interview_id)
+            video_responses = list(
+                interview.video_responses.select_related('question', 'question__question_type').order_by('id')
+            )
         
-        role = interview.position_type
-        role_name = role.name if role else None
-        role_code = role.code if role else None
-        role_context = role.description_context or role.description if role else None
-        from interviews.scoring import get_role_prompt_context
-
-        prompt_context = get_role_prompt_context(role_code)
-        core_competencies = prompt_context.get("core_competencies") or None
-        role_profile = prompt_context.get("role_profile") or None
-        role_profile = prompt_context.get("role_profile") or None
-
-        # Prepare data for BATCH LLM ANALYSIS (transcripts already stored)
-        transcripts_data = [
-            {
-                'video_id': vr.id,
-                'transcript': vr.transcript,
-                'question_text': vr.question.question_text,
-                'question_type': vr.question.question_type.name if vr.question.question_type else 'general',
-                'question_competency': vr.question.competency,
-            }
-            for vr in video_responses
-        ]
+            role = interview.position_type
+            role_name = role.name if role else None
+            role_code = role.code if role else None
+            role_context = role.description_context or role.description if role else None
+            prompt_context = get_role_prompt_context(role_code)
+            core_competencies = prompt_context.get("core_competencies") or None
+            role_profile = prompt_context.get("role_profile") or None
+        
+            # Prepare data for BATCH LLM ANALYSIS (transcripts already stored)
+            transcripts_data = [
+                {
+                    'video_id': vr.id,
+                    'transcript': vr.transcript,
+                    'question_text': vr.question.question_text,
+                    'question_type': vr.question.question_type.name if vr.question.question_type else 'general',
+                    'question_competency': vr.question.competency,
+                }
+                for vr in video_responses
+            ]
+        
+            logger.info(f"Running batch LLM analysis for {len(transcripts_data)} transcripts...")
+            analyses = analysis_batcher.analyze_transcripts(
+                get_ai_service(),
+                transcripts_data,
+                interview_id=interview.id,
+                role_name=role_name,
+                role_code=role_code,
+                role_context=role_context,
+                role_profile=role_profile,
+                core_competencies=core_competencies,
+            )
         
-        # Analyze all transcripts in ONE API call
-        logger.info(f"Running batch LLM analysis for {len(transcripts_data)} transcripts...")
-        ai_service = get_ai_service()
-        analyses = ai_service.batch_analyze_transcripts(
-            transcripts_data,
-            interview_id=interview.id,
-            role_name=role_name,
-            role_code=role_code,
-            role_context=role_context,
-            role_profile=role_profile,
-            core_competencies=core_competencies,
+            saved = save_analysis_results(video_responses, analyses)
+            stage.log(f"Saved {saved} analyses for {len(video_responses)} videos")
+    except Exception as e:
+        logger.error(f"Batch analysis failed for interview {interview_id}: {e}", exc_info=True)
+        raise self.retry(exc=e, countdown=60 * (self.request.retries + 1))
+    
+    return {'status': 'success', 'interview_id': interview_id, 'analyses_saved': saved}
+
+
+@shared_task(
+    bind=True,
+    max_retries=2,
+    soft_time_limit=settings.SCRIPT_DETECTION_TIMEOUT,
+    time_limit=settings.SCRIPT_DETECTION_TIMEOUT + 30,
+)
+def detect_video_script_reading(self, video_response_id):
+    """
+    Pipeline stage: script reading detection for one video
+    
+    Reads the low-res proxy from the transcription pass when available and
+    deletes it afterwards; nothing else reads it.
+    Detection runs inline in the worker process, reusing the face detector
+    loaded at worker_process_init; the task's soft time limit
+    (SCRIPT_DETECTION_TIMEOUT) stops a decode that hangs. Detection errors
+    and timeouts are recorded as a 'clear' result carrying the error, so one
+    bad file cannot fail the interview.
+    """
+    from interviews.models import VideoResponse
+    from interviews.ai import start_script_detection
+    from interviews.media_pipeline import detection_input, discard_proxy
+    from processing.tracking import track_stage
+    
+    try:
+        video_response = VideoResponse.objects.get(id=video_response_id)
+    except VideoResponse.DoesNotExist:
+        logger.error(f"VideoResponse {video_response_id} not found for script detection")
+        return {'status': 'missing', 'video_response_id': video_response_id}
+    
+    with track_stage('script_detection', video_response_id=video_response_id, task=self) as stage, \
+            detection_input(video_response) as source_path:
+        detection = start_script_detection(
+            {video_response_id: source_path}, executor='inline'
+        ).results()[video_response_id]
+        if 'error' in detection['data']:
+            stage.log(f"Script detection error for video {video_response_id}: {detection['data']['error']}", level='warning')
+        
+        VideoResponse.objects.filter(id=video_response_id).update(
+            script_reading_status=detection['status'],
+            script_reading_data=detection['data'],
+            analysis_proxy='',
         )
+    discard_proxy(video_response_id)
+    logger.info(f"Script detection for video {video_response_id}: {detection['status']}")
+    return {'status': detection['status'], 'video_response_id': video_response_id}
+
+
+@shared_task(bind=True, max_retries=3)
+def finalize_interview(self, interview_id):
+    """
+    Pipeline stage (chord callback): authenticity, scoring, result and notification
+    """
+    from interviews.models import Interview
+    from processing.models import ProcessingQueue
+    from processing.tracking import track_stage
+    
+    try:
+        with track_stage('scoring', interview_id=interview_id, task=self):
+            interview = Interview.objects.select_related('applicant', 'position_type').get(id=interview_id)
+            video_responses = list(interview.video_responses.select_related('question'))
         
-        # Save LLM analysis results to database
-        for video_response, analysis_result in zip(video_responses, analyses):
-            try:
-                # Check if transcript is empty (technical issue)
-                is_technical_issue = not video_response.transcript or len(video_response.transcript.strip()) == 0
-                
-                # Detect script reading
-                try:
-                    script_detection = detect_script_reading(video_response.video_file_path.path)
-                except Exception as e:
-                    logger.error(f"Script detection failed for video {video_response.id}: {e}")
-                    script_detection = {'status': 'clear', 'risk_score': 0, 'data': {'error': str(e)}}
-                
-                with transaction.atomic():
-                    if is_technical_issue:
-                        # For technical issues, don't create AI analysis, just flag the video
-                        video_response.ai_score = None
-                        video_response.sentiment = None
-                        video_response.script_reading_status = script_detection['status']
-                        video_response.script_reading_data = script_detection['data']
-                        video_response.processed = True
-                        video_response.status = 'analyzed'
-                        video_response.save()
-                        logger.warning(f"Video {video_response.id} has no transcript (technical issue)")
-                    else:
-                        # Save AI analysis
-                        AIAnalysis.objects.update_or_create(
-                            video_response=video_response,
-                            defaults={
-                                'transcript_text': video_response.transcript,  # Already stored from upload
-                                'sentiment_score': analysis_result.get('sentiment_score', 50.0),
-                                'confidence_score': analysis_result.get('confidence_score', 50.0),
-                                'speech_clarity_score': analysis_result.get('speech_clarity_score', 50.0),
-                                'content_relevance_score': analysis_result.get('content_relevance_score', 50.0),
-                                'overall_score': analysis_result.get('overall_score', 50.0),
-                                'recommendation': analysis_result.get('recommendation', 'review'),
-                                'body_language_analysis': {},
-                                'langchain_analysis_data': {
-                                    'analysis_summary': analysis_result.get('analysis_summary', ''),
-                                    'raw_scores': analysis_result
-                                }
-                            }
-                        )
-                        
-                        # Update video_response with scores
-                        video_response.ai_score = analysis_result.get('overall_score', 50.0)
-                        video_response.sentiment = analysis_result.get('sentiment_score', 50.0)
-                        video_response.script_reading_status = script_detection['status']
-                        video_response.script_reading_data = script_detection['data']
-                        video_response.processed = True
-                        video_response.status = 'analyzed'
-                        video_response.save()
-                        logger.info(f"Saved LLM analysis for video {video_response.id}")
-            except Exception as save_error:
-                logger.error(f"Failed to save analysis for video {video_response.id}: {save_error}")
-                video_response.status = 'failed'
-                video_response.save()
-        
-        logger.info("All video analyses complete. Checking authenticity...")
-        
-        # Check for script reading and update interview-level authenticity flag
-        interview.check_authenticity()
-        interview.refresh_from_db()
-        
-        logger.info("Calculating interview score...")
-        
-        # Calculate overall score
-        calculate_interview_score(interview_id)
-        
-        # Create final result
-        create_interview_result(interview_id)
-        
-        # Update interview status
-        interview.status = 'completed'
-        interview.completed_at = timezone.now()
-        interview.save(update_fields=['status', 'completed_at'])
-        
-        # Update queue
-        if queue_entry:
-            queue_entry.status = 'completed'
-            queue_entry.completed_at = timezone.now()
-            queue_entry.save(update_fields=['status', 'completed_at'])
-        
-        # Send notification (async)
+            with transaction.atomic():
+                interview.video_responses.exclude(status='failed').update(processed=True, status='analyzed')
+            
+                # Check for script reading and update interview-level authenticity flag
+                interview.check_authenticity([vr.script_reading_status for vr in video_responses])
+            
+                logger.info("Calculating interview score...")
+            
+                # Score once from the loaded responses and create the final result
+                create_interview_result(interview_id, interview=interview, video_responses=video_responses)
+            
+                # Update interview status
+                interview.status = 'completed'
+                interview.completed_at = timezone.now()
+                interview.save(update_fields=['status', 'completed_at'])
+            
+                ProcessingQueue.objects.filter(
+                    interview=interview,
+                    processing_type='bulk_analysis',
+                    status='processing',
+                ).update(status='completed', completed_at=timezone.now())
+    except Exception as e:
+        logger.error(f"Error finalizing interview {interview_id}: {e}", exc_info=True)
+        raise self.retry(exc=e, countdown=30 * (self.request.retries + 1))
+    
+    # Send notification (async)
+    with track_stage('notification', interview_id=interview_id, task=self) as stage:
         try:
             from notifications.tasks import send_result_notification
             send_result_notification.delay(interview_id)
-        except Exception:
+        except Exception as e:
             logger.exception("Failed to queue notification for interview %s", interview_id)
+            stage.log(f"Failed to queue notification: {e}", level='warning')
+    
+    logger.info(f"AI analysis complete for interview {interview_id}")
+    
+    return {
+        'status': 'success',
+        'interview_id': interview_id,
+        'videos_processed': len(video_responses)
+    }
+
+
+@shared_task
+def mark_interview_failed(interview_id):
+    """Pipeline error callback: a stage exhausted its retries"""
+    from interviews.models import Interview
+    from processing.models import ProcessingQueue
+    from processing.status import publish_for_interview
+    
+    logger.error(f"Processing pipeline failed for interview {interview_id}")
+    
+    ProcessingQueue.objects.filter(
+        interview_id=interview_id,
+        processing_type='bulk_analysis',
+        status='processing',
+    ).update(status='failed', error_message='A processing stage failed', completed_at=timezone.now())
+    publish_for_interview(interview_id)
+    
+    try:
+        interview = Interview.objects.get(id=interview_id)
+    except Interview.DoesNotExist:
+        return
+    interview.status = 'failed'
+    interview.completed_at = timezone.now()
+    interview.save(update_fields=['status', 'completed_at'])
+
+
+AI_ANALYSIS_UPDATE_FIELDS = [
+    'transcript_text', 'sentiment_score', 'confidence_score', 'speech_clarity_score',
+    'content_relevance_score', 'overall_score', 'recommendation', 'body_language_analysis',
+    'langchain_analysis_data',
+]
+
+
+def save_analysis_results(video_responses, analyses):
+    """
+    Persist LLM analyses and per-video scores
+    
+    Everything is computed in memory first and written with one upsert and
+    one bulk update, so the query count does not grow with the number of
+    questions. Returns the number of AIAnalysis rows written.
+    """
+    from interviews.models import AIAnalysis, VideoResponse
+    
+    ai_analyses = []
+    for video_response, analysis_result in zip(video_responses, analyses):
+        # Check if transcript is empty (technical issue)
+        if not video_response.transcript or len(video_response.transcript.strip()) == 0:
+            # For technical issues, don't create AI analysis, just flag the video
+            video_response.ai_score = None
+            video_response.sentiment = None
+            logger.warning(f"Video {video_response.id} has no transcript (technical issue)")
+            continue
         
-        elapsed_ms = int((time.monotonic() - monotonic_start) * 1000)
-        logger.info(f"AI analysis complete for interview {interview_id} in {elapsed_ms}ms")
-        
-        return {
-            'status': 'success',
-            'interview_id': interview_id,
-            'videos_processed': len(video_responses)
-        }
-        
+        video_response.ai_score = analysis_result.get('overall_score', 50.0)
+        video_response.sentiment = analysis_result.get('sentiment_score', 50.0)
+        ai_analyses.append(AIAnalysis(
+            video_response=video_response,
+            transcript_text=video_response.transcript,  # Already stored from upload
+            sentiment_score=analysis_result.get('sentiment_score', 50.0),
+            confidence_score=analysis_result.get('confidence_score', 50.0),
+            speech_clarity_score=analysis_result.get('speech_clarity_score', 50.0),
+            content_relevance_score=analysis_result.get('content_relevance_score', 50.0),
+            overall_score=analysis_result.get('overall_score', 50.0),
+            recommendation=analysis_result.get('recommendation', 'review'),
+            body_language_analysis={},
+            langchain_analysis_data={
+                'analysis_summary': analysis_result.get('analysis_summary', ''),
+                'raw_scores': analysis_result
+            },
+        ))
+    
+    with transaction.atomic():
+        if ai_analyses:
+            AIAnalysis.objects.bulk_create(
+                ai_analyses,
+                update_conflicts=True,
+                unique_fields=['video_response'],
+                update_fields=AI_ANALYSIS_UPDATE_FIELDS,
+            )
+        if video_responses:
+            VideoResponse.objects.bulk_update(video_responses, ['ai_score', 'sentiment'])
+    
+    logger.info(f"Saved LLM analysis for {len(ai_analyses)} of {len(video_responses)} videos")
+    return len(ai_analyses)
+
+
+@shared_task(bind=True, max_retries=3)
+def transcribe_video_response(self, video_response_id):
+    """
+    Transcribe a single uploaded video with Deepgram
+    Runs on the dedicated transcription queue so uploads return immediately
+
+    Updates transcript/transcript_status with queryset updates so a concurrent
+    save from the upload request or bulk processing cannot be clobbered.
+    """
+    from interviews.models import VideoResponse
+
+    try:
+        video_response = VideoResponse.objects.get(id=video_response_id)
+    except VideoResponse.DoesNotExist:
+        logger.error(f"VideoResponse {video_response_id} not found for transcription")
+        return {'status': 'missing', 'video_response_id': video_response_id}
+
+    if video_response.transcript_ready:
+        logger.info(f"Transcript for video {video_response_id} already ready, skipping")
+        return {'status': 'skipped', 'video_response_id': video_response_id}
+
+    VideoResponse.objects.filter(id=video_response_id).update(transcript_status='processing')
+
+    try:
+        transcript = transcribe_and_store(video_response, task=self)
     except Exception as e:
-        logger.error(f"Error processing interview {interview_id}: {str(e)}", exc_info=True)
-        
-        # Update queue status
-        if queue_entry:
-            try:
-                queue_entry.status = 'failed'
-                queue_entry.error_message = str(e)
-                queue_entry.completed_at = timezone.now()
-                queue_entry.save(update_fields=['status', 'error_message', 'completed_at'])
-            except Exception:
-                logger.exception("Failed to update queue entry for interview %s", interview_id)
-        
-        # Update interview status
-        if interview:
+        logger.error(f"Transcription failed for video {video_response_id}: {e}")
+        if self.request.retries < self.max_retries:
+            VideoResponse.objects.filter(id=video_response_id).update(
+                transcript_status='pending',
+                transcript_error=str(e),
+            )
+            raise self.retry(exc=e, countdown=10 * (self.request.retries + 1))
+        VideoResponse.objects.filter(id=video_response_id).update(
+            transcript_status='failed',
+            transcript_error=str(e),
+        )
+        return {'status': 'failed', 'video_response_id': video_response_id, 'error': str(e)}
+
+    return {
+        'status': 'success',
+        'video_response_id': video_response_id,
+        'transcript_length': len(transcript)
+    }
+
+
+def transcribe_and_store(video_response, task=None):
+    """
+    Transcribe one video with Deepgram and store the transcript; raises on failure
+
+    The same ffmpeg pass writes the script detection proxy; a partial proxy
+    is removed when transcription fails.
+    """
+    from interviews.models import VideoResponse
+    from interviews.deepgram_service import get_deepgram_service
+    from interviews.media_pipeline import (
+        local_video, proxy_enabled, proxy_name_for, proxy_path_for, proxy_written, remove_proxy,
+    )
+    from processing.tracking import track_stage
+
+    video_response_id = video_response.id
+    proxy_path = proxy_path_for(video_response_id) if proxy_enabled() else None
+
+    try:
+        with track_stage('transcription', video_response_id=video_response_id, task=task), \
+                local_video(video_response) as video_path:
+            transcript_data = get_deepgram_service().transcribe_video(
+                video_path,
+                video_response_id=video_response_id,
+                proxy_path=proxy_path,
+            )
+    except Exception:
+        remove_proxy(proxy_path)
+        raise
+
+    transcript = transcript_data.get('transcript', '') or ''
+    updates = {}
+    if proxy_written(proxy_path):
+        updates['analysis_proxy'] = proxy_name_for(video_response_id)
+    VideoResponse.objects.filter(id=video_response_id).update(
+        transcript=transcript,
+        transcript_status='ready',
+        transcript_error='',
+        transcribed_at=timezone.now(),
+        **updates,
+    )
+    logger.info(f"Transcript stored for video {video_response_id}: {len(transcript)} chars")
+    return transcript
+
+
+@shared_task(bind=True, max_retries=2)
+def normalize_video_response(self, video_response_id):
+    """
+    Write the normalized rendition of one uploaded video
+    Runs on the transcode queue, in parallel with upload transcription
+
+    Transcription only needs the audio, so it never waits for this re-encode,
+    and the transcode pool is separate from the media pool so submit-critical
+    script detection never queues behind it. Once retries are spent the
+    failure is recorded: consumers keep using the original upload.
+    """
+    from interviews.models import VideoResponse
+
+    try:
+        video_response = VideoResponse.objects.get(id=video_response_id)
+    except VideoResponse.DoesNotExist:
+        logger.error(f"VideoResponse {video_response_id} not found for normalization")
+        return {'status': 'missing', 'video_response_id': video_response_id}
+
+    if video_response.normalization_status in ('ready', 'skipped'):
+        return {'status': 'skipped', 'video_response_id': video_response_id}
+
+    try:
+        normalization_status = normalize_and_store(video_response, task=self)
+    except Exception as e:
+        logger.error(f"Normalization failed for video {video_response_id}: {e}")
+        if self.request.retries < self.max_retries:
+            raise self.retry(exc=e, countdown=10 * (self.request.retries + 1))
+        VideoResponse.objects.filter(id=video_response_id).update(normalization_status='failed')
+        return {'status': 'failed', 'video_response_id': video_response_id, 'error': str(e)}
+
+    return {'status': normalization_status, 'video_response_id': video_response_id}
+
+
+def normalize_and_store(video_response, task=None):
+    """
+    Remux or transcode one video to the normalized MP4 and store it; raises on failure
+    
+    Called by normalize_video_response on the transcode queue.
+
+    Returns the new normalization_status: 'ready', or 'skipped' for a file
+    without a video stream.
+    """
+    import tempfile
+    import ffmpeg
+    from django.core.files import File
+    from interviews.models import VideoResponse
+    from interviews.media_pipeline import build_normalize_output, local_video, normalization_plan
+    from processing.tracking import track_stage
+
+    video_response_id = video_response.id
+    with track_stage('normalization', video_response_id=video_response_id, task=task) as stage, \
+            local_video(video_response, original=True) as video_path:
+        probe = ffmpeg.probe(video_path)
+        plan = normalization_plan(probe)
+        if plan is None:
+            stage.log(f"Video {video_response_id} has no video stream; not normalized", level='warning')
+            VideoResponse.objects.filter(id=video_response_id).update(normalization_status='skipped')
+            return 'skipped'
+
+        fd, output_path = tempfile.mkstemp(suffix='.mp4', dir=settings.VIDEO_DOWNLOAD_DIR or None)
+        os.close(fd)
+        try:
             try:
-                interview.status = 'failed'
-                interview.completed_at = timezone.now()
-                interview.save(update_fields=['status', 'completed_at'])
-            except Exception:
-                logger.exception("Failed to update interview %s status to failed", interview_id)
-        
-        # Retry the task (let Celery mark as failed if retries exhausted)
-        raise self.retry(exc=e, countdown=60 * (self.request.retries + 1))
+                ffmpeg.run(
+                    build_normalize_output(video_path, output_path, probe, plan),
+                    capture_stdout=True, capture_stderr=True, overwrite_output=True,
+                )
+            except ffmpeg.Error as e:
+                stderr = e.stderr.decode(errors='replace')[-2000:] if e.stderr else 'Unknown error'
+                raise Exception(f"Failed to normalize video: {stderr}")
 
-# Single public entry point for background analysis
-analyze_interview = process_complete_interview
+            field = VideoResponse._meta.get_field('normalized_video')
+            with open(output_path, 'rb') as output:
+                name = field.storage.save(field.generate_filename(video_response, f"{video_response_id}.mp4"), File(output))
+        finally:
+            os.remove(output_path)
+        stage.log(f"Video {video_response_id} normalized ({plan})")
+
+    VideoResponse.objects.filter(id=video_response_id).update(normalized_video=name, normalization_status='ready')
+    logger.info(f"Normalized rendition stored for video {video_response_id} ({plan}): {name}")
+    return 'ready'
+
+
+def enqueue_transcription(video_response_id):
+    """
+    Queue transcription and normalization (in parallel) once the upload transaction commits
+
+    Broker failures are logged, not raised: the video stays 'pending' and
+    process_complete_interview transcribes it inline as a fallback.
+    """
+    from interviews.media_pipeline import normalization_enabled
+
+    def _send():
+        try:
+            if normalization_enabled():
+                group(
+                    transcribe_video_response.si(video_response_id),
+                    normalize_video_response.si(video_response_id),
+                ).delay()
+            else:
+                transcribe_video_response.delay(video_response_id)
+        except Exception:
+            logger.exception("Failed to queue transcription for video %s", video_response_id)
+
+    transaction.on_commit(_send)
+
+
+@shared_task
+def cleanup_stale_uploads():
+    """
+    Periodic (beat): delete upload sessions abandoned for UPLOAD_SESSION_TTL_HOURS, with their files or objects
+
+    Detection proxies left that long (interview never submitted, detection
+    never ran) are removed as well.
+    """
+    from datetime import timedelta
+    from django.conf import settings
+    from interviews.models import UploadSession, VideoResponse
+    from interviews.media_pipeline import PROXY_DIR, remove_proxy
+    from interviews.uploads import delete_upload
+    
+    cutoff = timezone.now() - timedelta(hours=settings.UPLOAD_SESSION_TTL_HOURS)
+    stale = list(UploadSession.objects.filter(status__in=['uploading', 'failed'], updated_at__lt=cutoff))
+    for session in stale:
+        try:
+            delete_upload(session)
+        except Exception as e:
+            logger.warning(f"Could not delete partial upload {session.file_name}: {e}")
+    UploadSession.objects.filter(id__in=[session.id for session in stale]).delete()
+    
+    if stale:
+        logger.info(f"Deleted {len(stale)} stale upload sessions")
+    
+    proxy_dir = os.path.join(settings.MEDIA_ROOT, PROXY_DIR)
+    stale_proxies = []
+    for entry in os.scandir(proxy_dir) if os.path.isdir(proxy_dir) else []:
+        if entry.stat().st_mtime < cutoff.timestamp() and remove_proxy(entry.path):
+            stale_proxies.append(f"{PROXY_DIR}/{entry.name}")
+    if stale_proxies:
+        VideoResponse.objects.filter(analysis_proxy__in=stale_proxies).update(analysis_proxy='')
+        logger.info(f"Deleted {len(stale_proxies)} stale detection proxies")
+    return {'deleted': len(stale)}
 
 
 @shared_task(bind=True, max_retries=3)
@@ -277,6 +662,7 @@ def analyze_single_video(self, video_response_id):
     from interviews.models import VideoResponse, AIAnalysis
     from interviews.ai_service import get_ai_service
     from interviews.ai import detect_script_reading
+    from interviews.media_pipeline import local_video
     import traceback
     
     try:
@@ -289,48 +675,49 @@ def analyze_single_video(self, video_response_id):
         # Get AI service
         ai_service = get_ai_service()
         
-        # Get video file path
-        video_path = video_response.video_file_path.path
-        logger.info(f"Video path: {video_path}")
-        
-        # Step 1 & 2: Transcribe video
-        logger.info("Transcribing video...")
-        transcript = ai_service.transcribe_video(video_path)
-        logger.info(f"Transcription complete: {len(transcript)} characters")
-        
-        # Step 3, 4, 5, 6: Analyze transcript
-        logger.info("Analyzing transcript...")
-        role = video_response.interview.position_type if hasattr(video_response, "interview") else None
-        role_name = role.name if role else None
-        role_code = role.code if role else None
-        role_context = role.description_context or role.description if role else None
-        from interviews.scoring import get_role_prompt_context
-
-        prompt_context = get_role_prompt_context(role_code)
-        core_competencies = prompt_context.get("core_competencies") or None
-
-        analysis_result = ai_service.analyze_transcript(
-            transcript_text=transcript,
-            question_text=video_response.question.question_text,
-            question_type=video_response.question.question_type,
-            role_name=role_name,
-            role_code=role_code,
-            role_context=role_context,
-            question_competency=video_response.question.competency,
-            role_profile=role_profile,
-            core_competencies=core_competencies,
-        )
-        logger.info(f"Analysis complete. Score: {analysis_result.get('overall_score')}")
+        # Local copy of the video (downloaded when it lives in object storage)
+        with local_video(video_response) as video_path:
+            logger.info(f"Video path: {video_path}")
+        
+            # Step 1 & 2: Transcribe video
+            logger.info("Transcribing video...")
+            transcript = ai_service.transcribe_video(video_path)
+            logger.info(f"Transcription complete: {len(transcript)} characters")
+        
+            # Step 3, 4, 5, 6: Analyze transcript
+            logger.info("Analyzing transcript...")
+            role = video_response.interview.position_type if hasattr(video_response, "interview") else None
+            role_name = role.name if role else None
+            role_code = role.code if role else None
+            role_context = role.description_context or role.description if role else None
+            from interviews.scoring import get_role_prompt_context
+
+            prompt_context = get_role_prompt_context(role_code)
+            core_competencies = prompt_context.get("core_competencies") or None
+
+            analysis_result = ai_service.analyze_transcript(
+                transcript_text=transcript,
+                question_text=video_response.question.question_text,
+                question_type=video_response.question.question_type,
+                role_name=role_name,
+                role_code=role_code,
+                role_context=role_context,
+                question_competency=video_response.question.competency,
+                role_profile=role_profile,
+                core_competencies=core_competencies,
+            )
+            logger.info(f"Analysis complete. Score: {analysis_result.get('overall_score')}")
         
-        # Step 7: Script reading detection
-        logger.info("Detecting script reading...")
-        script_detection = detect_script_reading(video_path)
-        logger.info(f"Script detection complete. Status: {script_detection['status']} (risk: {script_detection['risk_score']})")
+            # Step 7: Script reading detection
+            logger.info("Detecting script reading...")
+            script_detection = detect_script_reading(video_path)
+            logger.info(f"Script detection complete. Status: {script_detection['status']} (risk: {script_detection['risk_score']})")
         
         # Step 8: Store analysis results
         with transaction.atomic():
             # Store in VideoResponse for quick access
             video_response.transcript = transcript
+            video_response.transcript_status = 'ready'
             video_response.ai_score = analysis_result.get('overall_score', 50.0)
             video_response.sentiment = analysis_result.get('sentiment_score', 50.0)
             video_response.script_reading_status = script_detection['status']
@@ -385,7 +772,22 @@ def analyze_single_video(self, video_response_id):
 
 def calculate_interview_score(interview_id):
     """
-    Aggregate all video analysis results
+    Aggregate all video analysis results for an interview
+    
+    Loads the interview and its responses, then delegates to
+    score_video_responses. Callers that already hold the responses in memory
+    should call score_video_responses directly.
+    """
+    from interviews.models import Interview
+    
+    interview = Interview.objects.select_related('position_type').get(id=interview_id)
+    video_responses = list(interview.video_responses.select_related('question'))
+    return score_video_responses(interview, video_responses)
+
+
+def score_video_responses(interview, video_responses):
+    """
+    Aggregate video analysis results already loaded in memory
     
     Calculates:
     1. Get all VideoResponse scores (including HR overrides)
@@ -393,16 +795,14 @@ def calculate_interview_score(interview_id):
     3. Calculate overall score
     4. Generate final recommendation
     
-    Note: Videos with technical issues (None scores) are excluded from calculation
+    Note: Videos with technical issues (None scores) are excluded from calculation.
+    Expects video_responses with question (and interview.position_type) loaded;
+    no queries are issued here.
     """
-    from interviews.models import Interview
-    
+    interview_id = interview.id
     logger.info(f"Calculating overall score for interview {interview_id}")
     
-    interview = Interview.objects.get(id=interview_id)
-    video_responses = interview.video_responses.all()
-    
-    if not video_responses.exists():
+    if not video_responses:
         logger.warning(f"No video responses found for interview {interview_id}")
         return None
     
@@ -433,7 +833,7 @@ def calculate_interview_score(interview_id):
         return {
             'overall_score': 0,
             'recommendation': 'technical_issue',
-            'total_responses': video_responses.count(),
+            'total_responses': len(video_responses),
             'technical_issues_count': technical_issues_count,
             'all_technical_issues': True,
             'raw_scores_per_competency': {},
@@ -467,7 +867,7 @@ def calculate_interview_score(interview_id):
     return {
         'overall_score': overall_score,
         'recommendation': recommendation,
-        'total_responses': video_responses.count(),
+        'total_responses': len(video_responses),
         'technical_issues_count': technical_issues_count,
         'all_technical_issues': False,
         'raw_scores_per_competency': competency_score_data["raw_scores_per_competency"],
@@ -479,19 +879,36 @@ def calculate_interview_score(interview_id):
     }
 
 
-def create_interview_result(interview_id):
+def update_applicant_status(applicant, recommendation):
+    """Move the applicant to the status matching an interview recommendation"""
+    if recommendation == 'pass':
+        applicant.status = 'passed'
+    elif recommendation == 'fail':
+        applicant.status = 'failed'
+    else:
+        applicant.status = 'under_review'
+    applicant.save()
+
+
+def create_interview_result(interview_id, interview=None, video_responses=None):
     """
     Create InterviewResult entry
+    
+    process_complete_interview passes the interview and the video responses it
+    just analyzed so scoring runs once, without re-reading them.
     """
     from interviews.models import Interview
     from results.models import InterviewResult
     
     logger.info(f"Creating result entry for interview {interview_id}")
     
-    interview = Interview.objects.get(id=interview_id)
+    if interview is None:
+        interview = Interview.objects.select_related('applicant', 'position_type').get(id=interview_id)
+    if video_responses is None:
+        video_responses = list(interview.video_responses.select_related('question'))
     
     # Calculate scores
-    score_data = calculate_interview_score(interview_id)
+    score_data = score_video_responses(interview, video_responses)
     
     if not score_data:
         logger.error(f"Cannot create result - no score data for interview {interview_id}")
@@ -508,14 +925,7 @@ def create_interview_result(interview_id):
     )
     
     # Update applicant status based on recommendation
-    applicant = interview.applicant
-    if score_data['recommendation'] == 'pass':
-        applicant.status = 'passed'
-    elif score_data['recommendation'] == 'fail':
-        applicant.status = 'failed'
-    else:
-        applicant.status = 'under_review'
-    applicant.save()
+    update_applicant_status(interview.applicant, score_data['recommendation'])
     
     logger.info(f"Result created for interview {interview_id}: {score_data['recommendation']}")
     
@@ -0,0 +1,507 @@
+"""
+Test cases for the Gemini analysis service
+
+Gemini is mocked; these cover caching and request orchestration only.
+"""
+
+import json
+import time
+from django.test import TestCase, override_settings
+from unittest.mock import patch, MagicMock
+
+LOCMEM_CACHE = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'ai-service-tests'}}
+
+ANALYSIS = {
+    'sentiment_score': 80,
+    'confidence_score': 75,
+    'speech_clarity_score': 70,
+    'content_relevance_score': 85,
+    'overall_score': 78,
+    'recommendation': 'pass',
+    'analysis_summary': 'Clear and relevant.',
+}
+
+
+def _gemini_response(payload):
+    response = MagicMock()
+    response.text = json.dumps(payload)
+    return response
+
+
+@override_settings(GEMINI_API_KEY='test_key', CACHES=LOCMEM_CACHE, LLM_RESPONSE_CACHE_ENABLED=True)
+class ResponseCacheTests(TestCase):
+    """Test that identical prompts are answered from the response cache"""
+
+    def setUp(self):
+        from django.core.cache import cache
+        from interviews.llm_cache import get_response_cache
+
+        cache.clear()
+        get_response_cache().clear_local()
+        patcher = patch('interviews.ai_service.genai')
+        self.mock_genai = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        from interviews.ai_service import AIAnalysisService
+        self.service = AIAnalysisService()
+        self.service._log_token_usage = MagicMock()
+        self.generate = self.mock_genai.GenerativeModel.return_value.generate_content
+
+    def test_repeated_analysis_calls_gemini_once(self):
+        self.generate.return_value = _gemini_response(ANALYSIS)
+
+        first = self.service.analyze_transcript('I love helping customers.', 'Why this job?', 'general')
+        second = self.service.analyze_transcript('I love helping customers.', 'Why this job?', 'general')
+
+        self.assertEqual(self.generate.call_count, 1)
+        self.assertEqual(first, second)
+        self.service._log_token_usage.assert_called_once()
+
+    def test_different_prompt_is_a_miss(self):
+        self.generate.return_value = _gemini_response(ANALYSIS)
+
+        self.service.analyze_transcript('I love helping customers.', 'Why this job?', 'general')
+        self.service.analyze_transcript('I enjoy solving problems.', 'Why this job?', 'general')
+
+        self.assertEqual(self.generate.call_count, 2)
+
+    def test_invalid_response_is_not_cached(self):
+        self.generate.side_effect = [_gemini_response({'overall_score': 10}), _gemini_response(ANALYSIS)]
+
+        failed = self.service.analyze_transcript('I love helping customers.', 'Why this job?', 'general')
+        retried = self.service.analyze_transcript('I love helping customers.', 'Why this job?', 'general')
+
+        self.assertIn('error', failed)
+        self.assertEqual(retried['recommendation'], 'pass')
+        self.assertEqual(self.generate.call_count, 2)
+
+    def test_partly_invalid_batch_response_is_not_cached(self):
+        data = [
+            {'video_id': vid, 'transcript': 'Answer.', 'question_text': f'Q{vid}?', 'question_type': 'general'}
+            for vid in (1, 2)
+        ]
+        self.generate.return_value = _gemini_response([dict(ANALYSIS, video_id=1), {'video_id': 2}])
+
+        with patch.object(self.service, '_analyze_individually', return_value=[ANALYSIS]):
+            self.service.batch_analyze_transcripts(data, interview_id=1)
+            self.service.batch_analyze_transcripts(data, interview_id=1)
+
+        self.assertEqual(self.generate.call_count, 2)
+
+    def test_shared_tier_serves_other_workers(self):
+        from interviews.llm_cache import get_response_cache
+
+        data = [{'transcript': 'Answer.', 'question_text': 'Q?', 'question_type': 'general'}]
+        self.generate.return_value = _gemini_response([ANALYSIS])
+
+        self.service.batch_analyze_transcripts(data, interview_id=1)
+        get_response_cache().clear_local()  # Simulate a retry on another worker process
+        analyses = self.service.batch_analyze_transcripts(data, interview_id=1)
+
+        self.assertEqual(self.generate.call_count, 1)
+        self.assertEqual(analyses[0]['overall_score'], 78)
+
+    def test_local_lru_is_size_bounded(self):
+        from interviews.llm_cache import ResponseCache
+
+        response_cache = ResponseCache(max_entries=2, ttl=60)
+        for prompt in ['a', 'b', 'c']:
+            key, _ = response_cache.lookup('model', {}, prompt)
+            response_cache.store(key, prompt)
+
+        self.assertEqual(len(response_cache._local), 2)
+
+
+@override_settings(GEMINI_API_KEY='test_key', LLM_RESPONSE_CACHE_ENABLED=False)
+class IndividualFallbackTests(TestCase):
+    """Test the concurrent per-transcript fallback for batch analysis"""
+
+    def setUp(self):
+        patcher = patch('interviews.ai_service.genai')
+        self.mock_genai = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        from interviews.ai_service import AIAnalysisService
+        self.service = AIAnalysisService()
+        self.service._log_token_usage = MagicMock()
+        self.data = [
+            {'transcript': f'My answer number {i} is detailed.', 'question_text': f'Q{i}?', 'question_type': 'general'}
+            for i in range(3)
+        ]
+
+    def test_fallback_calls_run_concurrently(self):
+        import threading
+
+        barrier = threading.Barrier(3, timeout=5)
+
+        def analyze(transcript, question_text, question_type, **kwargs):
+            barrier.wait()  # Breaks unless all three calls are in flight together
+            return dict(ANALYSIS, analysis_summary=question_text)
+
+        with patch.object(self.service, 'analyze_transcript', side_effect=analyze):
+            results = self.service._analyze_individually(self.data)
+
+        self.assertEqual([r['analysis_summary'] for r in results], ['Q0?', 'Q1?', 'Q2?'])
+
+    @override_settings(LLM_CALL_TIMEOUT=0.2)
+    def test_slow_call_gets_review_scores(self):
+        import threading
+
+        release = threading.Event()
+        self.addCleanup(release.set)
+
+        def analyze(transcript, question_text, question_type, **kwargs):
+            if question_text == 'Q1?':
+                release.wait(5)
+            return ANALYSIS
+
+        with patch.object(self.service, 'analyze_transcript', side_effect=analyze):
+            results = self.service._analyze_individually(self.data)
+
+        self.assertEqual(results[0]['recommendation'], 'pass')
+        self.assertEqual(results[1]['recommendation'], 'review')
+        self.assertIn('timeout', results[1]['error'])
+
+    def test_batch_length_mismatch_uses_fallback(self):
+        self.mock_genai.GenerativeModel.return_value.generate_content.return_value = _gemini_response([ANALYSIS])
+
+        with patch.object(self.service, '_analyze_individually', return_value=[ANALYSIS] * 3) as mock_fallback:
+            results = self.service.batch_analyze_transcripts(self.data, interview_id=1)
+
+        mock_fallback.assert_called_once()
+        self.assertEqual(len(results), 3)
+
+
+@override_settings(GEMINI_API_KEY='test_key', LLM_RESPONSE_CACHE_ENABLED=False)
+class BatchRepairTests(TestCase):
+    """Test that valid batch items are kept and only the rest are re-requested"""
+
+    def setUp(self):
+        patcher = patch('interviews.ai_service.genai')
+        self.mock_genai = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        from interviews.ai_service import AIAnalysisService
+        self.service = AIAnalysisService()
+        self.service._log_token_usage = MagicMock()
+        self.generate = self.mock_genai.GenerativeModel.return_value.generate_content
+        self.data = [
+            {'video_id': vid, 'transcript': f'Answer for {vid}.', 'question_text': f'Q{vid}?', 'question_type': 'general'}
+            for vid in (11, 12, 13)
+        ]
+
+    def test_only_invalid_item_is_reanalyzed(self):
+        self.generate.return_value = _gemini_response([
+            dict(ANALYSIS, video_id=13, overall_score=60),
+            dict(ANALYSIS, video_id='11', overall_score=90),
+            {'video_id': 12, 'overall_score': 'n/a'},
+        ])
+        repaired = dict(ANALYSIS, overall_score=40)
+
+        with patch.object(self.service, '_analyze_individually', return_value=[repaired]) as mock_fallback:
+            results = self.service.batch_analyze_transcripts(self.data, interview_id=1)
+
+        self.assertEqual([d['video_id'] for d in mock_fallback.call_args.args[0]], [12])
+        self.assertEqual([r['overall_score'] for r in results], [90, 40, 60])
+
+    def test_combined_batch_splits_token_usage_per_interview(self):
+        self.generate.return_value = _gemini_response([dict(ANALYSIS, video_id=v) for v in (11, 12, 13)])
+
+        self.service.batch_analyze_transcripts(self.data, interview_ids=[1, 1, 2])
+
+        logged = {c.kwargs['interview_id']: c.kwargs['share'] for c in self.service._log_token_usage.call_args_list}
+        self.assertEqual(set(logged), {1, 2})
+        self.assertAlmostEqual(logged[1], 2 / 3)
+        self.assertAlmostEqual(logged[2], 1 / 3)
+
+    def test_prompt_tags_each_response_with_video_id(self):
+        self.generate.return_value = _gemini_response([dict(ANALYSIS, video_id=v) for v in (11, 12, 13)])
+
+        results = self.service.batch_analyze_transcripts(self.data, interview_id=1)
+
+        prompt = self.generate.call_args.args[0]
+        self.assertIn('(video_id: 12)', prompt)
+        self.assertIn('3 objects', prompt)
+        self.assertEqual(len(results), 3)
+
+    def test_untagged_items_used_positionally_only_when_complete(self):
+        from interviews.ai_service import _match_batch_items
+
+        analyses, missing = _match_batch_items([ANALYSIS, ANALYSIS, ANALYSIS], ['1', '2', '3'])
+        self.assertEqual(missing, [])
+
+        analyses, missing = _match_batch_items([ANALYSIS, ANALYSIS], ['1', '2', '3'])
+        self.assertEqual(missing, [0, 1, 2])
+
+
+class FakeRedis:
+    """Just enough of the redis-py list/string API, and the batcher's scripts, for the micro-batcher"""
+
+    def __init__(self):
+        import threading
+
+        self.lists = {}
+        self.values = {}
+        self.changed = threading.Condition()
+
+    def rpush(self, key, value):
+        with self.changed:
+            self.lists.setdefault(key, []).append(value)
+            self.changed.notify_all()
+
+    def llen(self, key):
+        return len(self.lists.get(key, []))
+
+    def lpop(self, key):
+        with self.changed:
+            items = self.lists.get(key, [])
+            return items.pop(0) if items else None
+
+    def blpop(self, key, timeout=0):
+        with self.changed:
+            if not self.changed.wait_for(lambda: self.lists.get(key), timeout=timeout):
+                return None
+            return key, self.lists[key].pop(0)
+
+    def expire(self, key, seconds):
+        return True
+
+    def pttl(self, key):
+        return 1000 if key in self.values else -2
+
+    def set(self, key, value, nx=False, ex=None):
+        with self.changed:
+            if nx and key in self.values:
+                return False
+            self.values[key] = value
+            return True
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def delete(self, key):
+        self.values.pop(key, None)
+
+    def eval(self, script, numkeys, *args):
+        import json
+        from interviews.analysis_batcher import TAKE_JOBS_SCRIPT, WITHDRAW_SCRIPT
+
+        with self.changed:
+            if script == WITHDRAW_SCRIPT:
+                pending_key, lock_key, payload = args
+                items = self.lists.get(pending_key, [])
+                if payload in items:
+                    items.remove(payload)
+                    return [1, 0]
+                return [0, self.pttl(lock_key)]
+            pending_key, max_interviews, max_items = args
+            jobs, total_items = [], 0
+            for raw in self.lists.get(pending_key, [])[:max_interviews]:
+                count = len(json.loads(raw)['items'])
+                if jobs and total_items + count > max_items:
+                    break
+                jobs.append(raw)
+                total_items += count
+            self.lists[pending_key] = self.lists.get(pending_key, [])[len(jobs):]
+            return jobs
+
+
+@override_settings(
+    CACHES=LOCMEM_CACHE,
+    ANALYSIS_MICROBATCH_ENABLED=True,
+    ANALYSIS_MICROBATCH_WINDOW=0.2,
+    ANALYSIS_MICROBATCH_POLL_INTERVAL=0.01,
+)
+class MicroBatchTests(TestCase):
+    """Test cross-interview micro-batching of transcript analysis"""
+
+    def setUp(self):
+        self.redis = FakeRedis()
+        patcher = patch('interviews.analysis_batcher._get_redis', return_value=self.redis)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.service = MagicMock()
+        self.service.batch_analyze_transcripts.side_effect = lambda data, **kwargs: [
+            dict(ANALYSIS, analysis_summary=item['question_text']) for item in data
+        ]
+
+    def _data(self, *video_ids):
+        return [{'video_id': v, 'transcript': 'Answer.', 'question_text': f'Q{v}?'} for v in video_ids]
+
+    @override_settings(ANALYSIS_MICROBATCH_ENABLED=False)
+    def test_disabled_calls_service_directly(self):
+        from interviews.analysis_batcher import analyze_transcripts
+
+        analyze_transcripts(self.service, self._data(1), interview_id=7, role_name='Agent')
+
+        self.service.batch_analyze_transcripts.assert_called_once_with(self._data(1), interview_id=7, role_name='Agent')
+        self.assertEqual(self.redis.lists, {})
+
+    @override_settings(ANALYSIS_MICROBATCH_MAX_INTERVIEWS=2)
+    def test_concurrent_interviews_share_one_request(self):
+        import threading
+        from interviews.analysis_batcher import analyze_transcripts
+
+        results = {}
+
+        def run(interview_id, video_ids):
+            results[interview_id] = analyze_transcripts(
+                self.service, self._data(*video_ids), interview_id=interview_id, role_name='Agent'
+            )
+
+        threads = [threading.Thread(target=run, args=(1, [11, 12])), threading.Thread(target=run, args=(2, [21]))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+
+        self.service.batch_analyze_transcripts.assert_called_once()
+        self.assertEqual(len(self.service.batch_analyze_transcripts.call_args.args[0]), 3)
+        self.assertEqual(sorted(self.service.batch_analyze_transcripts.call_args.kwargs['interview_ids']), [1, 1, 2])
+        self.assertEqual([a['analysis_summary'] for a in results[1]], ['Q11?', 'Q12?'])
+        self.assertEqual([a['analysis_summary'] for a in results[2]], ['Q21?'])
+
+    def test_job_taken_by_leader_is_waited_for_not_rerun(self):
+        import threading
+        from interviews.analysis_batcher import KEY_PREFIX, TAKE_JOBS_SCRIPT, MicroBatcher
+
+        batcher = MicroBatcher(self.redis, self.service, {'role_name': 'Agent'})
+        batcher.lock_ttl = 0  # the wait budget runs out as soon as the window closes
+        push = self.redis.rpush
+
+        def leader_takes_job(key, value):
+            push(key, value)
+            if key == batcher.pending_key:
+                # Another worker locks and pops the job, and answers only after our budget is spent
+                self.redis.set(batcher.lock_key, 'leader')
+                job = json.loads(self.redis.eval(TAKE_JOBS_SCRIPT, 1, key, 8, 40)[0])
+                result_key = f"{KEY_PREFIX}:result:{job['job_id']}"
+                threading.Timer(0.3, push, args=[result_key, json.dumps(['from leader'])]).start()
+
+        with patch.object(self.redis, 'rpush', side_effect=leader_takes_job):
+            result = batcher.submit_and_wait(7, self._data(1))
+
+        self.assertEqual(result, ['from leader'])
+        self.service.batch_analyze_transcripts.assert_not_called()
+
+    @override_settings(ANALYSIS_MICROBATCH_MAX_INTERVIEWS=2)
+    def test_failed_batch_releases_followers_immediately(self):
+        import threading
+        import time
+        from interviews.analysis_batcher import analyze_transcripts
+
+        direct = self.service.batch_analyze_transcripts.side_effect
+
+        def fail_combined_request(data, **kwargs):
+            if len(data) > 1:
+                raise RuntimeError('quota')
+            return direct(data, **kwargs)
+
+        self.service.batch_analyze_transcripts.side_effect = fail_combined_request
+        results = {}
+
+        def run(interview_id, video_ids):
+            results[interview_id] = analyze_transcripts(self.service, self._data(*video_ids), interview_id=interview_id)
+
+        started = time.monotonic()
+        threads = [threading.Thread(target=run, args=(1, [11])), threading.Thread(target=run, args=(2, [21]))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+
+        # One failed combined request, then each interview went direct without waiting out the lock
+        self.assertEqual(self.service.batch_analyze_transcripts.call_count, 3)
+        self.assertEqual([a['analysis_summary'] for a in results[1]], ['Q11?'])
+        self.assertEqual([a['analysis_summary'] for a in results[2]], ['Q21?'])
+        self.assertLess(time.monotonic() - started, 5)
+
+    def test_redis_failure_falls_back_to_direct_request(self):
+        from interviews.analysis_batcher import analyze_transcripts
+
+        with patch('interviews.analysis_batcher._get_redis', side_effect=ConnectionError('down')):
+            results = analyze_transcripts(self.service, self._data(1), interview_id=7)
+
+        self.assertEqual(results[0]['analysis_summary'], 'Q1?')
+        self.service.batch_analyze_transcripts.assert_called_once_with(self._data(1), interview_id=7)
+
+
+@override_settings(
+    GEMINI_API_KEY='test_key',
+    CACHES=LOCMEM_CACHE,
+    LLM_RESPONSE_CACHE_ENABLED=False,
+    RATE_LIMIT_ENABLED=True,
+    RATE_LIMITS={'gemini': {'requests_per_minute': 60, 'tokens_per_minute': 1000}},
+)
+class RateLimiterTests(TestCase):
+    """Test that outbound calls wait on the shared token buckets"""
+
+    def setUp(self):
+        from django.core.cache import cache
+
+        cache.clear()
+        self.redis = MagicMock()
+        patcher = patch('common.rate_limit._get_redis', return_value=self.redis)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_waits_until_bucket_refills(self):
+        from common.rate_limit import acquire, limiter_stats
+
+        self.redis.eval.side_effect = [250, 0]
+
+        with patch('common.rate_limit.time.sleep') as mock_sleep:
+            acquire('gemini', tokens=400)
+
+        mock_sleep.assert_called_once_with(0.25)
+        keys = self.redis.eval.call_args.args[2:4]
+        self.assertEqual(keys, ('rate_limit:gemini:requests', 'rate_limit:gemini:tokens'))
+        self.assertEqual(limiter_stats(['gemini'])['gemini']['requests'], 1)
+        self.assertEqual(limiter_stats(['gemini'])['gemini']['throttled'], 1)
+
+    def test_round_trip_alone_is_not_counted_as_throttling(self):
+        from common.rate_limit import acquire, limiter_stats
+
+        self.redis.eval.side_effect = lambda *args: time.sleep(0.005) or 0
+
+        self.assertEqual(acquire('gemini', tokens=10), 0)
+        self.assertEqual(limiter_stats(['gemini'])['gemini']['throttled'], 0)
+
+    def test_redis_outage_fails_open(self):
+        from common.rate_limit import acquire
+
+        self.redis.eval.side_effect = ConnectionError('down')
+
+        self.assertLess(acquire('gemini', tokens=10), 1)
+
+    @override_settings(RATE_LIMIT_MAX_WAIT=1)
+    def test_gives_up_waiting_after_max_wait(self):
+        from common.rate_limit import acquire
+
+        self.redis.eval.return_value = 5000
+
+        with patch('common.rate_limit.time.sleep') as mock_sleep:
+            acquire('gemini')
+
+        mock_sleep.assert_not_called()
+
+    def test_unconfigured_provider_is_not_limited(self):
+        from common.rate_limit import acquire
+
+        acquire('deepgram')
+
+        self.redis.eval.assert_not_called()
+
+    def test_gemini_calls_reserve_estimated_tokens(self):
+        with patch('interviews.ai_service.genai') as mock_genai, \
+                patch('interviews.ai_service.rate_limit.acquire') as mock_acquire:
+            from interviews.ai_service import AIAnalysisService
+
+            mock_genai.GenerativeModel.return_value.generate_content.return_value = _gemini_response(ANALYSIS)
+            service = AIAnalysisService()
+            service._log_token_usage = MagicMock()
+            service.analyze_transcript('I love helping customers.', 'Why this job?', 'general')
+
+        mock_acquire.assert_called_once()
+        self.assertEqual(mock_acquire.call_args.args, ('gemini',))
+        self.assertGreater(mock_acquire.call_args.kwargs['tokens'], 50)
@@ -8,6 +8,7 @@ Tests the new pipeline:
 
 import os
 import tempfile
+from datetime import timedelta
 from django.test import TestCase, override_settings
 from django.core.files.uploadedfile import SimpleUploadedFile
 from unittest.mock import patch, MagicMock
@@ -73,18 +74,10 @@ class DeepgramPipelineTestCase(TestCase):
             status='in_progress'
         )
     
+    @patch('interviews.tasks.transcribe_video_response.delay')
     @patch('interviews.deepgram_service.DeepgramTranscriptionService.transcribe_video')
-    def test_video_upload_with_deepgram_transcription(self, mock_transcribe):
-        """Test that video upload triggers Deepgram transcription immediately"""
-        
-        # Mock Deepgram response
-        mock_transcribe.return_value = {
-            'transcript': 'This is my answer to the interview question.',
-            'duration': 45.2,
-            'confidence': 0.95,
-            'word_count': 8,
-            'processing_time': 2.3
-        }
+    def test_video_upload_queues_deepgram_transcription(self, mock_transcribe, mock_delay):
+        """Test that video upload queues Deepgram transcription instead of running it inline"""
         
         # Create a dummy video file
         video_content = b'fake video content'
@@ -95,31 +88,34 @@ class DeepgramPipelineTestCase(TestCase):
         )
         
         # Upload video
-        response = self.client.post(
-            f'/api/interviews/{self.interview.id}/video-response/',
-            {
-                'question_id': self.questions[0].id,
-                'video_file_path': video_file,
-                'duration': '00:00:45'
-            },
-            format='multipart'
-        )
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                f'/api/interviews/{self.interview.id}/video-response/',
+                {
+                    'question_id': self.questions[0].id,
+                    'video_file_path': video_file,
+                    'duration': '00:00:45'
+                },
+                format='multipart'
+            )
         
         # Assertions
         self.assertEqual(response.status_code, 201)
         self.assertIn('video_response', response.data)
-        self.assertTrue(response.data.get('transcript_ready', False))
+        self.assertFalse(response.data.get('transcript_ready'))
+        self.assertEqual(response.data.get('transcript_status'), 'pending')
         
-        # Check video response was created with transcript
+        # Check video response was created and is waiting on the worker
         video_response = VideoResponse.objects.get(
             interview=self.interview,
             question=self.questions[0]
         )
-        self.assertEqual(video_response.transcript, 'This is my answer to the interview question.')
+        self.assertEqual(video_response.transcript_status, 'pending')
         self.assertEqual(video_response.status, 'uploaded')
         
-        # Verify Deepgram was called
-        mock_transcribe.assert_called_once()
+        # Transcription is queued, never run inside the request
+        mock_delay.assert_called_once_with(video_response.id)
+        mock_transcribe.assert_not_called()
     
     @patch('interviews.ai_service.AIAnalysisService.batch_analyze_transcripts')
     def test_interview_submit_batch_analysis(self, mock_batch_analyze):
@@ -217,7 +213,8 @@ class DeepgramPipelineTestCase(TestCase):
             for i in range(5)
         ]
         
-        # Step 1: Upload 5 videos (each gets transcribed by Deepgram)
+        # Step 1: Upload 5 videos (each queues a Deepgram transcription)
+        from interviews.tasks import transcribe_video_response
         for i, question in enumerate(self.questions):
             video_file = SimpleUploadedFile(
                 f'test_video_{i}.webm',
@@ -236,8 +233,9 @@ class DeepgramPipelineTestCase(TestCase):
             )
             
             self.assertEqual(response.status_code, 201)
+            transcribe_video_response.apply(args=[response.data['video_response']['id']])
         
-        # Verify 5 Deepgram calls (one per video)
+        # Verify 5 Deepgram calls (one per video, on the transcription worker)
         self.assertEqual(mock_transcribe.call_count, 5)
         
         # Verify transcripts are stored
@@ -346,6 +344,270 @@ class DeepgramPipelineTestCase(TestCase):
         self.assertGreater(savings_percentage, 90)  # At least 90% savings
 
 
+class TranscriptionWorkerTests(TestCase):
+    """Tests for the dedicated transcription queue task"""
+
+    def setUp(self):
+        applicant = Applicant.objects.create(
+            first_name='Jane',
+            last_name='Doe',
+            email='jane@example.com',
+            phone='+639123456780',
+        )
+        position_type = PositionType.objects.create(name='Support', code='support_worker_test')
+        question_type = QuestionType.objects.create(name='General', code='general_worker_test')
+        question = InterviewQuestion.objects.create(
+            question_text='Tell us about yourself?',
+            question_type=question_type,
+            position_type=position_type,
+        )
+        interview = Interview.objects.create(applicant=applicant, position_type=position_type)
+        self.video_response = VideoResponse.objects.create(
+            interview=interview,
+            question=question,
+            video_file_path='videos/worker.webm',
+            duration=timedelta(seconds=30),
+        )
+
+    @patch('interviews.deepgram_service.get_deepgram_service')
+    def test_task_stores_transcript_and_marks_ready(self, mock_get_service):
+        from interviews.tasks import transcribe_video_response
+
+        mock_get_service.return_value.transcribe_video.return_value = {'transcript': 'Hello there.'}
+
+        transcribe_video_response.apply(args=[self.video_response.id])
+
+        self.video_response.refresh_from_db()
+        self.assertEqual(self.video_response.transcript, 'Hello there.')
+        self.assertEqual(self.video_response.transcript_status, 'ready')
+        self.assertIsNotNone(self.video_response.transcribed_at)
+
+    @patch('interviews.deepgram_service.get_deepgram_service')
+    def test_task_writes_detection_proxy_in_same_pass(self, mock_get_service):
+        from interviews.media_pipeline import detection_source
+        from interviews.tasks import transcribe_video_response
+
+        def fake_transcribe(path, video_response_id=None, proxy_path=None):
+            with open(proxy_path, 'wb') as proxy:
+                proxy.write(b'proxy')
+            return {'transcript': 'Hello there.'}
+
+        mock_get_service.return_value.transcribe_video.side_effect = fake_transcribe
+
+        with tempfile.TemporaryDirectory() as media_root, override_settings(MEDIA_ROOT=media_root):
+            transcribe_video_response.apply(args=[self.video_response.id])
+
+            self.video_response.refresh_from_db()
+            self.assertEqual(self.video_response.analysis_proxy.name, f'analysis_proxies/{self.video_response.id}.avi')
+            self.assertEqual(detection_source(self.video_response), self.video_response.analysis_proxy.path)
+
+    @patch('interviews.ai.detection_pool.detect_script_reading')
+    @patch('interviews.deepgram_service.get_deepgram_service')
+    def test_detection_deletes_proxy_after_reading_it(self, mock_get_service, mock_detect):
+        from interviews.tasks import detect_video_script_reading, transcribe_video_response
+
+        def fake_transcribe(path, video_response_id=None, proxy_path=None):
+            with open(proxy_path, 'wb') as proxy:
+                proxy.write(b'proxy')
+            return {'transcript': 'Hello there.'}
+
+        mock_get_service.return_value.transcribe_video.side_effect = fake_transcribe
+        mock_detect.return_value = {'status': 'clear', 'risk_score': 0, 'data': {}}
+
+        with tempfile.TemporaryDirectory() as media_root, override_settings(MEDIA_ROOT=media_root):
+            transcribe_video_response.apply(args=[self.video_response.id])
+            proxy_path = os.path.join(media_root, 'analysis_proxies', f'{self.video_response.id}.avi')
+
+            detect_video_script_reading.apply(args=[self.video_response.id])
+
+            self.assertEqual(mock_detect.call_args.args[0], proxy_path)
+            self.assertFalse(os.path.exists(proxy_path))
+            self.video_response.refresh_from_db()
+            self.assertFalse(self.video_response.analysis_proxy)
+
+    @patch('interviews.deepgram_service.get_deepgram_service')
+    def test_failed_transcription_removes_partial_proxy(self, mock_get_service):
+        from interviews.tasks import transcribe_video_response
+
+        def fail_midway(path, video_response_id=None, proxy_path=None):
+            with open(proxy_path, 'wb') as proxy:
+                proxy.write(b'partial')
+            raise RuntimeError('deepgram down')
+
+        mock_get_service.return_value.transcribe_video.side_effect = fail_midway
+
+        with tempfile.TemporaryDirectory() as media_root, override_settings(MEDIA_ROOT=media_root), \
+                patch('interviews.tasks.transcribe_video_response.max_retries', 0):
+            transcribe_video_response.apply(args=[self.video_response.id])
+
+            self.assertFalse(os.path.exists(os.path.join(media_root, 'analysis_proxies', f'{self.video_response.id}.avi')))
+
+    def test_detection_source_falls_back_to_upload(self):
+        from interviews.media_pipeline import detection_source
+
+        self.assertEqual(detection_source(self.video_response), self.video_response.video_file_path.path)
+
+    def test_public_transcript_status_hides_error_detail(self):
+        VideoResponse.objects.filter(id=self.video_response.id).update(
+            transcript_status='failed', transcript_error='Deepgram 401: invalid API key dg_secret'
+        )
+
+        response = self.client.get(f'/api/public/interviews/{self.video_response.interview_id}/transcripts/')
+
+        self.assertEqual(response.status_code, 200)
+        row = response.json()['video_responses'][0]
+        self.assertTrue(row['transcription_failed'])
+        self.assertNotIn('dg_secret', response.content.decode())
+
+    @patch('interviews.deepgram_service.get_deepgram_service')
+    def test_task_skips_ready_transcripts(self, mock_get_service):
+        from interviews.tasks import transcribe_video_response
+
+        VideoResponse.objects.filter(id=self.video_response.id).update(transcript_status='ready')
+
+        result = transcribe_video_response.apply(args=[self.video_response.id]).get()
+
+        self.assertEqual(result['status'], 'skipped')
+        mock_get_service.assert_not_called()
+
+    @override_settings(TRANSCRIPT_WAIT_TIMEOUT=10, TRANSCRIPT_WAIT_POLL_INTERVAL=2)
+    @patch('interviews.deepgram_service.get_deepgram_service')
+    def test_ensure_transcript_requeues_instead_of_waiting(self, mock_get_service):
+        from celery.exceptions import Retry
+        from interviews.tasks import ensure_transcript
+
+        with patch.object(ensure_transcript, 'retry', side_effect=Retry()) as mock_retry:
+            with self.assertRaises(Retry):
+                ensure_transcript.run(self.video_response.id)
+
+        self.assertEqual(mock_retry.call_args.kwargs['kwargs'], {'waited': 2, 'failures': 0})
+        self.assertEqual(mock_retry.call_args.kwargs['countdown'], 2)
+        mock_get_service.assert_not_called()
+
+        # Past the deadline the pipeline transcribes inline
+        mock_get_service.return_value.transcribe_video.return_value = {'transcript': 'Late answer.'}
+        result = ensure_transcript.run(self.video_response.id, waited=10)
+
+        self.assertEqual(result['status'], 'success')
+        mock_get_service.return_value.transcribe_video.assert_called_once()
+
+
+class VideoNormalizationTests(TestCase):
+    """Tests for the normalized rendition written after upload"""
+
+    VFR_WEBM = {'streams': [
+        {'codec_type': 'video', 'codec_name': 'vp8', 'pix_fmt': 'yuv420p', 'height': 1080,
+         'r_frame_rate': '1000/1', 'avg_frame_rate': '28013/1000'},
+        {'codec_type': 'audio', 'codec_name': 'opus'},
+    ]}
+    CFR_MP4 = {'streams': [
+        {'codec_type': 'video', 'codec_name': 'h264', 'pix_fmt': 'yuv420p', 'height': 720,
+         'r_frame_rate': '30/1', 'avg_frame_rate': '30/1'},
+        {'codec_type': 'audio', 'codec_name': 'aac'},
+    ]}
+
+    def setUp(self):
+        applicant = Applicant.objects.create(
+            first_name='Norma',
+            last_name='Lized',
+            email='norma@example.com',
+            phone='+639123456781',
+        )
+        position_type = PositionType.objects.create(name='Support', code='support_normalize_test')
+        question_type = QuestionType.objects.create(name='General', code='general_normalize_test')
+        question = InterviewQuestion.objects.create(
+            question_text='Tell us about yourself?',
+            question_type=question_type,
+            position_type=position_type,
+        )
+        interview = Interview.objects.create(applicant=applicant, position_type=position_type)
+        self.video_response = VideoResponse.objects.create(
+            interview=interview,
+            question=question,
+            video_file_path='videos/normalize.webm',
+            duration=timedelta(seconds=30),
+        )
+
+    def test_plan_transcodes_variable_frame_rate_and_remuxes_conforming_files(self):
+        from interviews.media_pipeline import normalization_plan
+
+        self.assertEqual(normalization_plan(self.VFR_WEBM), 'transcode')
+        self.assertEqual(normalization_plan(self.CFR_MP4), 'remux')
+        self.assertIsNone(normalization_plan({'streams': [{'codec_type': 'audio', 'codec_name': 'opus'}]}))
+
+    @override_settings(VIDEO_NORMALIZE_FPS=30, VIDEO_NORMALIZE_MAX_HEIGHT=720)
+    def test_transcode_caps_frame_rate_and_height_with_faststart(self):
+        from interviews.media_pipeline import build_normalize_output
+
+        args = build_normalize_output('in.webm', 'out.mp4', self.VFR_WEBM, 'transcode').compile()
+        command = ' '.join(args)
+
+        self.assertIn('fps=fps=30', command)
+        self.assertIn('scale=-2:720', command)
+        self.assertIn('-vcodec libx264', command)
+        self.assertIn('-movflags +faststart', command)
+
+        remux = ' '.join(build_normalize_output('in.mp4', 'out.mp4', self.CFR_MP4, 'remux').compile())
+        self.assertIn('-c copy', remux)
+        self.assertNotIn('libx264', remux)
+
+    @patch('ffmpeg.run')
+    @patch('ffmpeg.probe')
+    def test_task_stores_rendition_and_consumers_prefer_it(self, mock_probe, mock_run):
+        from interviews.media_pipeline import detection_source, local_video
+        from interviews.tasks import normalize_video_response
+
+        mock_probe.return_value = self.VFR_WEBM
+
+        def fake_run(stream, **kwargs):
+            with open(stream.compile()[-1], 'wb') as output:
+                output.write(b'normalized')
+        mock_run.side_effect = fake_run
+
+        with tempfile.TemporaryDirectory() as media_root, override_settings(MEDIA_ROOT=media_root):
+            result = normalize_video_response.apply(args=[self.video_response.id]).get()
+
+            self.assertEqual(result['status'], 'ready')
+            self.video_response.refresh_from_db()
+            self.assertEqual(self.video_response.normalization_status, 'ready')
+            self.assertTrue(self.video_response.normalized_video.name.endswith(f'{self.video_response.id}.mp4'))
+            with self.video_response.normalized_video.open('rb') as stored:
+                self.assertEqual(stored.read(), b'normalized')
+            self.assertEqual(self.video_response.playback_file, self.video_response.normalized_video)
+            self.assertEqual(detection_source(self.video_response), self.video_response.normalized_video.path)
+            with local_video(self.video_response, original=True) as path:
+                self.assertEqual(path, self.video_response.video_file_path.path)
+
+    @patch('ffmpeg.run')
+    @patch('ffmpeg.probe')
+    def test_failure_keeps_original_for_consumers(self, mock_probe, mock_run):
+        import ffmpeg
+        from interviews.tasks import normalize_video_response
+
+        mock_probe.return_value = self.VFR_WEBM
+        mock_run.side_effect = ffmpeg.Error('ffmpeg', b'', b'Invalid data found when processing input')
+
+        result = normalize_video_response.apply(args=[self.video_response.id]).get()
+
+        self.assertEqual(result['status'], 'failed')
+        self.assertIn('Invalid data', result['error'])
+        self.video_response.refresh_from_db()
+        self.assertEqual(self.video_response.normalization_status, 'failed')
+        self.assertEqual(self.video_response.playback_file, self.video_response.video_file_path)
+
+    @patch('interviews.tasks.group')
+    def test_upload_queues_normalization_alongside_transcription(self, mock_group):
+        from interviews.tasks import enqueue_transcription
+
+        with self.captureOnCommitCallbacks(execute=True):
+            enqueue_transcription(self.video_response.id)
+
+        transcribe, normalize = mock_group.call_args.args
+        self.assertEqual(transcribe.task, 'interviews.tasks.transcribe_video_response')
+        self.assertEqual(normalize.task, 'interviews.tasks.normalize_video_response')
+        mock_group.return_value.delay.assert_called_once_with()
+
+
 class DeepgramServiceUnitTests(TestCase):
     """Unit tests for Deepgram service functions"""
     
@@ -384,6 +646,84 @@ class DeepgramServiceUnitTests(TestCase):
         self.assertIsNotNone(service)
 
 
+class DeepgramStreamingTests(TestCase):
+    """Unit tests for the ffmpeg -> Deepgram streaming path"""
+
+    def _fake_process(self, payload, returncode=0, stderr=b''):
+        import io
+
+        process = MagicMock()
+        process.stdout = io.BytesIO(payload)
+        process.stderr = io.BytesIO(stderr)
+        process.wait.return_value = returncode
+        process.poll.return_value = returncode
+        return process
+
+    @override_settings(DEEPGRAM_API_KEY='test_api_key')
+    @patch('interviews.deepgram_service.DeepgramClient')
+    @patch('interviews.media_pipeline.ffmpeg')
+    def test_stream_audio_yields_bounded_chunks(self, mock_ffmpeg, mock_client):
+        from interviews.deepgram_service import DeepgramTranscriptionService
+
+        payload = b'x' * (DeepgramTranscriptionService.STREAM_CHUNK_SIZE * 2 + 10)
+        mock_ffmpeg.input.return_value.output.return_value.global_args.return_value.run_async.return_value = (
+            self._fake_process(payload)
+        )
+
+        service = DeepgramTranscriptionService()
+        chunks = list(service._stream_audio('/tmp/video.webm'))
+
+        self.assertEqual(b''.join(chunks), payload)
+        self.assertTrue(all(len(c) <= service.STREAM_CHUNK_SIZE for c in chunks))
+        output_kwargs = mock_ffmpeg.input.return_value.output.call_args.kwargs
+        self.assertEqual(output_kwargs['ac'], 1)
+        self.assertEqual(output_kwargs['ar'], '16000')
+
+    @override_settings(DEEPGRAM_API_KEY='test_api_key')
+    @patch('interviews.deepgram_service.DeepgramClient')
+    @patch('interviews.media_pipeline.ffmpeg')
+    def test_stream_audio_raises_on_ffmpeg_failure(self, mock_ffmpeg, mock_client):
+        from interviews.deepgram_service import DeepgramTranscriptionService
+
+        mock_ffmpeg.input.return_value.output.return_value.global_args.return_value.run_async.return_value = (
+            self._fake_process(b'', returncode=1, stderr=b'invalid data')
+        )
+
+        service = DeepgramTranscriptionService()
+        with self.assertRaisesRegex(Exception, 'invalid data'):
+            list(service._stream_audio('/tmp/video.webm'))
+
+    @override_settings(SCRIPT_DETECTION_TARGET_FPS=5, SCRIPT_DETECTION_MAX_WIDTH=320)
+    def test_proxy_written_from_same_ffmpeg_input(self):
+        from interviews.audio_profiles import get_audio_profile
+        from interviews.media_pipeline import build_speech_outputs
+
+        args = build_speech_outputs('/tmp/video.webm', 'pipe:', get_audio_profile(), '/tmp/proxy.avi').get_args()
+
+        self.assertEqual(args.count('-i'), 1)
+        self.assertIn('pipe:', args)
+        self.assertIn('/tmp/proxy.avi', args)
+        self.assertIn('[0:v]fps=fps=5[s0];[s0]scale=320:-2[s1]', args)
+
+    @override_settings(DEEPGRAM_API_KEY='test_api_key', DEEPGRAM_STREAM_AUDIO=True)
+    @patch('interviews.deepgram_service.DeepgramClient')
+    def test_transcribe_video_streams_without_temp_file(self, mock_client):
+        from interviews.deepgram_service import DeepgramTranscriptionService
+
+        service = DeepgramTranscriptionService()
+        service._log_usage = MagicMock()
+        service._parse_deepgram_response = MagicMock(return_value={
+            'transcript': 'hello', 'duration': 1.0, 'confidence': 0.9, 'word_count': 1, 'processing_time': 0.1,
+        })
+        with patch.object(service, '_stream_audio', return_value=(chunk for chunk in [b'abc'])), \
+                patch.object(service, '_extract_audio') as mock_extract:
+            service.transcribe_video('/tmp/video.webm', video_response_id=1)
+
+        mock_extract.assert_not_called()
+        transcribe_file = mock_client.return_value.listen.rest.v.return_value.transcribe_file
+        self.assertIn('stream', transcribe_file.call_args.kwargs['source'])
+
+
 class PerformanceTests(TestCase):
     """Performance comparison tests"""
     
@@ -412,3 +752,326 @@ class PerformanceTests(TestCase):
         # Assertions
         self.assertLess(new_total_time, old_total_time)
         self.assertGreater(speed_improvement, 9)  # At least 9x faster
+
+
+class AudioProfileTests(TestCase):
+    """Test speech extraction profiles and the WER helper used to compare them"""
+
+    def test_default_profile_is_mono_16k(self):
+        from interviews.audio_profiles import get_audio_profile
+
+        profile = get_audio_profile()
+        self.assertEqual(profile.sample_rate, 16000)
+        self.assertEqual(profile.channels, 1)
+
+    @override_settings(TRANSCRIPTION_AUDIO_PROFILE='opus_16k')
+    def test_profile_selected_from_settings(self):
+        from interviews.audio_profiles import get_audio_profile
+
+        profile = get_audio_profile()
+        self.assertEqual(profile.name, 'opus_16k')
+        kwargs = profile.ffmpeg_output_kwargs()
+        self.assertEqual(kwargs['acodec'], 'libopus')
+        self.assertEqual(kwargs['ab'], '24k')
+        self.assertEqual(kwargs['ar'], '16000')
+
+    def test_unknown_profile_raises(self):
+        from interviews.audio_profiles import get_audio_profile
+
+        with self.assertRaises(ValueError):
+            get_audio_profile('aac_8k')
+
+    def test_word_error_rate(self):
+        from interviews.audio_profiles import word_error_rate
+
+        self.assertEqual(word_error_rate('Hello, world!', 'hello world'), 0.0)
+        self.assertAlmostEqual(word_error_rate('the cat sat down', 'the cat sat'), 0.25)
+        self.assertAlmostEqual(word_error_rate('one two', 'one three four'), 1.0)
+        self.assertEqual(word_error_rate('', ''), 0.0)
+
+
+class ScriptDetectionBatchTests(TestCase):
+    """Test that script detection runs in the background and is joined per video"""
+
+    @patch('interviews.ai.detection_pool.detect_script_reading')
+    def test_results_keyed_by_video_with_failures_marked_clear(self, mock_detect):
+        from interviews.ai import start_script_detection
+
+        def fake_detect(path, **kwargs):
+            if path == 'broken.webm':
+                raise RuntimeError('decode failed')
+            return {'status': 'suspicious', 'risk_score': 40, 'data': {'path': path}}
+
+        mock_detect.side_effect = fake_detect
+        batch = start_script_detection({1: 'ok.webm', 2: 'broken.webm'}, executor='thread')
+        results = batch.results()
+
+        self.assertEqual(results[1]['status'], 'suspicious')
+        self.assertEqual(results[2]['status'], 'clear')
+        self.assertIn('decode failed', results[2]['data']['error'])
+
+    @patch('interviews.ai.detection_pool.detect_script_reading')
+    def test_detection_starts_before_results_are_requested(self, mock_detect):
+        import threading
+        from interviews.ai import start_script_detection
+
+        started = threading.Event()
+
+        def fake_detect(path, **kwargs):
+            started.set()
+            return {'status': 'clear', 'risk_score': 0, 'data': {}}
+
+        mock_detect.side_effect = fake_detect
+        batch = start_script_detection({1: 'a.webm'}, executor='thread')
+
+        # Detection runs while the caller is busy with other work (the LLM call)
+        self.assertTrue(started.wait(timeout=5))
+        self.assertEqual(batch.results()[1]['status'], 'clear')
+
+    @patch('interviews.ai.detection_pool.ProcessPoolExecutor', side_effect=AssertionError('daemonic processes are not allowed to have children'))
+    @patch('interviews.ai.detection_pool.detect_script_reading')
+    def test_process_pool_falls_back_to_threads(self, mock_detect, mock_pool):
+        from interviews.ai import start_script_detection
+
+        mock_detect.return_value = {'status': 'clear', 'risk_score': 0, 'data': {}}
+        batch = start_script_detection({1: 'a.webm', 2: 'b.webm'}, executor='process')
+
+        self.assertEqual(set(batch.results()), {1, 2})
+        self.assertEqual(mock_detect.call_count, 2)
+
+
+    @patch('interviews.ai.detection_pool.detect_script_reading')
+    def test_timeout_is_one_deadline_for_the_batch(self, mock_detect):
+        import threading
+        import time
+        from interviews.ai import start_script_detection
+
+        release = threading.Event()
+        self.addCleanup(release.set)
+        mock_detect.side_effect = lambda path, **kwargs: release.wait(5)
+        batch = start_script_detection({1: 'a.webm', 2: 'b.webm', 3: 'c.webm'}, executor='thread')
+
+        started = time.monotonic()
+        results = batch.results(timeout=0.2)
+
+        self.assertLess(time.monotonic() - started, 0.5)
+        self.assertEqual({r['data']['error'] for r in results.values()}, {'Script detection timed out'})
+
+    def test_timed_out_pool_processes_are_terminated(self):
+        import multiprocessing
+        import time
+        from concurrent.futures import ProcessPoolExecutor
+        from interviews.ai import ScriptDetectionBatch
+
+        batch = ScriptDetectionBatch({1: 'a.webm'}, executor='inline')
+        batch.executor_kind = 'process'
+        batch._executor = ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context('spawn'))
+        batch._futures = {1: batch._executor.submit(time.sleep, 30)}
+        processes = list(batch._executor._processes.values())
+
+        results = batch.results(timeout=0.5)
+
+        self.assertEqual(results[1]['data']['error'], 'Script detection timed out')
+        for process in processes:
+            process.join(5)
+            self.assertFalse(process.is_alive())
+
+
+    @patch('interviews.ai.detection_pool.detect_script_reading')
+    def test_inline_soft_time_limit_records_timeout(self, mock_detect):
+        from celery.exceptions import SoftTimeLimitExceeded
+        from interviews.ai import start_script_detection
+
+        mock_detect.side_effect = SoftTimeLimitExceeded()
+
+        results = start_script_detection({1: 'a.webm'}, executor='inline').results()
+
+        self.assertEqual(results[1], {'status': 'clear', 'risk_score': 0, 'data': {'error': 'Script detection timed out'}})
+
+class ScriptDetectionSamplingTests(TestCase):
+    """Test that skipped frames are grabbed without decoding"""
+
+    def test_frame_skip_matches_target_fps(self):
+        from interviews.ai.script_detection import _frame_skip_for
+
+        self.assertEqual(_frame_skip_for(30, 5), 6)
+        self.assertEqual(_frame_skip_for(30, 0), 3)
+        self.assertEqual(_frame_skip_for(2, 5), 1)
+
+    @patch('interviews.ai.script_detection.cv2.VideoCapture')
+    def test_only_sampled_frames_are_decoded(self, mock_capture_cls):
+        import numpy as np
+        from interviews.ai.script_detection import detect_script_reading
+
+        capture = mock_capture_cls.return_value
+        capture.isOpened.return_value = True
+        capture.get.return_value = 30  # FPS and frame count
+        capture.grab.side_effect = [True] * 30 + [False]
+        capture.retrieve.return_value = (True, np.zeros((720, 1280, 3), dtype=np.uint8))
+
+        result = detect_script_reading('video.webm', target_fps=5, max_width=320)
+
+        self.assertEqual(capture.retrieve.call_count, 5)
+        capture.read.assert_not_called()
+        self.assertEqual(result['status'], 'error')  # blank frames contain no face
+
+    @patch('interviews.ai.script_detection.get_face_detector')
+    @patch('interviews.ai.script_detection.cv2.VideoCapture')
+    def test_proxy_and_original_use_same_min_face(self, mock_capture_cls, mock_get_detector):
+        import numpy as np
+        from interviews.ai.script_detection import detect_script_reading
+
+        detector = mock_get_detector.return_value
+        detector.detect.return_value = []
+        capture = mock_capture_cls.return_value
+        capture.isOpened.return_value = True
+        capture.get.return_value = 30
+        min_sizes = {}
+        for name, shape in (('original', (720, 1280, 3)), ('proxy', (180, 320, 3))):
+            capture.grab.side_effect = [True] * 6 + [False]
+            capture.retrieve.return_value = (True, np.zeros(shape, dtype=np.uint8))
+            detector.detect.reset_mock()
+
+            detect_script_reading('video.webm', target_fps=5, max_width=320, detector='haar')
+
+            min_sizes[name] = detector.detect.call_args.kwargs['min_size']
+
+        self.assertEqual(min_sizes['original'], min_sizes['proxy'])
+
+    @patch('interviews.ai.script_detection.cv2.CascadeClassifier')
+    def test_cascade_loaded_once_per_process(self, mock_classifier):
+        from concurrent.futures import ThreadPoolExecutor
+        from interviews.ai import script_detection
+
+        mock_classifier.return_value.empty.return_value = False
+        script_detection._cascades.clear()
+
+        first = script_detection.get_cascade()
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            others = list(pool.map(lambda _: script_detection.get_cascade(), range(8)))
+
+        self.assertTrue(all(other is first for other in others))
+        mock_classifier.assert_called_once()
+        script_detection._cascades.clear()
+
+
+class FaceDetectorBackendTests(TestCase):
+    """Test face detector selection for script detection"""
+
+    def tearDown(self):
+        from interviews.ai import face_detectors
+        face_detectors._detectors.clear()
+
+    def test_haar_detector_returns_no_faces_on_blank_frame(self):
+        import numpy as np
+        from interviews.ai.face_detectors import get_face_detector
+
+        detector = get_face_detector('haar')
+        self.assertEqual(detector.detect(np.zeros((240, 320, 3), dtype=np.uint8)), [])
+
+    def test_missing_dnn_model_falls_back_to_haar(self):
+        from interviews.ai.face_detectors import get_face_detector
+
+        with tempfile.TemporaryDirectory() as empty_dir:
+            detector = get_face_detector('yunet', model_dir=empty_dir)
+        self.assertEqual(detector.name, 'haar')
+
+    @patch('interviews.ai.face_detectors.cv2.FaceDetectorYN.create')
+    @patch('interviews.ai.face_detectors._model_path', side_effect=lambda filename, model_dir=None: filename)
+    def test_detector_loaded_once_per_process(self, mock_model_path, mock_create):
+        from concurrent.futures import ThreadPoolExecutor
+        from interviews.ai.face_detectors import get_face_detector
+
+        first = get_face_detector('yunet')
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            others = list(pool.map(lambda _: get_face_detector('yunet'), range(8)))
+
+        self.assertTrue(all(other is first for other in others))
+        mock_create.assert_called_once()
+
+    def test_unknown_backend_raises(self):
+        from interviews.ai.face_detectors import get_face_detector
+
+        with self.assertRaises(ValueError):
+            get_face_detector('mtcnn')
+
+    def test_batch_uses_backend_from_system_settings(self):
+        from results.models import SystemSettings
+        from interviews.ai import ScriptDetectionBatch
+
+        system_settings = SystemSettings.get_settings()
+        system_settings.face_detector_backend = 'ssd'
+        system_settings.save()
+
+        batch = ScriptDetectionBatch({}, executor='inline')
+        self.assertEqual(batch.detection_kwargs['detector'], 'ssd')
+
+
+@override_settings(
+    CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'transcript-cache-tests'}},
+    TRANSCRIPT_CACHE_ENABLED=True,
+)
+class TranscriptCacheTests(TestCase):
+    """Test that unchanged videos are not re-transcribed"""
+
+    def setUp(self):
+        from django.core.cache import cache
+        cache.clear()
+        video = tempfile.NamedTemporaryFile(suffix='.webm', delete=False)
+        video.write(b'fake video bytes')
+        video.close()
+        self.video_path = video.name
+
+    def tearDown(self):
+        os.unlink(self.video_path)
+
+    @override_settings(DEEPGRAM_API_KEY='test_api_key')
+    @patch('interviews.deepgram_service.build_proxy_output')
+    @patch('interviews.deepgram_service.DeepgramClient')
+    def test_cache_hit_still_writes_detection_proxy(self, mock_client, mock_build_proxy):
+        from interviews.deepgram_service import DeepgramTranscriptionService
+
+        service = DeepgramTranscriptionService()
+        service._log_usage = MagicMock()
+        service._parse_deepgram_response = MagicMock(return_value={
+            'transcript': 'hello', 'duration': 1.0, 'confidence': 0.9, 'word_count': 1, 'processing_time': 0.1,
+        })
+        with patch.object(service, '_stream_audio', side_effect=lambda *a, **k: (c for c in [b'abc'])), \
+                patch.object(service, '_transcribe_stream'):
+            service.transcribe_video(self.video_path, video_response_id=1)
+            cached = service.transcribe_video(self.video_path, video_response_id=1, proxy_path='/tmp/1.avi')
+
+        self.assertTrue(cached['cached'])
+        mock_build_proxy.assert_called_once_with(self.video_path, '/tmp/1.avi')
+        mock_build_proxy.return_value.overwrite_output.return_value.run.assert_called_once_with(quiet=True)
+
+    def test_cache_key_depends_on_content_and_options(self):
+        from interviews.transcript_cache import cache_key, file_digest
+
+        digest = file_digest(self.video_path)
+        self.assertNotEqual(cache_key(digest, 'deepgram', {'model': 'nova-2'}), cache_key(digest, 'deepgram', {'model': 'nova-3'}))
+
+        with open(self.video_path, 'ab') as video:
+            video.write(b'changed')
+        self.assertNotEqual(file_digest(self.video_path), digest)
+
+    @override_settings(DEEPGRAM_API_KEY='test_api_key', DEEPGRAM_STREAM_AUDIO=True)
+    @patch('interviews.deepgram_service.DeepgramClient')
+    def test_deepgram_retry_hits_cache(self, mock_client):
+        from interviews.deepgram_service import DeepgramTranscriptionService
+        from interviews.transcript_cache import cache_stats
+
+        service = DeepgramTranscriptionService()
+        service._log_usage = MagicMock()
+        service._parse_deepgram_response = MagicMock(return_value={
+            'transcript': 'hello', 'duration': 1.0, 'confidence': 0.9, 'word_count': 1, 'processing_time': 0.1,
+        })
+        with patch.object(service, '_stream_audio', side_effect=lambda *a, **k: (c for c in [b'abc'])), \
+                patch.object(service, '_transcribe_stream') as mock_transcribe:
+            first = service.transcribe_video(self.video_path, video_response_id=1)
+            second = service.transcribe_video(self.video_path, video_response_id=1)
+
+        mock_transcribe.assert_called_once()
+        self.assertEqual(second['transcript'], first['transcript'])
+        self.assertTrue(second['cached'])
+        self.assertEqual(cache_stats(), {'hits': 1, 'misses': 1, 'hit_rate': 0.5})
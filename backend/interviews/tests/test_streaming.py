@@ -0,0 +1,138 @@
+"""
+Test cases for HR review video streaming
+"""
+
+import shutil
+import tempfile
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.files.base import ContentFile
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient, APIRequestFactory
+
+from applicants.models import Applicant
+from interviews.models import Interview, InterviewQuestion, VideoResponse
+from interviews.streaming import parse_range, stream_token, stream_url
+from interviews.type_models import PositionType, QuestionType
+
+VIDEO = bytes(range(256)) * 40
+
+
+class VideoStreamTests(TestCase):
+    """Test Range / If-Range / conditional playback of video responses"""
+
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        settings_override = override_settings(MEDIA_ROOT=media_root, VIDEO_STREAM_OFFLOAD="")
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        qtype, _ = QuestionType.objects.get_or_create(code="general", defaults={"name": "General"})
+        position, _ = PositionType.objects.get_or_create(code="virtual-assistant", defaults={"name": "Virtual Assistant"})
+        applicant = Applicant.objects.create(
+            first_name="Stream",
+            last_name="Applicant",
+            email="stream@example.com",
+            phone="1234567890",
+            application_source="online",
+        )
+        interview = Interview.objects.create(applicant=applicant, position_type=position)
+        question = InterviewQuestion.objects.create(
+            question_text="Question?", question_type=qtype, position_type=position, order=1
+        )
+        self.video_response = VideoResponse(interview=interview, question=question, duration=timedelta(seconds=30))
+        self.video_response.video_file_path.save("answer.webm", ContentFile(VIDEO), save=False)
+        self.video_response.save()
+
+        self.hr_user = get_user_model().objects.create_superuser(username="hr-stream", password="pass")
+        self.client = APIClient()
+        self.url = f"/api/video-responses/{self.video_response.id}/stream/"
+        self.token_url = f"{self.url}?token={stream_token(self.video_response.id, self.hr_user)}"
+
+    def _body(self, response):
+        return b"".join(response.streaming_content)
+
+    def test_full_response_with_cache_headers(self):
+        response = self.client.get(self.token_url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self._body(response), VIDEO)
+        self.assertEqual(response["Content-Type"], "video/webm")
+        self.assertEqual(response["Accept-Ranges"], "bytes")
+        self.assertIn("private", response["Cache-Control"])
+        self.assertTrue(response["ETag"])
+        self.assertTrue(response["Last-Modified"])
+
+    def test_range_returns_partial_content(self):
+        response = self.client.get(self.token_url, HTTP_RANGE="bytes=100-199")
+
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response["Content-Range"], f"bytes 100-199/{len(VIDEO)}")
+        self.assertEqual(response["Content-Length"], "100")
+        self.assertEqual(self._body(response), VIDEO[100:200])
+
+    def test_unsatisfiable_range(self):
+        response = self.client.get(self.token_url, HTTP_RANGE=f"bytes={len(VIDEO)}-")
+
+        self.assertEqual(response.status_code, 416)
+        self.assertEqual(response["Content-Range"], f"bytes */{len(VIDEO)}")
+
+    def test_if_range_with_stale_validator_returns_whole_file(self):
+        etag = self.client.get(self.token_url)["ETag"]
+
+        current = self.client.get(self.token_url, HTTP_RANGE="bytes=0-9", HTTP_IF_RANGE=etag)
+        stale = self.client.get(self.token_url, HTTP_RANGE="bytes=0-9", HTTP_IF_RANGE='"stale"')
+
+        self.assertEqual(current.status_code, 206)
+        self.assertEqual(stale.status_code, 200)
+        self.assertEqual(self._body(stale), VIDEO)
+
+    def test_if_none_match_returns_not_modified(self):
+        etag = self.client.get(self.token_url)["ETag"]
+
+        response = self.client.get(self.token_url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
+
+    @override_settings(VIDEO_STREAM_OFFLOAD="x-accel-redirect", VIDEO_STREAM_ACCEL_PREFIX="/protected-media/")
+    def test_accel_redirect_offloads_bytes_to_web_server(self):
+        response = self.client.get(self.token_url, HTTP_RANGE="bytes=0-9")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["X-Accel-Redirect"], f"/protected-media/{self.video_response.video_file_path.name}")
+        self.assertEqual(response.content, b"")
+        self.assertTrue(response["ETag"])
+
+    def test_token_is_bound_to_video_and_required(self):
+        self.assertEqual(self.client.get(self.url).status_code, 401)
+        self.assertEqual(self.client.get(f"{self.url}?token=forged").status_code, 401)
+        wrong_video = self.client.get(f"{self.url}?token={stream_token(self.video_response.id + 1, self.hr_user)}")
+        self.assertEqual(wrong_video.status_code, 403)
+
+    def test_token_is_stable_within_its_window_and_expires(self):
+        import time
+
+        self.assertEqual(stream_token(self.video_response.id, self.hr_user), self.token_url.split("token=")[1])
+
+        expired = stream_token(self.video_response.id, self.hr_user, now=time.time() - 5 * 3600)
+        response = self.client.get(f"{self.url}?token={expired}")
+        self.assertEqual(response.status_code, 401)
+
+    def test_stream_url_is_signed_for_requesting_user(self):
+        request = APIRequestFactory().get("/api/results/1/review/details/")
+        request.user = self.hr_user
+
+        url = stream_url(request, self.video_response)
+
+        self.assertTrue(url.startswith(f"http://testserver{self.url}?token="))
+        self.assertEqual(self.client.get(url).status_code, 200)
+
+    def test_parse_range_forms(self):
+        self.assertEqual(parse_range("bytes=0-", 100), (0, 99))
+        self.assertEqual(parse_range("bytes=-10", 100), (90, 99))
+        self.assertEqual(parse_range("bytes=50-500", 100), (50, 99))
+        self.assertIsNone(parse_range("bytes=0-1,5-6", 100))
+        with self.assertRaises(ValueError):
+            parse_range("bytes=100-", 100)
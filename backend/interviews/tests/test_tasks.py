@@ -0,0 +1,641 @@
+"""
+Test cases for the interview processing tasks
+
+External services are mocked; these cover the database side of the pipeline.
+"""
+
+from datetime import timedelta
+from django.test import TestCase, override_settings
+from unittest.mock import patch, MagicMock
+
+from applicants.models import Applicant
+from interviews.models import AIAnalysis, Interview, InterviewQuestion, VideoResponse
+from interviews.type_models import PositionType, QuestionType
+from processing.models import ProcessingQueue, ProcessingStage
+
+ANALYSIS = {
+    'sentiment_score': 80,
+    'confidence_score': 75,
+    'speech_clarity_score': 70,
+    'content_relevance_score': 85,
+    'overall_score': 78,
+    'recommendation': 'pass',
+    'analysis_summary': 'Clear and relevant.',
+}
+
+
+class SaveAnalysisResultsTests(TestCase):
+    """Test the bulk persistence of batch LLM analyses"""
+
+    def setUp(self):
+        qtype, _ = QuestionType.objects.get_or_create(code="general", defaults={"name": "General"})
+        position, _ = PositionType.objects.get_or_create(code="virtual-assistant", defaults={"name": "Virtual Assistant"})
+        applicant = Applicant.objects.create(
+            first_name="Test",
+            last_name="Applicant",
+            email="bulk@example.com",
+            phone="1234567890",
+            application_source="online",
+        )
+        self.interview = Interview.objects.create(applicant=applicant, position_type=position)
+        for order in range(4):
+            question = InterviewQuestion.objects.create(
+                question_text=f"Question {order}?",
+                question_type=qtype,
+                position_type=position,
+                order=order,
+            )
+            VideoResponse.objects.create(
+                interview=self.interview,
+                question=question,
+                video_file_path=f"video_responses/{order}.webm",
+                duration=timedelta(seconds=30),
+                transcript=f"Detailed answer {order}." if order else "",
+            )
+
+    def _save(self, video_responses=None):
+        from interviews.tasks import save_analysis_results
+
+        video_responses = video_responses or list(self.interview.video_responses.order_by('id'))
+        return save_analysis_results(video_responses, [ANALYSIS] * len(video_responses))
+
+    def test_query_count_does_not_grow_with_videos(self):
+        video_responses = list(self.interview.video_responses.order_by('id'))
+
+        # savepoint + upsert + bulk update + release
+        with self.assertNumQueries(4):
+            saved = self._save(video_responses=video_responses)
+
+        self.assertEqual(saved, 3)
+        self.assertEqual(AIAnalysis.objects.filter(video_response__interview=self.interview).count(), 3)
+        self.assertIsNone(self.interview.video_responses.get(transcript="").ai_score)
+
+    def test_reprocessing_updates_existing_analyses(self):
+        self._save()
+        AIAnalysis.objects.update(overall_score=10)
+
+        self._save()
+
+        scores = set(AIAnalysis.objects.values_list('overall_score', flat=True))
+        self.assertEqual(scores, {78})
+        self.assertEqual(AIAnalysis.objects.count(), 3)
+
+
+class CreateInterviewResultTests(TestCase):
+    """Test that results are scored once from the responses already loaded"""
+
+    def setUp(self):
+        qtype, _ = QuestionType.objects.get_or_create(code="general", defaults={"name": "General"})
+        position, _ = PositionType.objects.get_or_create(code="virtual-assistant", defaults={"name": "Virtual Assistant"})
+        applicant = Applicant.objects.create(
+            first_name="Score",
+            last_name="Applicant",
+            email="score@example.com",
+            phone="1234567890",
+            application_source="online",
+        )
+        interview = Interview.objects.create(applicant=applicant, position_type=position)
+        for order, score in enumerate([90, 80, None, 85]):
+            question = InterviewQuestion.objects.create(
+                question_text=f"Question {order}?",
+                question_type=qtype,
+                position_type=position,
+                order=order,
+            )
+            VideoResponse.objects.create(
+                interview=interview,
+                question=question,
+                video_file_path=f"video_responses/{order}.webm",
+                duration=timedelta(seconds=30),
+                ai_score=score,
+            )
+        self.interview = Interview.objects.select_related('applicant', 'position_type').get(id=interview.id)
+        self.video_responses = list(self.interview.video_responses.select_related('question'))
+
+    def test_in_memory_scoring_query_count(self):
+        from interviews.tasks import create_interview_result
+
+        # Result update_or_create (2 savepoints, read, insert, 2 releases) + applicant save (read, update)
+        with self.assertNumQueries(8):
+            result = create_interview_result(
+                self.interview.id, interview=self.interview, video_responses=self.video_responses
+            )
+
+        self.assertTrue(result.passed)
+        self.interview.applicant.refresh_from_db()
+        self.assertEqual(self.interview.applicant.status, 'passed')
+
+    def test_scoring_does_not_touch_the_database(self):
+        from interviews.tasks import score_video_responses
+
+        with self.assertNumQueries(0):
+            score_data = score_video_responses(self.interview, self.video_responses)
+
+        self.assertEqual(score_data['total_responses'], 4)
+        self.assertEqual(score_data['technical_issues_count'], 1)
+
+    def test_calculate_interview_score_matches_in_memory_pass(self):
+        from interviews.tasks import calculate_interview_score, score_video_responses
+
+        with self.assertNumQueries(2):
+            score_data = calculate_interview_score(self.interview.id)
+
+        self.assertEqual(score_data, score_video_responses(self.interview, self.video_responses))
+
+
+@override_settings(TRANSCRIPT_WAIT_TIMEOUT=0, LLM_RESPONSE_CACHE_ENABLED=False)
+class InterviewPipelineTests(TestCase):
+    """Test the staged processing canvas, run eagerly"""
+
+    def setUp(self):
+        qtype, _ = QuestionType.objects.get_or_create(code="general", defaults={"name": "General"})
+        position, _ = PositionType.objects.get_or_create(code="virtual-assistant", defaults={"name": "Virtual Assistant"})
+        applicant = Applicant.objects.create(
+            first_name="Pipeline",
+            last_name="Applicant",
+            email="pipeline@example.com",
+            phone="1234567890",
+            application_source="online",
+        )
+        self.interview = Interview.objects.create(applicant=applicant, position_type=position)
+        self.queue_entry = ProcessingQueue.objects.create(interview=self.interview, status='pending')
+        for order in range(3):
+            question = InterviewQuestion.objects.create(
+                question_text=f"Question {order}?",
+                question_type=qtype,
+                position_type=position,
+                order=order,
+            )
+            VideoResponse.objects.create(
+                interview=self.interview,
+                question=question,
+                video_file_path=f"video_responses/{order}.webm",
+                duration=timedelta(seconds=30),
+                transcript=f"Detailed answer {order}." if order else "",
+                transcript_status='ready' if order else 'failed',
+            )
+
+        self.ai_service = MagicMock()
+        self.ai_service.batch_analyze_transcripts.side_effect = lambda data, **kwargs: [ANALYSIS] * len(data)
+        ai_service = patch('interviews.ai_service.get_ai_service', return_value=self.ai_service)
+        ai_service.start()
+        self.addCleanup(ai_service.stop)
+
+        detection = patch('interviews.ai.detection_pool.detect_script_reading', side_effect=self._detect)
+        detection.start()
+        self.addCleanup(detection.stop)
+
+        deepgram = patch('interviews.deepgram_service.get_deepgram_service')
+        self.mock_deepgram = deepgram.start()
+        self.addCleanup(deepgram.stop)
+        self.mock_deepgram.return_value.transcribe_video.return_value = {'transcript': 'Recovered answer.'}
+
+    def _detect(self, path, **kwargs):
+        status = 'suspicious' if path.endswith('2.webm') else 'clear'
+        return {'status': status, 'risk_score': 0, 'data': {'path': path}}
+
+    def test_stages_run_and_complete_interview(self):
+        from interviews.tasks import process_complete_interview
+
+        process_complete_interview.apply(args=[self.interview.id])
+
+        # Only the video without a transcript was re-transcribed
+        self.mock_deepgram.return_value.transcribe_video.assert_called_once()
+        self.ai_service.batch_analyze_transcripts.assert_called_once()
+        self.assertEqual(AIAnalysis.objects.filter(video_response__interview=self.interview).count(), 3)
+
+        self.interview.refresh_from_db()
+        self.assertEqual(self.interview.status, 'completed')
+        self.assertEqual(self.interview.authenticity_status, 'under_investigation')
+        self.assertTrue(self.interview.result.passed)
+        self.assertEqual(set(self.interview.video_responses.values_list('status', flat=True)), {'analyzed'})
+
+    def test_stages_record_timings_and_logs(self):
+        from interviews.tasks import process_complete_interview
+
+        process_complete_interview.apply(args=[self.interview.id], task_id='launch-task')
+
+        self.queue_entry.refresh_from_db()
+        self.assertEqual(self.queue_entry.status, 'completed')
+        self.assertEqual(self.queue_entry.celery_task_id, 'launch-task')
+
+        stages = list(self.queue_entry.stages.values_list('stage', 'status'))
+        self.assertEqual(sorted(stage for stage, _ in stages), sorted([
+            'transcription', 'llm_analysis', 'script_detection', 'script_detection', 'script_detection',
+            'scoring', 'notification',
+        ]))
+        self.assertEqual({status for _, status in stages}, {'completed'})
+        self.assertFalse(self.queue_entry.stages.filter(duration_ms__isnull=True).exists())
+        # One line per stage, the analysis summary, and the notification warning (no result email task yet)
+        self.assertEqual(self.queue_entry.logs.count(), 7 + 2)
+
+    def test_upload_time_stages_are_recorded_without_queue_entry(self):
+        from processing.tracking import track_stage
+
+        self.queue_entry.delete()
+        video = self.interview.video_responses.order_by('id').first()
+
+        with track_stage('transcription', video_response_id=video.id):
+            pass
+
+        stage = ProcessingStage.objects.get()
+        self.assertEqual((stage.interview_id, stage.queue_item_id), (self.interview.id, None))
+        self.assertEqual((stage.stage, stage.status), ('transcription', 'completed'))
+        self.assertIsNotNone(stage.duration_ms)
+
+    def test_failed_stage_retries_alone(self):
+        from interviews.tasks import analyze_interview_transcripts, detect_video_script_reading
+
+        vr_id = self.interview.video_responses.order_by('id').values_list('id', flat=True).first()
+        detect_video_script_reading.apply(args=[vr_id])
+        self.ai_service.batch_analyze_transcripts.side_effect = [RuntimeError('quota'), [ANALYSIS] * 3]
+
+        analyze_interview_transcripts.apply(args=[self.interview.id])
+
+        # The retry redid the analysis stage only
+        self.assertEqual(self.ai_service.batch_analyze_transcripts.call_count, 2)
+        self.assertEqual(
+            list(self.queue_entry.stages.filter(stage='llm_analysis').values_list('attempt', 'status')),
+            [(0, 'failed'), (1, 'completed')],
+        )
+        self.assertEqual(AIAnalysis.objects.filter(video_response__interview=self.interview).count(), 2)
+
+    def test_error_callback_marks_interview_failed(self):
+        from interviews.tasks import mark_interview_failed
+
+        mark_interview_failed.apply(args=[self.interview.id])
+
+        self.interview.refresh_from_db()
+        self.assertEqual(self.interview.status, 'failed')
+
+
+class TaskRoutingTests(TestCase):
+    """Test that pipeline stages land on the worker pool suited to them"""
+
+    def _queue(self, task_name):
+        from core.celery import app
+
+        return app.amqp.router.route({}, task_name)['queue'].name
+
+    def test_stages_route_to_their_pools(self):
+        self.assertEqual(self._queue('interviews.tasks.detect_video_script_reading'), 'media')
+        self.assertEqual(self._queue('interviews.tasks.normalize_video_response'), 'transcode')
+        self.assertEqual(self._queue('interviews.tasks.analyze_interview_transcripts'), 'io')
+        self.assertEqual(self._queue('interviews.tasks.ensure_transcript'), 'transcription')
+        self.assertEqual(self._queue('notifications.tasks.send_applicant_email_task'), 'notifications')
+        self.assertEqual(self._queue('interviews.tasks.finalize_interview'), 'celery')
+
+    def test_queue_depths_report_unreachable_broker_as_unknown(self):
+        from monitoring.queues import queue_depths
+
+        with patch('core.celery.app.connection_for_read', side_effect=OSError('broker down')):
+            self.assertEqual(queue_depths(['media', 'io']), {'media': None, 'io': None})
+
+    def test_queue_depths_count_waiting_messages(self):
+        from monitoring.queues import queue_depths
+
+        channel = MagicMock()
+        channel.queue_declare.side_effect = lambda queue, passive: MagicMock(message_count={'media': 4}.get(queue, 0))
+        connection = MagicMock()
+        connection.__enter__.return_value.default_channel = channel
+
+        with patch('core.celery.app.connection_for_read', return_value=connection):
+            self.assertEqual(queue_depths(['media', 'io']), {'media': 4, 'io': 0})
+
+
+class StageLatencyTests(TestCase):
+    """Test the p50/p95 stage latency report"""
+
+    def setUp(self):
+        from django.utils import timezone
+
+        position, _ = PositionType.objects.get_or_create(code="virtual-assistant", defaults={"name": "Virtual Assistant"})
+        applicant = Applicant.objects.create(
+            first_name="Latency",
+            last_name="Applicant",
+            email="latency@example.com",
+            phone="1234567890",
+            application_source="online",
+        )
+        queue_entry = ProcessingQueue.objects.create(
+            interview=Interview.objects.create(applicant=applicant, position_type=position)
+        )
+        now = timezone.now()
+        ProcessingStage.objects.bulk_create(
+            [
+                ProcessingStage(queue_item=queue_entry, stage='llm_analysis', status='completed',
+                                started_at=now, duration_ms=duration)
+                for duration in range(100, 2100, 100)
+            ]
+            + [
+                ProcessingStage(queue_item=queue_entry, stage='llm_analysis', status='failed',
+                                started_at=now, duration_ms=99999),
+                ProcessingStage(queue_item=queue_entry, stage='scoring', status='completed',
+                                started_at=now - timedelta(days=3), duration_ms=50),
+            ]
+        )
+
+    def test_percentiles_over_completed_runs_in_window(self):
+        from django.utils import timezone
+        from processing.tracking import stage_latency
+
+        latency = stage_latency(timezone.now() - timedelta(hours=24))
+
+        self.assertEqual(latency['llm_analysis'], {'count': 20, 'p50_ms': 1000, 'p95_ms': 1900, 'max_ms': 2000})
+        self.assertEqual(latency['scoring']['count'], 0)
+
+    def test_endpoint_requires_hr_or_it(self):
+        from django.contrib.auth import get_user_model
+        from rest_framework.test import APIClient
+
+        client = APIClient()
+        self.assertIn(client.get('/api/system/processing-stages/latency/').status_code, (401, 403))
+
+        client.force_authenticate(get_user_model().objects.create_user(username="it", password="pass", is_staff=True))
+        response = client.get('/api/system/processing-stages/latency/', {'hours': 96})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['stages']['scoring']['count'], 1)
+
+
+    def test_admin_search_over_stages_and_logs(self):
+        from django.contrib.auth import get_user_model
+
+        self.client.force_login(get_user_model().objects.create_superuser(username="admin", password="pass"))
+
+        for changelist in ('/admin/processing/processingstage/', '/admin/processing/processinglog/'):
+            self.assertEqual(self.client.get(changelist, {'q': 'Latency'}).status_code, 200)
+
+
+@override_settings(
+    CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'eta-tests'}},
+    ETA_PERCENTILE=0.9,
+    ETA_MIN_SAMPLES=5,
+    ETA_DURATION_BUCKETS=[60, 180],
+    ETA_PIPELINE_CONCURRENCY=2,
+)
+class EtaModelTests(TestCase):
+    """Test completion estimates learned from stage timings"""
+
+    def setUp(self):
+        from django.core.cache import cache
+        from django.utils import timezone
+
+        cache.clear()
+        qtype, _ = QuestionType.objects.get_or_create(code="general", defaults={"name": "General"})
+        position, _ = PositionType.objects.get_or_create(code="virtual-assistant", defaults={"name": "Virtual Assistant"})
+        applicant = Applicant.objects.create(
+            first_name="Eta",
+            last_name="Applicant",
+            email="eta@example.com",
+            phone="1234567890",
+            application_source="online",
+        )
+        self.interview = Interview.objects.create(applicant=applicant, position_type=position)
+        self.short_video, self.long_video = [
+            VideoResponse.objects.create(
+                interview=self.interview,
+                question=InterviewQuestion.objects.create(
+                    question_text=f"Question {order}?",
+                    question_type=qtype,
+                    position_type=position,
+                    order=order,
+                ),
+                video_file_path=f"video_responses/{order}.webm",
+                duration=timedelta(seconds=seconds),
+            )
+            for order, seconds in enumerate([30, 240])
+        ]
+
+        history = ProcessingQueue.objects.create(interview=self.interview, status='completed')
+        now = timezone.now()
+        ProcessingStage.objects.bulk_create(
+            [
+                ProcessingStage(queue_item=history, stage='transcription', status='completed', started_at=now,
+                                video_response_id=self.short_video.id, duration_ms=duration)
+                for duration in range(1000, 6000, 1000)
+            ]
+            + [
+                ProcessingStage(queue_item=history, stage='transcription', status='completed', started_at=now,
+                                video_response_id=self.long_video.id, duration_ms=duration)
+                for duration in range(20000, 70000, 10000)
+            ]
+        )
+
+    def test_model_buckets_per_video_stages_by_duration(self):
+        from processing.eta import build_model, stage_ms, DEFAULT_STAGE_MS
+
+        model = build_model()
+
+        self.assertEqual(stage_ms(model, 'transcription', 30), 5000)
+        self.assertEqual(stage_ms(model, 'transcription', 240), 60000)
+        # No 60-180s samples yet: falls back to every transcription run
+        self.assertEqual(stage_ms(model, 'transcription', 100), 50000)
+        self.assertEqual(stage_ms(model, 'llm_analysis'), DEFAULT_STAGE_MS['llm_analysis'])
+
+    def test_estimate_skips_finished_stages_and_prices_queue_ahead(self):
+        from django.utils import timezone
+        from processing.eta import estimate_seconds, refresh_model
+
+        refresh_model()
+        earlier = timezone.now() - timedelta(minutes=5)
+        for _ in range(2):
+            ProcessingQueue.objects.filter(
+                id=ProcessingQueue.objects.create(interview=self.interview).id
+            ).update(created_at=earlier)
+        queue_entry = ProcessingQueue.objects.create(interview=self.interview)
+        ProcessingStage.objects.create(queue_item=queue_entry, stage='transcription', status='completed',
+                                       started_at=timezone.now(), video_response_id=self.short_video.id,
+                                       duration_ms=3000)
+
+        # Long video transcription 60s, then Gemini 20s (beats 8s detection), scoring 1s,
+        # notification 0.5s; two entries ahead at concurrency 2 wait one 60s pipeline
+        self.assertEqual(estimate_seconds(queue_entry), 60 + 20 + 1 + 1 + 60)
+
+        queue_entry.status = 'completed'
+        self.assertEqual(estimate_seconds(queue_entry), 0)
+
+    def test_cold_cache_uses_defaults_without_rebuilding(self):
+        from processing.eta import DEFAULT_STAGE_MS, get_model, stage_ms
+
+        with self.assertNumQueries(0):
+            model = get_model()
+
+        self.assertEqual(stage_ms(model, 'transcription', 240), DEFAULT_STAGE_MS['transcription'])
+
+    def test_beat_task_caches_model(self):
+        from django.core.cache import cache
+        from processing.eta import CACHE_KEY, get_model
+        from processing.tasks import refresh_eta_model
+
+        result = refresh_eta_model.apply().get()
+
+        self.assertEqual(result['stages'], ['transcription'])
+        self.assertEqual(cache.get(CACHE_KEY)['stages']['transcription']['2']['ms'], 60000)
+        with self.assertNumQueries(0):
+            get_model()
+
+
+class FakeStatusRedis:
+    """Just enough of redis-py strings and pub/sub for processing status"""
+
+    def __init__(self):
+        self.values = {}
+        self.subscribers = {}
+
+    def set(self, key, value, ex=None):
+        self.values[key] = value
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def publish(self, channel, message):
+        for pubsub in self.subscribers.get(channel, []):
+            pubsub.messages.append({'type': 'message', 'data': message.encode()})
+
+    def pubsub(self, ignore_subscribe_messages=False):
+        return FakePubSub(self)
+
+
+class FakePubSub:
+    def __init__(self, redis):
+        self.redis = redis
+        self.messages = []
+
+    def subscribe(self, channel):
+        self.redis.subscribers.setdefault(channel, []).append(self)
+
+    def get_message(self, timeout=0.0):
+        return self.messages.pop(0) if self.messages else None
+
+    def close(self):
+        pass
+
+
+@override_settings(
+    CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'status-tests'}},
+)
+class ProcessingStatusTests(TestCase):
+    """Test status snapshots published by the pipeline and served to clients"""
+
+    def setUp(self):
+        from django.core.cache import cache
+
+        cache.clear()
+        qtype, _ = QuestionType.objects.get_or_create(code="general", defaults={"name": "General"})
+        position, _ = PositionType.objects.get_or_create(code="virtual-assistant", defaults={"name": "Virtual Assistant"})
+        applicant = Applicant.objects.create(
+            first_name="Status",
+            last_name="Applicant",
+            email="status@example.com",
+            phone="1234567890",
+            application_source="online",
+        )
+        self.interview = Interview.objects.create(applicant=applicant, position_type=position)
+        self.video = VideoResponse.objects.create(
+            interview=self.interview,
+            question=InterviewQuestion.objects.create(
+                question_text="Question?", question_type=qtype, position_type=position, order=1
+            ),
+            video_file_path="video_responses/1.webm",
+            duration=timedelta(seconds=30),
+        )
+        self.queue_entry = ProcessingQueue.objects.create(interview=self.interview, status='processing')
+
+        self.redis = FakeStatusRedis()
+        patcher = patch('processing.status._get_redis', return_value=self.redis)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _client(self):
+        from django.contrib.auth import get_user_model
+        from rest_framework.test import APIClient
+
+        client = APIClient()
+        client.force_authenticate(get_user_model().objects.create_superuser(username="hr", password="pass"))
+        return client
+
+    def test_stage_transitions_are_published(self):
+        import json
+        from processing.status import channel_name
+        from processing.tracking import track_stage
+
+        subscriber = self.redis.pubsub()
+        subscriber.subscribe(channel_name(self.interview.id))
+
+        with track_stage('transcription', video_response_id=self.video.id):
+            pass
+
+        stages = [json.loads(message['data'])['stage'] for message in subscriber.messages]
+        self.assertEqual(
+            stages,
+            [
+                {'name': 'transcription', 'status': 'running', 'video_response_id': self.video.id},
+                {'name': 'transcription', 'status': 'completed', 'video_response_id': self.video.id},
+            ],
+        )
+
+    def test_processing_status_is_served_from_snapshot(self):
+        from processing.status import publish
+
+        publish(self.queue_entry, stage={'name': 'llm_analysis', 'status': 'running', 'video_response_id': None})
+        client = self._client()
+
+        # Only the interview lookup; no queue, count or stage queries
+        with self.assertNumQueries(1):
+            response = client.get(f'/api/interviews/{self.interview.id}/processing-status/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['status'], 'processing')
+        self.assertEqual(response.data['progress'], {'total_videos': 1, 'processed': 0, 'remaining': 1})
+        self.assertEqual(response.data['stage']['name'], 'llm_analysis')
+        self.assertGreater(response.data['estimated_seconds_remaining'], 0)
+
+    def test_missing_snapshot_is_rebuilt_from_database(self):
+        from processing.status import snapshot_key
+
+        response = self._client().get(f'/api/interviews/{self.interview.id}/processing-status/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['status'], 'processing')
+        self.assertIn(snapshot_key(self.interview.id), self.redis.values)
+
+    def test_event_stream_pushes_updates_until_final(self):
+        from processing.status import event_stream, publish
+
+        stream = event_stream(publish(self.queue_entry))
+        self.assertTrue(next(stream).startswith('retry: 5000\nevent: status\ndata: {"status": "processing"'))
+        self.assertEqual(next(stream), ': keepalive\n\n')
+
+        ProcessingQueue.objects.filter(id=self.queue_entry.id).update(status='completed')
+        self.queue_entry.refresh_from_db()
+        publish(self.queue_entry)
+
+        events = list(stream)
+        self.assertEqual(len(events), 1)
+        self.assertIn('"status": "completed"', events[0])
+        self.assertIn('"estimated_seconds_remaining": 0', events[0])
+
+    @override_settings(CACHES={'default': {'BACKEND': 'django_redis.cache.RedisCache', 'LOCATION': 'redis://localhost:6379/1'}})
+    def test_async_streams_share_one_redis_client(self):
+        import asyncio
+        from processing.status import _get_async_redis
+
+        async def two_streams():
+            return _get_async_redis(), _get_async_redis()
+
+        first, second = asyncio.run(two_streams())
+        self.assertIs(first, second)
+
+    def test_events_endpoint_streams_sse(self):
+        ProcessingQueue.objects.filter(id=self.queue_entry.id).update(status='completed')
+
+        response = self._client().get(
+            f'/api/interviews/{self.interview.id}/processing-events/', HTTP_ACCEPT='text/event-stream'
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        body = b''.join(response.streaming_content).decode()
+        self.assertIn('event: status', body)
+        self.assertIn('Processing complete!', body)
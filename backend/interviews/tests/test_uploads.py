@@ -0,0 +1,288 @@
+"""
+Test cases for resumable chunked video uploads
+"""
+
+import hashlib
+import os
+import shutil
+import tempfile
+from datetime import timedelta
+from unittest.mock import PropertyMock, patch
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from applicants.models import Applicant
+from interviews.models import Interview, InterviewQuestion, UploadSession, VideoResponse
+from interviews.type_models import PositionType, QuestionType
+
+VIDEO = b"0123456789" * 1000
+CHECKSUM = hashlib.sha256(VIDEO).hexdigest()
+
+
+class UploadTestCase(TestCase):
+    """Interview, question and MEDIA_ROOT for upload tests on the public interview API"""
+
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        settings_override = override_settings(MEDIA_ROOT=media_root, UPLOAD_STREAM_BLOCK_SIZE=1024)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        qtype, _ = QuestionType.objects.get_or_create(code="general", defaults={"name": "General"})
+        position, _ = PositionType.objects.get_or_create(code="virtual-assistant", defaults={"name": "Virtual Assistant"})
+        applicant = Applicant.objects.create(
+            first_name="Upload",
+            last_name="Applicant",
+            email="upload@example.com",
+            phone="1234567890",
+            application_source="online",
+        )
+        self.interview = Interview.objects.create(applicant=applicant, position_type=position)
+        self.question = InterviewQuestion.objects.create(
+            question_text="Question?", question_type=qtype, position_type=position, order=1
+        )
+        self.interview.selected_question_ids = [self.question.id]
+        self.interview.save(update_fields=["selected_question_ids"])
+        self.client = APIClient()
+        self.base_url = f"/api/public/interviews/{self.interview.id}/uploads/"
+
+    def _start(self, checksum=CHECKSUM):
+        response = self.client.post(self.base_url, {
+            "question_id": self.question.id,
+            "duration": "00:00:30",
+            "file_name": "answer.webm",
+            "total_size": len(VIDEO),
+            "checksum": checksum,
+        }, format="json")
+        self.assertEqual(response.status_code, 201, response.data)
+        return response.data["upload_id"]
+
+    def _put(self, upload_id, offset, chunk):
+        return self.client.put(
+            f"{self.base_url}{upload_id}/",
+            data=chunk,
+            content_type="application/octet-stream",
+            HTTP_UPLOAD_OFFSET=str(offset),
+        )
+
+    def _media_root(self):
+        from django.conf import settings
+        return str(settings.MEDIA_ROOT)
+
+
+class ChunkedUploadTests(UploadTestCase):
+    """Test the init / chunk / finalize upload protocol"""
+
+    @patch("interviews.public.views.enqueue_transcription")
+    def test_chunks_are_appended_and_finalize_creates_response(self, mock_enqueue):
+        upload_id = self._start()
+
+        self.assertEqual(self._put(upload_id, 0, VIDEO[:6000]).data["offset"], 6000)
+        self.assertEqual(self.client.get(f"{self.base_url}{upload_id}/").data["offset"], 6000)
+        self.assertEqual(self._put(upload_id, 6000, VIDEO[6000:]).data["offset"], len(VIDEO))
+
+        response = self.client.post(f"{self.base_url}{upload_id}/finalize/")
+
+        self.assertEqual(response.status_code, 201, response.data)
+        video_response = VideoResponse.objects.get(interview=self.interview, question=self.question)
+        self.assertEqual(response.data["video_response"]["id"], video_response.id)
+        self.assertTrue(video_response.video_file_path.name.endswith(f"{upload_id}.webm"))
+        with video_response.video_file_path.open("rb") as stored:
+            self.assertEqual(stored.read(), VIDEO)
+        self.assertEqual(video_response.duration, timedelta(seconds=30))
+        mock_enqueue.assert_called_once_with(video_response.id)
+
+        # A retried finalize does not create a second response
+        retry = self.client.post(f"{self.base_url}{upload_id}/finalize/")
+        self.assertEqual(retry.status_code, 200)
+        self.assertEqual(retry.data["video_response_id"], video_response.id)
+
+    def test_chunk_at_wrong_offset_is_rejected_with_current_offset(self):
+        upload_id = self._start()
+        self._put(upload_id, 0, VIDEO[:4000])
+
+        response = self._put(upload_id, 2000, VIDEO[2000:6000])
+
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response.data["offset"], 4000)
+
+    def test_concurrent_chunk_for_same_upload_is_rejected(self):
+        upload_id = self._start()
+        UploadSession.objects.filter(id=upload_id).update(
+            chunk_lease_until=timezone.now() + timedelta(minutes=1)
+        )
+
+        response = self._put(upload_id, 0, VIDEO[:4000])
+
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(UploadSession.objects.get(id=upload_id).received_bytes, 0)
+
+    def test_expired_chunk_lease_is_reclaimed(self):
+        upload_id = self._start()
+        UploadSession.objects.filter(id=upload_id).update(
+            chunk_lease_until=timezone.now() - timedelta(seconds=1)
+        )
+
+        response = self._put(upload_id, 0, VIDEO[:4000])
+
+        self.assertEqual(response.data["offset"], 4000)
+        self.assertIsNone(UploadSession.objects.get(id=upload_id).chunk_lease_until)
+
+    def test_incomplete_upload_cannot_be_finalized(self):
+        upload_id = self._start()
+        self._put(upload_id, 0, VIDEO[:4000])
+
+        response = self.client.post(f"{self.base_url}{upload_id}/finalize/")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(VideoResponse.objects.exists())
+
+    def test_checksum_mismatch_fails_session_and_removes_file(self):
+        upload_id = self._start(checksum="0" * 64)
+        self._put(upload_id, 0, VIDEO)
+
+        response = self.client.post(f"{self.base_url}{upload_id}/finalize/")
+
+        self.assertEqual(response.status_code, 400)
+        session = UploadSession.objects.get(id=upload_id)
+        self.assertEqual(session.status, "failed")
+        self.assertFalse(os.path.exists(os.path.join(self._media_root(), session.file_name)))
+        self.assertFalse(VideoResponse.objects.exists())
+
+    def test_stale_sessions_are_cleaned_up(self):
+        from interviews.tasks import cleanup_stale_uploads
+
+        upload_id = self._start()
+        self._put(upload_id, 0, VIDEO[:4000])
+        session = UploadSession.objects.get(id=upload_id)
+        UploadSession.objects.filter(id=upload_id).update(updated_at=session.updated_at - timedelta(days=2))
+
+        self.assertEqual(cleanup_stale_uploads(), {"deleted": 1})
+        self.assertFalse(UploadSession.objects.exists())
+        self.assertFalse(os.path.exists(os.path.join(self._media_root(), session.file_name)))
+
+
+    def test_stale_detection_proxies_are_cleaned_up(self):
+        from interviews.tasks import cleanup_stale_uploads
+
+        proxy_dir = os.path.join(self._media_root(), "analysis_proxies")
+        os.makedirs(proxy_dir)
+        stale, fresh = os.path.join(proxy_dir, "1.avi"), os.path.join(proxy_dir, "2.avi")
+        for path in (stale, fresh):
+            open(path, "wb").close()
+        two_days_ago = os.path.getmtime(stale) - 2 * 86400
+        os.utime(stale, (two_days_ago, two_days_ago))
+
+        cleanup_stale_uploads()
+
+        self.assertFalse(os.path.exists(stale))
+        self.assertTrue(os.path.exists(fresh))
+
+
+@override_settings(VIDEO_STORAGE_BACKEND="s3", OBJECT_STORAGE_BUCKET="videos")
+class PresignedUploadTests(UploadTestCase):
+    """Test the same protocol when the browser uploads straight to object storage"""
+
+    def setUp(self):
+        super().setUp()
+        client_patch = patch("common.object_storage.get_client")
+        self.s3 = client_patch.start()
+        self.addCleanup(client_patch.stop)
+        self.s3.return_value.generate_presigned_url.return_value = "https://storage.example.com/signed"
+
+    def _stored(self, size=len(VIDEO), checksum=CHECKSUM):
+        from common.object_storage import sha256_base64
+        self.s3.return_value.head_object.return_value = {
+            "ContentLength": size, "ChecksumSHA256": sha256_base64(checksum),
+        }
+
+    def test_start_returns_presigned_put(self):
+        response = self.client.post(self.base_url, {
+            "question_id": self.question.id,
+            "duration": "00:00:30",
+            "file_name": "answer.webm",
+            "total_size": len(VIDEO),
+            "checksum": CHECKSUM,
+        }, format="json")
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data["upload_url"], "https://storage.example.com/signed")
+        self.assertEqual(response.data["upload_method"], "PUT")
+        self.assertEqual(response.data["upload_headers"]["Content-Type"], "video/webm")
+        params = self.s3.return_value.generate_presigned_url.call_args.kwargs["Params"]
+        self.assertEqual(params["Bucket"], "videos")
+        self.assertEqual(params["ChecksumSHA256"], response.data["upload_headers"]["x-amz-checksum-sha256"])
+        session = UploadSession.objects.get(id=response.data["upload_id"])
+        self.assertEqual(session.storage, "s3")
+        self.assertFalse(os.path.exists(os.path.join(self._media_root(), session.file_name)))
+
+    def test_chunks_through_the_api_are_rejected(self):
+        upload_id = self._start()
+        self.assertEqual(self._put(upload_id, 0, VIDEO[:6000]).status_code, 409)
+
+    @patch("interviews.public.views.enqueue_transcription")
+    def test_finalize_registers_uploaded_object(self, mock_enqueue):
+        upload_id = self._start()
+        self._stored()
+
+        response = self.client.post(f"{self.base_url}{upload_id}/finalize/")
+
+        self.assertEqual(response.status_code, 201, response.data)
+        video_response = VideoResponse.objects.get(interview=self.interview, question=self.question)
+        self.assertTrue(video_response.video_file_path.name.endswith(f"{upload_id}.webm"))
+        self.assertEqual(UploadSession.objects.get(id=upload_id).received_bytes, len(VIDEO))
+        mock_enqueue.assert_called_once_with(video_response.id)
+
+    def test_missing_object_cannot_be_finalized(self):
+        upload_id = self._start()
+        error = Exception("Not Found")
+        error.response = {"Error": {"Code": "404"}}
+        self.s3.return_value.head_object.side_effect = error
+
+        response = self.client.post(f"{self.base_url}{upload_id}/finalize/")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(UploadSession.objects.get(id=upload_id).status, "uploading")
+        self.assertFalse(VideoResponse.objects.exists())
+
+    def test_size_mismatch_fails_session_and_removes_object(self):
+        upload_id = self._start()
+        self._stored(size=len(VIDEO) - 1)
+
+        response = self.client.post(f"{self.base_url}{upload_id}/finalize/")
+
+        self.assertEqual(response.status_code, 400)
+        session = UploadSession.objects.get(id=upload_id)
+        self.assertEqual(session.status, "failed")
+        self.s3.return_value.delete_object.assert_called_once_with(Bucket="videos", Key=session.file_name)
+        self.assertFalse(VideoResponse.objects.exists())
+
+    def test_stale_sessions_delete_their_objects(self):
+        from interviews.tasks import cleanup_stale_uploads
+
+        upload_id = self._start()
+        session = UploadSession.objects.get(id=upload_id)
+        UploadSession.objects.filter(id=upload_id).update(updated_at=session.updated_at - timedelta(days=2))
+
+        self.assertEqual(cleanup_stale_uploads(), {"deleted": 1})
+        self.s3.return_value.delete_object.assert_called_once_with(Bucket="videos", Key=session.file_name)
+
+    @patch("django.db.models.fields.files.FieldFile.path", new_callable=PropertyMock, side_effect=NotImplementedError)
+    def test_local_video_downloads_temporary_copy(self, _path):
+        from interviews.media_pipeline import local_video
+
+        video_response = VideoResponse(video_file_path="video_responses/2026/01/01/answer.webm")
+
+        def download(bucket, key, path):
+            with open(path, "wb") as f:
+                f.write(VIDEO)
+        self.s3.return_value.download_file.side_effect = download
+
+        with local_video(video_response) as path:
+            self.assertTrue(path.endswith(".webm"))
+            with open(path, "rb") as f:
+                self.assertEqual(f.read(), VIDEO)
+        self.assertFalse(os.path.exists(path))
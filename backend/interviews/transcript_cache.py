@@ -0,0 +1,84 @@
+"""
+Content-addressed transcript cache
+
+Retried bulk processing runs and `reprocess_videos --force` used to send
+unchanged videos back to Deepgram/Gemini. Transcripts are now cached under
+a SHA-256 of the video bytes plus the engine and its options, so the same
+file with the same settings is only ever transcribed once. Hits and misses
+are counted in monitoring (see monitoring.metrics).
+"""
+
+import hashlib
+import json
+import logging
+
+from django.conf import settings
+from django.core.cache import cache
+
+from monitoring import metrics
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = 'transcript'
+METRIC_PREFIX = 'transcript_cache'
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def cache_enabled():
+    return getattr(settings, 'TRANSCRIPT_CACHE_ENABLED', True)
+
+
+def file_digest(path):
+    """SHA-256 of a file, read in chunks"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as media:
+        for chunk in iter(lambda: media.read(HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def options_fingerprint(options):
+    """Stable short hash of the engine options that affect the transcript"""
+    encoded = json.dumps(options, sort_keys=True, default=str).encode()
+    return hashlib.sha256(encoded).hexdigest()[:16]
+
+
+def cache_key(digest, engine, options):
+    return f"{KEY_PREFIX}:{engine}:{options_fingerprint(options)}:{digest}"
+
+
+def get_cached_transcript(video_file_path, engine, options):
+    """
+    Look up a cached transcript for this file and engine configuration
+
+    Returns (key, value); value is None on a miss. key is None when the
+    cache is disabled or the file cannot be hashed, so callers skip storing.
+    """
+    if not cache_enabled():
+        return None, None
+    try:
+        key = cache_key(file_digest(video_file_path), engine, options)
+    except OSError as e:
+        logger.warning(f"Could not hash {video_file_path} for transcript cache: {e}")
+        return None, None
+
+    try:
+        value = cache.get(key)
+    except Exception:
+        value = None  # Cache failure is not critical
+
+    metrics.increment(f"{METRIC_PREFIX}.{'hit' if value is not None else 'miss'}")
+    return key, value
+
+
+def store_transcript(key, value):
+    if not key:
+        return
+    try:
+        cache.set(key, value, timeout=getattr(settings, 'TRANSCRIPT_CACHE_TTL', None))
+    except Exception:
+        pass  # Cache failure is not critical
+
+
+def cache_stats():
+    return metrics.hit_rate_summary(METRIC_PREFIX)
@@ -0,0 +1,341 @@
+"""
+Resumable chunked upload of video responses
+
+Instead of one multipart request carrying the whole recording:
+
+    POST /interviews/{id}/uploads/
+        {question_id, duration, file_name, total_size, checksum (SHA-256 hex)}
+        -> {upload_id, offset: 0, ...}
+    PUT  /interviews/{id}/uploads/{upload_id}/
+        raw chunk as the body (application/octet-stream), Upload-Offset header
+        -> {offset, ...}
+    GET  /interviews/{id}/uploads/{upload_id}/
+        -> {offset, ...} to resume after a dropped connection
+    POST /interviews/{id}/uploads/{upload_id}/finalize/
+        -> same payload as the single-request video-response upload
+
+Each chunk is streamed from the request body onto the end of the final file
+in UPLOAD_STREAM_BLOCK_SIZE blocks, so no request is buffered in memory or in a
+temp file, and a request never carries more than UPLOAD_MAX_CHUNK_SIZE. Bytes
+that arrived before a connection dropped are kept, so a retry resends only
+the rest. A chunk at the wrong offset gets 409 with the current offset.
+Finalize checks the size and SHA-256 and then creates the VideoResponse the
+same way the single-request upload does.
+
+No database lock is held while bytes move. A chunk claims the session with
+one conditional UPDATE that sets chunk_lease_until (a concurrent chunk for
+the same upload gets 409), streams the body, and then commits the new offset
+and clears the lease with another. A lease left by a worker that died
+mid-chunk expires after UPLOAD_CHUNK_LEASE_SECONDS. Finalize hashes the file without a lock and only
+re-checks the session row in the short transaction that registers it.
+
+With VIDEO_STORAGE_BACKEND = 's3' the same endpoints run in presigned mode.
+Starting an upload returns `upload_url`, `upload_method` and
+`upload_headers`, and the browser PUTs the whole file straight to object
+storage (common/object_storage.py), so no chunks go through the API. The
+signed SHA-256 makes the storage service reject a corrupted body. Finalize
+checks that the object exists with the declared size, then registers it
+the same way.
+
+Sessions abandoned for UPLOAD_SESSION_TTL_HOURS are deleted together with
+their partial files or objects by the cleanup_stale_uploads beat task.
+"""
+
+import hashlib
+import logging
+import mimetypes
+import os
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.db.models import Q
+from django.http import UnreadablePostError
+from django.shortcuts import get_object_or_404
+from django.utils import timezone
+from django.utils.text import get_valid_filename
+from rest_framework import status
+from rest_framework.decorators import action
+from rest_framework.response import Response
+
+from common import object_storage
+from .models import InterviewQuestion, UploadSession, VideoResponse
+
+logger = logging.getLogger(__name__)
+
+UPLOAD_ID_PATTERN = r'[0-9a-f-]{36}'
+DEFAULT_EXTENSION = '.webm'
+
+
+def _video_field():
+    return VideoResponse._meta.get_field('video_file_path')
+
+
+def upload_path(file_name):
+    """Local filesystem path of a storage name; chunk appends need a seekable local file"""
+    return default_storage.path(file_name)
+
+
+def new_file_name(upload_id, client_file_name):
+    extension = os.path.splitext(get_valid_filename(client_file_name or ''))[1].lower() or DEFAULT_EXTENSION
+    return _video_field().generate_filename(None, f"{upload_id}{extension}")
+
+
+def upload_state(session):
+    return {
+        'upload_id': str(session.id),
+        'status': session.status,
+        'offset': session.received_bytes,
+        'total_size': session.total_size,
+        'chunk_size': settings.UPLOAD_CHUNK_SIZE,
+    }
+
+
+def claim_chunk(session, offset):
+    """
+    Take the session's chunk lease if it is uploading and expects `offset`
+
+    Returns False when the session moved on or another request holds an
+    unexpired lease.
+    """
+    now = timezone.now()
+    return bool(
+        UploadSession.objects
+        .filter(id=session.id, status='uploading', received_bytes=offset)
+        .filter(Q(chunk_lease_until__isnull=True) | Q(chunk_lease_until__lt=now))
+        .update(chunk_lease_until=now + timedelta(seconds=settings.UPLOAD_CHUNK_LEASE_SECONDS))
+    )
+
+
+def append_chunk(session, destination, stream, length):
+    """
+    Write up to `length` bytes from `stream` at the session's offset
+
+    Returns the number of bytes written. A client disconnect stops the copy
+    but keeps what arrived; bytes past the recorded offset (left by a
+    worker that died mid-chunk) are discarded first.
+    """
+    block_size = settings.UPLOAD_STREAM_BLOCK_SIZE
+    written = 0
+    destination.truncate(session.received_bytes)
+    destination.seek(session.received_bytes)
+    try:
+        while written < length:
+            block = stream.read(min(block_size, length - written))
+            if not block:
+                break
+            destination.write(block)
+            written += len(block)
+    except (UnreadablePostError, OSError) as e:
+        logger.warning(f"Upload {session.id} chunk interrupted after {written} bytes: {e}")
+    return written
+
+
+def delete_upload(session):
+    """Remove a session's partial file or object"""
+    if session.storage == 's3':
+        object_storage.delete(session.file_name)
+    else:
+        default_storage.delete(session.file_name)
+
+
+def verify_upload(session):
+    """
+    (error, fatal) if the uploaded file cannot be registered yet, else (None, False)
+
+    A fatal error means the bytes are wrong and the upload must start over.
+    """
+    if session.storage == 's3':
+        stored = object_storage.head(session.file_name)
+        if stored is None:
+            return 'Upload incomplete', False
+        if stored['size'] != session.total_size:
+            return 'Uploaded file size does not match; start a new upload', True
+        if stored['checksum_sha256'] and stored['checksum_sha256'] != object_storage.sha256_base64(session.checksum):
+            return 'Checksum mismatch; start a new upload', True
+        session.received_bytes = stored['size']
+        return None, False
+
+    if session.received_bytes != session.total_size:
+        return 'Upload incomplete', False
+    if file_sha256(upload_path(session.file_name)) != session.checksum:
+        return 'Checksum mismatch; start a new upload', True
+    return None, False
+
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as source:
+        for block in iter(lambda: source.read(settings.UPLOAD_STREAM_BLOCK_SIZE), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def response_error(interview, question):
+    """Why a new response for this question cannot be accepted, or None"""
+    if interview.status in ['submitted', 'processing', 'completed']:
+        return 'Interview already submitted or completed'
+    if question.position_type_id != interview.position_type_id:
+        return 'Invalid question for this position.'
+    if VideoResponse.objects.filter(interview=interview, question=question).exists():
+        return 'A response for this question already exists'
+    return None
+
+
+class ChunkedUploadMixin:
+    """
+    Resumable upload actions for an interview viewset
+
+    The viewset implements video_response_created(interview, video_response),
+    which runs the post-upload steps and returns the response payload.
+    """
+
+    @action(detail=True, methods=['post'], url_path='uploads')
+    def start_upload(self, request, pk=None):
+        from .serializers import UploadSessionCreateSerializer
+
+        interview = self.get_object()
+        serializer = UploadSessionCreateSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        question = get_object_or_404(InterviewQuestion, id=data['question_id'], is_active=True)
+        error = response_error(interview, question)
+        if error:
+            return Response({'error': error}, status=status.HTTP_400_BAD_REQUEST)
+
+        session = UploadSession(
+            interview=interview,
+            question=question,
+            duration=data['duration'],
+            total_size=data['total_size'],
+            checksum=data['checksum'].lower(),
+        )
+        session.file_name = new_file_name(session.id, data.get('file_name'))
+
+        if object_storage.s3_enabled():
+            session.storage = 's3'
+            session.save()
+            content_type = mimetypes.guess_type(session.file_name)[0] or 'application/octet-stream'
+            upload_url, upload_headers = object_storage.presigned_put(session.file_name, content_type, session.checksum)
+            return Response({
+                **upload_state(session),
+                'upload_url': upload_url,
+                'upload_method': 'PUT',
+                'upload_headers': upload_headers,
+            }, status=status.HTTP_201_CREATED)
+
+        path = upload_path(session.file_name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        open(path, 'wb').close()
+        session.save()
+
+        return Response(upload_state(session), status=status.HTTP_201_CREATED)
+
+    @action(detail=True, methods=['get', 'put'], url_path=rf'uploads/(?P<upload_id>{UPLOAD_ID_PATTERN})')
+    def upload_chunk(self, request, pk=None, upload_id=None):
+        interview = self.get_object()
+        session = get_object_or_404(UploadSession, id=upload_id, interview=interview)
+        if request.method == 'GET':
+            return Response(upload_state(session))
+        if session.storage == 's3':
+            return Response({'error': 'This upload goes directly to upload_url', **upload_state(session)},
+                            status=status.HTTP_409_CONFLICT)
+
+        try:
+            offset = int(request.headers.get('Upload-Offset', request.query_params.get('offset', '')))
+            length = int(request.META.get('CONTENT_LENGTH') or 0)
+        except ValueError:
+            return Response({'error': 'Upload-Offset header is required'}, status=status.HTTP_400_BAD_REQUEST)
+        if length <= 0:
+            return Response({'error': 'Empty chunk'}, status=status.HTTP_400_BAD_REQUEST)
+        if length > settings.UPLOAD_MAX_CHUNK_SIZE:
+            return Response(
+                {'error': f'Chunks are limited to {settings.UPLOAD_MAX_CHUNK_SIZE} bytes'},
+                status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+            )
+
+        if offset + length > session.total_size:
+            return Response({'error': 'Chunk runs past the declared file size', **upload_state(session)},
+                            status=status.HTTP_400_BAD_REQUEST)
+
+        if not claim_chunk(session, offset):
+            session.refresh_from_db(fields=['status', 'received_bytes'])
+            if session.status != 'uploading':
+                return Response({'error': f'Upload is {session.status}', **upload_state(session)},
+                                status=status.HTTP_409_CONFLICT)
+            if offset != session.received_bytes:
+                return Response({'error': 'Offset mismatch', **upload_state(session)},
+                                status=status.HTTP_409_CONFLICT)
+            return Response({'error': 'Another chunk of this upload is being written', **upload_state(session)},
+                            status=status.HTTP_409_CONFLICT)
+        session.received_bytes = offset
+
+        written = 0
+        try:
+            with open(upload_path(session.file_name), 'r+b') as destination:
+                written = append_chunk(session, destination, request.stream, length)
+        finally:
+            # Commit the offset and release the lease in one statement
+            UploadSession.objects.filter(id=session.id, received_bytes=offset).update(
+                received_bytes=offset + written,
+                chunk_lease_until=None,
+                updated_at=timezone.now(),
+            )
+        session.received_bytes = offset + written
+
+        if written < length:
+            return Response({'error': 'Chunk incomplete', **upload_state(session)},
+                            status=status.HTTP_400_BAD_REQUEST)
+        return Response(upload_state(session))
+
+    @action(detail=True, methods=['post'], url_path=rf'uploads/(?P<upload_id>{UPLOAD_ID_PATTERN})/finalize')
+    def finalize_upload(self, request, pk=None, upload_id=None):
+        interview = self.get_object()
+        session = get_object_or_404(UploadSession.objects.select_related('question'), id=upload_id, interview=interview)
+        if session.status == 'completed':
+            # Finalize retried after a lost response
+            return Response({'video_response_id': session.video_response_id, **upload_state(session)})
+        if session.status != 'uploading':
+            return Response({'error': f'Upload is {session.status}', **upload_state(session)},
+                            status=status.HTTP_409_CONFLICT)
+
+        error = response_error(interview, session.question)
+        if error:
+            return Response({'error': error}, status=status.HTTP_400_BAD_REQUEST)
+
+        # Hashing (or the storage HEAD) runs outside any transaction; a complete
+        # upload accepts no further chunks, so the bytes cannot change meanwhile
+        error, fatal = verify_upload(session)
+        if error:
+            if fatal and UploadSession.objects.filter(id=session.id, status='uploading').update(
+                status='failed', updated_at=timezone.now()
+            ):
+                session.status = 'failed'
+                delete_upload(session)
+            return Response({'error': error, **upload_state(session)}, status=status.HTTP_400_BAD_REQUEST)
+
+        with transaction.atomic():
+            locked = UploadSession.objects.select_for_update().get(id=session.id)
+            if locked.status == 'completed':
+                # A concurrent finalize registered it first
+                return Response({'video_response_id': locked.video_response_id, **upload_state(locked)})
+            if locked.status != 'uploading':
+                return Response({'error': f'Upload is {locked.status}', **upload_state(locked)},
+                                status=status.HTTP_409_CONFLICT)
+
+            video_response = VideoResponse.objects.create(
+                interview=interview,
+                question=session.question,
+                video_file_path=session.file_name,
+                duration=session.duration,
+                status='uploaded'
+            )
+            session.status = 'completed'
+            session.video_response = video_response
+            session.save(update_fields=['status', 'received_bytes', 'video_response', 'updated_at'])
+
+            payload = self.video_response_created(interview, video_response)
+
+        return Response(payload, status=status.HTTP_201_CREATED)
@@ -16,6 +16,7 @@ from .magic_urls import (
     HRResendQRView,
     QRLoginView,
 )
+from .streaming import VideoResponseStreamView
 
 router = DefaultRouter()
 router.register(r'interviews', InterviewViewSet, basename='interview')
@@ -33,4 +34,5 @@ urlpatterns = [
     path('applicant/qr-login/<str:token>/', QRLoginView.as_view(), name='qr-login'),
     path('hr/applicant/<int:applicant_id>/generate-qr/', HRGenerateQRView.as_view(), name='hr-generate-qr'),
     path('hr/applicant/<int:applicant_id>/resend-qr/', HRResendQRView.as_view(), name='hr-resend-qr'),
+    path('video-responses/<int:pk>/stream/', VideoResponseStreamView.as_view(), name='video-response-stream'),
 ]
@@ -5,16 +5,22 @@ from rest_framework.permissions import AllowAny, IsAuthenticated
 from accounts.permissions import IsApplicant
 from common.permissions import IsHRUser
 from rest_framework.settings import api_settings
+from rest_framework.renderers import JSONRenderer
+from common.renderers import EventStreamRenderer
 from accounts.authentication import ApplicantTokenAuthentication, HRTokenAuthentication, generate_applicant_token
 from django.shortcuts import get_object_or_404
+from django.core.handlers.asgi import ASGIRequest
+from django.http import StreamingHttpResponse
 from django.utils import timezone
 from django.db import transaction
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.exceptions import ValidationError
 from datetime import timedelta
+import math
 
 from .models import Interview, InterviewAuditLog, InterviewQuestion, VideoResponse, JobPosition
 from .type_models import PositionType, QuestionType
+from .uploads import ChunkedUploadMixin
 from .serializers import (
     InterviewListSerializer,
     InterviewSerializer,
@@ -311,7 +317,7 @@ class HRInterviewPagination(PageNumberPagination):
         return size
 
 
-class InterviewViewSet(viewsets.ModelViewSet):
+class InterviewViewSet(ChunkedUploadMixin, viewsets.ModelViewSet):
     """
     ViewSet for Interview model
     
@@ -320,6 +326,7 @@ class InterviewViewSet(viewsets.ModelViewSet):
     - GET /api/interviews/ - List all interviews
     - GET /api/interviews/{id}/ - Get interview details
     - POST /api/interviews/{id}/video-response/ - Upload video response
+    - POST /api/interviews/{id}/uploads/ - Start a resumable chunked upload (interviews/uploads.py)
     - GET /api/interviews/{id}/analysis/ - Get interview analysis
     """
     
@@ -375,6 +382,10 @@ class InterviewViewSet(viewsets.ModelViewSet):
 
             return qs
 
+        if self.action in ("processing_status", "processing_events", "start_upload", "upload_chunk", "finalize_upload"):
+            # Status comes from the Redis snapshot, uploads touch no related rows; only the interview row is needed
+            return qs
+
         return qs.select_related("applicant", "position_type") \
                 .prefetch_related("video_responses") \
                 .order_by("-created_at")
@@ -416,7 +427,8 @@ class InterviewViewSet(viewsets.ModelViewSet):
     def video_response(self, request, pk=None):
         """
         Upload video response WITHOUT immediate analysis
-        Analysis happens in bulk after interview submission
+        Transcription is queued on the transcription worker;
+        analysis happens in bulk after interview submission
         
         POST /api/interviews/{id}/video-response/
         Body: {
@@ -491,43 +503,24 @@ class InterviewViewSet(viewsets.ModelViewSet):
             status='uploaded'
         )
         
-        # IMMEDIATE TRANSCRIPTION: Use Deepgram STT to transcribe and store transcript
-        # This is fast (~2-5 seconds) and doesn't wait for LLM analysis
-        try:
-            from .deepgram_service import get_deepgram_service
-            
-            print(f"🎤 Starting Deepgram transcription for video {video_response.id}...")
-            deepgram_service = get_deepgram_service()
-            
-            # Transcribe video to text
-            transcript_data = deepgram_service.transcribe_video(
-                video_response.video_file_path.path,
-                video_response_id=video_response.id
-            )
-            
-            # Store transcript in database
-            video_response.transcript = transcript_data['transcript']
-            video_response.status = 'uploaded'  # Still uploaded, not analyzed yet
-            video_response.save()
-            
-            print(f"✅ Transcript stored: {len(transcript_data['transcript'])} chars")
-            
-        except Exception as transcription_error:
-            # Log error but don't fail the upload
-            print(f"⚠️ Transcription failed (will retry on submit): {transcription_error}")
-            video_response.transcript = ""  # Empty transcript, will be handled on submit
-            video_response.save()
-        
-        response_data = VideoResponseSerializer(video_response).data
+        return Response(self.video_response_created(interview, video_response), status=status.HTTP_201_CREATED)
+    
+    def video_response_created(self, interview, video_response):
+        """Post-upload steps shared by video-response and chunked uploads; returns the response payload"""
+        if interview.status == 'pending':
+            interview.status = 'in_progress'
+            interview.save(update_fields=['status'])
         
-        return Response(
-            {
-                'message': 'Video uploaded and transcribed successfully. AI analysis will begin after interview submission.',
-                'video_response': response_data,
-                'transcript_ready': bool(video_response.transcript)
-            },
-            status=status.HTTP_201_CREATED
-        )
+        # Transcription runs on the dedicated transcription queue; the upload returns immediately
+        from .tasks import enqueue_transcription
+        enqueue_transcription(video_response.id)
+        
+        return {
+            'message': 'Video uploaded successfully. Transcription is queued and AI analysis will begin after interview submission.',
+            'video_response': VideoResponseSerializer(video_response).data,
+            'transcript_ready': video_response.transcript_ready,
+            'transcript_status': video_response.transcript_status
+        }
     
     @action(detail=True, methods=['get'], url_path='analysis', permission_classes=[IsAuthenticated, IsHRUser], authentication_classes=[HRTokenAuthentication, *api_settings.DEFAULT_AUTHENTICATION_CLASSES])
     def analysis(self, request, pk=None):
@@ -864,6 +857,12 @@ class InterviewViewSet(viewsets.ModelViewSet):
         )
         
         
+        # Seed the status snapshot that processing-status and processing-events serve
+        from processing.eta import estimate_seconds
+        from processing.status import publish as publish_status
+        snapshot = publish_status(queue_entry)
+        estimated_seconds = snapshot['estimated_seconds_remaining'] if snapshot else estimate_seconds(queue_entry)
+        
         try:
             from .tasks import analyze_interview
             from django.db import transaction
@@ -880,7 +879,8 @@ class InterviewViewSet(viewsets.ModelViewSet):
             'message': 'Interview submitted successfully. AI analysis in progress.',
             'queue_id': queue_entry.id,
             'status': 'processing',
-            'estimated_completion_minutes': 2
+            'estimated_completion_minutes': max(1, math.ceil(estimated_seconds / 60)),
+            'estimated_completion_seconds': estimated_seconds
         })
     
     @action(detail=True, methods=['get'], url_path='processing-status')
@@ -892,49 +892,43 @@ class InterviewViewSet(viewsets.ModelViewSet):
         """
         interview = self.get_object()
         
-        # Get processing queue entry
-        from processing.models import ProcessingQueue
-        try:
-            queue_entry = ProcessingQueue.objects.filter(
-                interview=interview,
-                processing_type='bulk_analysis'
-            ).latest('created_at')
-        except ProcessingQueue.DoesNotExist:
+        # Served from the Redis snapshot the pipeline publishes at every stage transition
+        from processing.status import current_snapshot, status_response
+        snapshot = current_snapshot(interview)
+        if snapshot is None:
             return Response({
                 'error': 'No processing queue found for this interview'
             }, status=status.HTTP_404_NOT_FOUND)
         
-        # Calculate progress
-        total_videos = interview.video_responses.count()
-        processed_videos = interview.video_responses.filter(status='analyzed').count()
-        remaining = total_videos - processed_videos
-        
-        # Estimate time remaining (assume 10 seconds per video)
-        estimated_seconds = remaining * 10
-        
-        if estimated_seconds < 60:
-            estimated_time = f"{estimated_seconds} seconds"
-        else:
-            estimated_minutes = estimated_seconds // 60
-            estimated_time = f"{estimated_minutes} minute{'s' if estimated_minutes > 1 else ''}"
+        return Response(status_response(snapshot))
+    
+    @action(
+        detail=True,
+        methods=['get'],
+        url_path='processing-events',
+        renderer_classes=[JSONRenderer, EventStreamRenderer],
+    )
+    def processing_events(self, request, pk=None):
+        """
+        Stream processing status as Server-Sent Events (`event: status`, same
+        body as processing-status) until processing completes or fails
         
-        response_data = {
-            'status': queue_entry.status,
-            'progress': {
-                'total_videos': total_videos,
-                'processed': processed_videos,
-                'remaining': remaining
-            },
-            'estimated_time_remaining': estimated_time
-        }
+        GET /api/interviews/{id}/processing-events/
+        """
+        interview = self.get_object()
         
-        if queue_entry.status == 'completed':
-            response_data['message'] = 'Processing complete! Redirecting to results...'
-        elif queue_entry.status == 'failed':
-            response_data['message'] = 'Processing failed. Please contact support.'
-            response_data['error'] = queue_entry.error_message
+        from processing.status import aevent_stream, current_snapshot, event_stream
+        snapshot = current_snapshot(interview)
+        if snapshot is None:
+            return Response({
+                'error': 'No processing queue found for this interview'
+            }, status=status.HTTP_404_NOT_FOUND)
         
-        return Response(response_data)
+        stream = aevent_stream if isinstance(request._request, ASGIRequest) else event_stream
+        response = StreamingHttpResponse(stream(snapshot), content_type='text/event-stream')
+        response['Cache-Control'] = 'no-cache'
+        response['X-Accel-Buffering'] = 'no'
+        return response
     
     @action(detail=True, methods=['get'], url_path='video-responses')
     def list_video_responses(self, request, pk=None):
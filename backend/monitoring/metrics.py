@@ -0,0 +1,55 @@
+"""
+Lightweight operational counters stored in the Django cache (Redis)
+
+Counters are best effort: a cache outage must never fail the request or task
+being measured, so every helper swallows cache errors.
+"""
+
+from django.core.cache import cache
+
+KEY_PREFIX = 'metrics'
+
+
+def _key(name):
+    return f"{KEY_PREFIX}:{name}"
+
+
+def increment(name, amount=1):
+    """Increment a named counter, creating it if needed"""
+    try:
+        try:
+            cache.incr(_key(name), amount)
+        except ValueError:
+            # Key does not exist yet; add() avoids clobbering a concurrent creator
+            if not cache.add(_key(name), amount, timeout=None):
+                cache.incr(_key(name), amount)
+    except Exception:
+        pass
+
+
+def get_counters(names):
+    """Return {name: value} for the given counters (missing counters are 0)"""
+    try:
+        values = cache.get_many([_key(name) for name in names])
+    except Exception:
+        values = {}
+    return {name: int(values.get(_key(name)) or 0) for name in names}
+
+
+def reset_counters(names):
+    try:
+        cache.delete_many([_key(name) for name in names])
+    except Exception:
+        pass
+
+
+def hit_rate_summary(prefix):
+    """Hits, misses and hit rate for counters named '<prefix>.hit' / '<prefix>.miss'"""
+    counters = get_counters([f"{prefix}.hit", f"{prefix}.miss"])
+    hits, misses = counters[f"{prefix}.hit"], counters[f"{prefix}.miss"]
+    total = hits + misses
+    return {
+        'hits': hits,
+        'misses': misses,
+        'hit_rate': round(hits / total, 4) if total else 0.0,
+    }
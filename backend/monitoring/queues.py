@@ -0,0 +1,36 @@
+"""
+Celery queue depth, read from the broker
+
+Each worker pool consumes its own queue (see CELERY_TASK_ROUTES), so a
+growing queue points straight at the pool that needs more workers.
+"""
+
+import logging
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+
+def queue_depths(queues=None):
+    """
+    Return {queue name: messages waiting} for the monitored queues
+
+    A queue the broker cannot report on (not declared yet, broker down) is None.
+    """
+    from core.celery import app
+
+    queues = queues or getattr(settings, 'MONITORED_QUEUES', [app.conf.task_default_queue])
+    depths = {}
+    try:
+        with app.connection_for_read() as connection:
+            channel = connection.default_channel
+            for queue in queues:
+                try:
+                    depths[queue] = channel.queue_declare(queue=queue, passive=True).message_count
+                except Exception:
+                    depths[queue] = None
+    except Exception as e:
+        logger.warning(f"Could not read queue depths from broker: {e}")
+        depths = {queue: None for queue in queues}
+    return depths
@@ -181,6 +181,35 @@ class TokenUsageViewSet(viewsets.ReadOnlyModelViewSet):
         return Response(operation_stats)
 
 
+    @action(detail=False, methods=['get'], url_path='cache-stats')
+    def cache_stats(self, request):
+        """
+        Hit/miss counters for API result caches, and rate limiter waits
+        
+        GET /api/token-usage/cache-stats/
+        """
+        from common.rate_limit import limiter_stats
+        from interviews.llm_cache import cache_stats as llm_cache_stats
+        from interviews.transcript_cache import cache_stats as transcript_cache_stats
+        
+        return Response({
+            'transcript_cache': transcript_cache_stats(),
+            'llm_response_cache': llm_cache_stats(),
+            'rate_limits': limiter_stats(),
+        })
+
+    @action(detail=False, methods=['get'], url_path='queue-depth')
+    def queue_depth(self, request):
+        """
+        Messages waiting in each Celery queue
+        
+        GET /api/token-usage/queue-depth/
+        """
+        from .queues import queue_depths
+        
+        return Response(queue_depths())
+
+
 class DailyTokenSummaryViewSet(viewsets.ReadOnlyModelViewSet):
     """
     API endpoints for daily token summaries
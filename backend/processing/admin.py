@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import ProcessingQueue, ProcessingLog
+from .models import ProcessingQueue, ProcessingLog, ProcessingStage
 
 
 @admin.register(ProcessingQueue)
@@ -16,3 +16,11 @@ class ProcessingLogAdmin(admin.ModelAdmin):
     list_filter = ['log_level', 'timestamp']
     search_fields = ['queue_item__interview__applicant__first_name', 'message']
     readonly_fields = ['timestamp']
+
+
+@admin.register(ProcessingStage)
+class ProcessingStageAdmin(admin.ModelAdmin):
+    list_display = ['interview', 'queue_item', 'stage', 'video_response_id', 'status', 'attempt', 'duration_ms', 'started_at']
+    list_filter = ['stage', 'status', 'started_at']
+    search_fields = ['celery_task_id', 'interview__applicant__first_name']
+    readonly_fields = ['started_at', 'finished_at', 'duration_ms']
@@ -0,0 +1,224 @@
+"""
+Completion-time estimates learned from recorded stage timings
+
+refresh_model() reads the ProcessingStage runs completed in the last
+ETA_WINDOW_HOURS and stores, in the Django cache, the ETA_PERCENTILE duration
+of every stage. Per-video stages (transcription, script detection) are bucketed
+by video length (ETA_DURATION_BUCKETS, seconds), since a 4 minute answer takes
+far longer to transcribe than a 30 second one. The model also keeps the
+end-to-end time of completed pipelines, used to price the queue wait.
+The processing.tasks.refresh_eta_model beat task rebuilds it every
+ETA_REFRESH_SECONDS. Requests only read the cache: until the first rebuild
+(or if the cache is lost) they estimate from the defaults rather than
+scanning stage history themselves.
+
+estimate_seconds() walks the pipeline's critical path for one queue entry:
+transcription of every video in parallel, then the Gemini call alongside
+per-video script detection, then scoring and notification. Stages that have
+already completed are skipped, running ones are credited with their elapsed
+time, and a pending entry waits for the bulk_analysis entries queued ahead of
+it, ETA_PIPELINE_CONCURRENCY at a time.
+
+A stage with fewer than ETA_MIN_SAMPLES runs falls back to the stage-wide
+figure, then to DEFAULT_STAGE_MS.
+"""
+
+import logging
+import math
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+from processing.tracking import percentile
+
+logger = logging.getLogger(__name__)
+
+CACHE_KEY = 'processing:eta_model'
+
+# Used until enough runs have been recorded
+DEFAULT_STAGE_MS = {
+    'transcription': 10000,
+    'script_detection': 8000,
+    'llm_analysis': 20000,
+    'scoring': 1000,
+    'notification': 500,
+}
+DEFAULT_PIPELINE_MS = 60000
+ALL_DURATIONS = 'all'
+
+
+def _setting(name, default):
+    return getattr(settings, f'ETA_{name}', default)
+
+
+def duration_bucket(seconds):
+    """Bucket label for a video length: index of the first bound it is under"""
+    bounds = _setting('DURATION_BUCKETS', [60, 180])
+    for index, bound in enumerate(bounds):
+        if seconds < bound:
+            return str(index)
+    return str(len(bounds))
+
+
+def _summary(sorted_values):
+    return {'ms': percentile(sorted_values, _setting('PERCENTILE', 0.9)), 'count': len(sorted_values)}
+
+
+def build_model(now=None):
+    """Stage percentiles over the rolling window, as a JSON-serialisable dict"""
+    from interviews.models import VideoResponse
+    from processing.models import ProcessingQueue, ProcessingStage
+
+    now = now or timezone.now()
+    since = now - timedelta(hours=_setting('WINDOW_HOURS', 24))
+
+    runs = list(
+        ProcessingStage.objects.filter(status='completed', started_at__gte=since, duration_ms__isnull=False)
+        .order_by('duration_ms')
+        .values_list('stage', 'video_response_id', 'duration_ms')
+    )
+    video_ids = {video_id for _, video_id, _ in runs if video_id is not None}
+    video_seconds = {
+        video_id: duration.total_seconds()
+        for video_id, duration in VideoResponse.objects.filter(id__in=video_ids).values_list('id', 'duration')
+    }
+
+    samples = {}
+    for stage, video_id, duration_ms in runs:
+        buckets = samples.setdefault(stage, {})
+        buckets.setdefault(ALL_DURATIONS, []).append(duration_ms)
+        if video_id in video_seconds:
+            buckets.setdefault(duration_bucket(video_seconds[video_id]), []).append(duration_ms)
+
+    pipelines = sorted(
+        int((completed_at - started_at).total_seconds() * 1000)
+        for started_at, completed_at in ProcessingQueue.objects.filter(
+            processing_type='bulk_analysis',
+            status='completed',
+            completed_at__gte=since,
+            started_at__isnull=False,
+        ).values_list('started_at', 'completed_at')
+    )
+
+    return {
+        'generated_at': now.isoformat(),
+        'window_hours': _setting('WINDOW_HOURS', 24),
+        'stages': {
+            stage: {bucket: _summary(values) for bucket, values in buckets.items()}
+            for stage, buckets in samples.items()
+        },
+        'pipeline': _summary(pipelines),
+    }
+
+
+def refresh_model():
+    """Rebuild the model and cache it; returns the model"""
+    model = build_model()
+    try:
+        cache.set(CACHE_KEY, model, timeout=_setting('REFRESH_SECONDS', 300) * 3)
+    except Exception as e:
+        logger.warning(f"Could not cache ETA model: {e}")
+    return model
+
+
+def default_model():
+    """Model without samples: every estimate uses DEFAULT_STAGE_MS / DEFAULT_PIPELINE_MS"""
+    return {
+        'generated_at': None,
+        'window_hours': _setting('WINDOW_HOURS', 24),
+        'stages': {},
+        'pipeline': _summary([]),
+    }
+
+
+def get_model():
+    """The cached model; the defaults until the beat task has built one"""
+    try:
+        model = cache.get(CACHE_KEY)
+    except Exception as e:
+        logger.warning(f"Could not read ETA model from cache: {e}")
+        model = None
+    return model if model is not None else default_model()
+
+
+def stage_ms(model, stage, video_seconds=None):
+    """Expected duration of one stage run, most specific figure with enough samples first"""
+    min_samples = _setting('MIN_SAMPLES', 5)
+    buckets = model['stages'].get(stage, {})
+    candidates = [ALL_DURATIONS] if video_seconds is None else [duration_bucket(video_seconds), ALL_DURATIONS]
+    for bucket in candidates:
+        summary = buckets.get(bucket)
+        if summary and summary['count'] >= min_samples:
+            return summary['ms']
+    return DEFAULT_STAGE_MS[stage]
+
+
+def pipeline_ms(model):
+    summary = model['pipeline']
+    return summary['ms'] if summary['count'] >= _setting('MIN_SAMPLES', 5) else DEFAULT_PIPELINE_MS
+
+
+def estimate_seconds(queue_entry, model=None):
+    """Seconds until the queue entry's pipeline is expected to finish"""
+    from interviews.models import VideoResponse
+    from processing.models import ProcessingQueue
+
+    if queue_entry.status in ('completed', 'failed'):
+        return 0
+
+    model = model or get_model()
+    now = timezone.now()
+
+    completed, running = set(), {}
+    for stage, video_id, status, started_at in queue_entry.stages.values_list(
+        'stage', 'video_response_id', 'status', 'started_at'
+    ):
+        if status == 'completed':
+            completed.add((stage, video_id))
+        elif status == 'running':
+            running[(stage, video_id)] = started_at
+
+    def remaining_ms(stage, video_id=None, video_seconds=None):
+        if (stage, video_id) in completed:
+            return 0
+        expected = stage_ms(model, stage, video_seconds)
+        if (stage, video_id) in running:
+            elapsed = (now - running[(stage, video_id)]).total_seconds() * 1000
+            return max(0, expected - elapsed)
+        return expected
+
+    videos = VideoResponse.objects.filter(interview_id=queue_entry.interview_id).values_list(
+        'id', 'duration', 'transcript_status'
+    )
+    transcription, detection = 0, 0
+    for video_id, duration, transcript_status in videos:
+        seconds = duration.total_seconds() if duration else None
+        if transcript_status != 'ready':
+            transcription = max(transcription, remaining_ms('transcription', video_id, seconds))
+        detection = max(detection, remaining_ms('script_detection', video_id, seconds))
+
+    total_ms = (
+        transcription
+        + max(remaining_ms('llm_analysis'), detection)
+        + remaining_ms('scoring')
+        + remaining_ms('notification')
+    )
+
+    if queue_entry.status in ('pending', 'queued'):
+        ahead = ProcessingQueue.objects.filter(
+            processing_type='bulk_analysis',
+            status__in=['pending', 'queued'],
+            created_at__lt=queue_entry.created_at,
+        ).count()
+        total_ms += (ahead // max(1, _setting('PIPELINE_CONCURRENCY', 4))) * pipeline_ms(model)
+
+    return math.ceil(total_ms / 1000)
+
+
+def humanize_seconds(seconds):
+    if seconds < 60:
+        return f"{seconds} seconds"
+    minutes = math.ceil(seconds / 60)
+    return f"{minutes} minute{'s' if minutes > 1 else ''}"
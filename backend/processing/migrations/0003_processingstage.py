@@ -0,0 +1,70 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("processing", "0002_processingqueue_created_at_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ProcessingStage",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                (
+                    "stage",
+                    models.CharField(
+                        choices=[
+                            ("transcription", "Transcription"),
+                            ("llm_analysis", "LLM Analysis"),
+                            ("script_detection", "Script Detection"),
+                            ("scoring", "Scoring"),
+                            ("notification", "Notification"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                (
+                    "video_response_id",
+                    models.IntegerField(blank=True, help_text="Set for per-video stages", null=True),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[("running", "Running"), ("completed", "Completed"), ("failed", "Failed")],
+                        default="running",
+                        max_length=20,
+                    ),
+                ),
+                (
+                    "celery_task_id",
+                    models.CharField(blank=True, help_text="Celery task ID of this stage run", max_length=255),
+                ),
+                (
+                    "attempt",
+                    models.PositiveSmallIntegerField(default=0, help_text="Celery retry count (0 = first run)"),
+                ),
+                ("error_message", models.TextField(blank=True)),
+                ("started_at", models.DateTimeField()),
+                ("finished_at", models.DateTimeField(blank=True, null=True)),
+                ("duration_ms", models.PositiveIntegerField(blank=True, null=True)),
+                (
+                    "queue_item",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="stages",
+                        to="processing.processingqueue",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Processing Stage",
+                "verbose_name_plural": "Processing Stages",
+                "db_table": "processing_stages",
+                "ordering": ["started_at"],
+                "indexes": [models.Index(fields=["stage", "started_at"], name="idx_stage_started")],
+            },
+        ),
+    ]
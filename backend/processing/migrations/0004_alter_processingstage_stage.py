@@ -0,0 +1,26 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("processing", "0003_processingstage"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="processingstage",
+            name="stage",
+            field=models.CharField(
+                choices=[
+                    ("normalization", "Normalization"),
+                    ("transcription", "Transcription"),
+                    ("llm_analysis", "LLM Analysis"),
+                    ("script_detection", "Script Detection"),
+                    ("scoring", "Scoring"),
+                    ("notification", "Notification"),
+                ],
+                max_length=20,
+            ),
+        ),
+    ]
@@ -0,0 +1,46 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def backfill_interview(apps, schema_editor):
+    ProcessingStage = apps.get_model("processing", "ProcessingStage")
+    ProcessingQueue = apps.get_model("processing", "ProcessingQueue")
+    for queue_item_id, interview_id in ProcessingQueue.objects.filter(stages__isnull=False).distinct().values_list(
+        "id", "interview_id"
+    ):
+        ProcessingStage.objects.filter(queue_item_id=queue_item_id).update(interview_id=interview_id)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("interviews", "0032_videoresponse_normalized_video"),
+        ("processing", "0004_alter_processingstage_stage"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="processingstage",
+            name="interview",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="processing_stages",
+                to="interviews.interview",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="processingstage",
+            name="queue_item",
+            field=models.ForeignKey(
+                blank=True,
+                help_text="Bulk analysis entry the run belonged to; empty for upload-time stages",
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="stages",
+                to="processing.processingqueue",
+            ),
+        ),
+        migrations.RunPython(backfill_interview, migrations.RunPython.noop),
+    ]
@@ -69,3 +69,52 @@ class ProcessingLog(models.Model):
     
     def __str__(self):
         return f"[{self.log_level.upper()}] {self.queue_item.interview.applicant.full_name} - {self.timestamp}"
+
+
+class ProcessingStage(models.Model):
+    """Timing record for one pipeline stage run (per interview or per video)"""
+    
+    STAGE_CHOICES = [
+        ('normalization', 'Normalization'),
+        ('transcription', 'Transcription'),
+        ('llm_analysis', 'LLM Analysis'),
+        ('script_detection', 'Script Detection'),
+        ('scoring', 'Scoring'),
+        ('notification', 'Notification'),
+    ]
+    
+    STATUS_CHOICES = [
+        ('running', 'Running'),
+        ('completed', 'Completed'),
+        ('failed', 'Failed'),
+    ]
+    
+    interview = models.ForeignKey(
+        Interview, on_delete=models.CASCADE, related_name='processing_stages', null=True, blank=True
+    )
+    queue_item = models.ForeignKey(
+        ProcessingQueue, on_delete=models.CASCADE, related_name='stages', null=True, blank=True,
+        help_text="Bulk analysis entry the run belonged to; empty for upload-time stages"
+    )
+    stage = models.CharField(max_length=20, choices=STAGE_CHOICES)
+    video_response_id = models.IntegerField(null=True, blank=True, help_text="Set for per-video stages")
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='running')
+    celery_task_id = models.CharField(max_length=255, blank=True, help_text="Celery task ID of this stage run")
+    attempt = models.PositiveSmallIntegerField(default=0, help_text="Celery retry count (0 = first run)")
+    error_message = models.TextField(blank=True)
+    
+    started_at = models.DateTimeField()
+    finished_at = models.DateTimeField(null=True, blank=True)
+    duration_ms = models.PositiveIntegerField(null=True, blank=True)
+    
+    class Meta:
+        db_table = 'processing_stages'
+        verbose_name = 'Processing Stage'
+        verbose_name_plural = 'Processing Stages'
+        ordering = ['started_at']
+        indexes = [
+            models.Index(fields=['stage', 'started_at'], name='idx_stage_started'),
+        ]
+    
+    def __str__(self):
+        return f"{self.get_stage_display()} ({self.status}) - interview {self.interview_id}"
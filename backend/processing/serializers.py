@@ -0,0 +1,31 @@
+"""
+Serializers for processing pipeline monitoring
+"""
+
+from rest_framework import serializers
+from .models import ProcessingStage
+
+
+class ProcessingStageSerializer(serializers.ModelSerializer):
+    """One timed run of a pipeline stage"""
+    
+    interview_id = serializers.IntegerField(read_only=True)
+    stage_display = serializers.CharField(source='get_stage_display', read_only=True)
+    
+    class Meta:
+        model = ProcessingStage
+        fields = [
+            'id',
+            'queue_item',
+            'interview_id',
+            'stage',
+            'stage_display',
+            'video_response_id',
+            'status',
+            'celery_task_id',
+            'attempt',
+            'error_message',
+            'started_at',
+            'finished_at',
+            'duration_ms',
+        ]
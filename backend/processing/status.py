@@ -0,0 +1,287 @@
+"""
+Processing status snapshots in Redis, pushed to clients as Server-Sent Events
+
+Every pipeline transition (submission, launch, each stage starting or
+finishing, completion, failure) calls publish(). It computes the status
+snapshot from the database once, stores it in Redis, and publishes it on the
+interview's pub/sub channel. Readers never query the database for status:
+GET /api/interviews/{id}/processing-status/ returns the stored snapshot, and
+GET /api/interviews/{id}/processing-events/ streams each new one as a
+`status` event until processing completes or fails.
+
+`processed` counts videos marked analyzed, which the scoring stage does for
+every video at once; it is 0 until then and total afterwards. Progress within
+a run is reported by `stage`, published as each per-video stage starts and
+finishes.
+
+Under WSGI each stream holds a worker thread for up to
+PROCESSING_EVENTS_MAX_SECONDS; under ASGI (core/asgi.py) streams are served
+from the event loop with redis.asyncio. Clients reconnect automatically
+(EventSource honours the `retry` field), and a snapshot missing from Redis
+is rebuilt from the database on the next read.
+
+Publishing is best effort: a Redis outage must never fail a pipeline stage.
+"""
+
+import asyncio
+import json
+import logging
+import time
+import weakref
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = 'processing_status'
+FINAL_STATUSES = ('completed', 'failed')
+RETRY_MS = 5000
+
+MESSAGES = {
+    'completed': 'Processing complete! Redirecting to results...',
+    'failed': 'Processing failed. Please contact support.',
+}
+
+
+# redis.asyncio clients are bound to the loop they first connect on
+_async_clients = weakref.WeakKeyDictionary()
+
+
+def _get_redis():
+    from django_redis import get_redis_connection
+    return get_redis_connection('default')
+
+
+def _get_async_redis():
+    """The redis.asyncio client shared by every stream on the running event loop"""
+    import redis.asyncio as aioredis
+
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        client = _async_clients[loop] = aioredis.from_url(settings.CACHES['default']['LOCATION'])
+    return client
+
+
+def snapshot_key(interview_id):
+    return f"{KEY_PREFIX}:snapshot:{interview_id}"
+
+
+def channel_name(interview_id):
+    return f"{KEY_PREFIX}:events:{interview_id}"
+
+
+def build_snapshot(queue_entry, stage=None):
+    """Status of a queue entry's pipeline, read from the database"""
+    from django.db.models import Count, Q
+    from interviews.models import VideoResponse
+    from processing.eta import estimate_seconds
+
+    counts = VideoResponse.objects.filter(interview_id=queue_entry.interview_id).aggregate(
+        total=Count('id'),
+        processed=Count('id', filter=Q(status='analyzed')),
+    )
+    return {
+        'interview_id': queue_entry.interview_id,
+        'queue_id': queue_entry.id,
+        'status': queue_entry.status,
+        'total_videos': counts['total'],
+        'processed': counts['processed'],
+        'stage': stage,
+        'error': queue_entry.error_message,
+        'estimated_seconds_remaining': estimate_seconds(queue_entry),
+        'updated_at': time.time(),
+    }
+
+
+def store_snapshot(snapshot, redis=None):
+    redis = redis or _get_redis()
+    redis.set(
+        snapshot_key(snapshot['interview_id']),
+        json.dumps(snapshot),
+        ex=getattr(settings, 'PROCESSING_STATUS_TTL', 86400),
+    )
+
+
+def publish(queue_entry, stage=None):
+    """
+    Recompute the snapshot for a queue entry, store it and push it to subscribers
+
+    Returns the snapshot (even if Redis was unavailable), or None if it could
+    not be computed.
+    """
+    try:
+        snapshot = build_snapshot(queue_entry, stage=stage)
+    except Exception as e:
+        logger.warning(f"Could not compute processing status for interview {queue_entry.interview_id}: {e}")
+        return None
+    try:
+        redis = _get_redis()
+        store_snapshot(snapshot, redis)
+        redis.publish(channel_name(snapshot['interview_id']), json.dumps(snapshot))
+    except Exception as e:
+        logger.warning(f"Could not publish processing status for interview {queue_entry.interview_id}: {e}")
+    return snapshot
+
+
+def publish_for_interview(interview_id, stage=None):
+    """publish() for the interview's latest bulk analysis entry, if any"""
+    from processing.models import ProcessingQueue
+
+    queue_entry = ProcessingQueue.objects.filter(
+        interview_id=interview_id,
+        processing_type='bulk_analysis',
+    ).order_by('-created_at').first()
+    if queue_entry is not None:
+        return publish(queue_entry, stage=stage)
+    return None
+
+
+def publish_for_queue_item(queue_item_id, stage=None):
+    from processing.models import ProcessingQueue
+
+    queue_entry = ProcessingQueue.objects.filter(id=queue_item_id).first()
+    if queue_entry is not None:
+        return publish(queue_entry, stage=stage)
+    return None
+
+
+def current_snapshot(interview):
+    """
+    The stored snapshot, or one rebuilt from the database when Redis has none
+
+    Returns None if the interview was never submitted for processing.
+    """
+    try:
+        raw = _get_redis().get(snapshot_key(interview.id))
+        if raw is not None:
+            return json.loads(raw)
+    except Exception as e:
+        logger.warning(f"Could not read processing status for interview {interview.id}: {e}")
+
+    from processing.models import ProcessingQueue
+
+    queue_entry = ProcessingQueue.objects.filter(
+        interview=interview,
+        processing_type='bulk_analysis',
+    ).order_by('-created_at').first()
+    if queue_entry is None:
+        return None
+    snapshot = build_snapshot(queue_entry)
+    try:
+        store_snapshot(snapshot)
+    except Exception as e:
+        logger.warning(f"Could not store processing status for interview {interview.id}: {e}")
+    return snapshot
+
+
+def status_response(snapshot):
+    """API body for a snapshot, with the estimate counted down since it was computed"""
+    from processing.eta import humanize_seconds
+
+    elapsed = int(time.time() - snapshot['updated_at'])
+    estimated_seconds = max(0, snapshot['estimated_seconds_remaining'] - elapsed)
+    data = {
+        'status': snapshot['status'],
+        'progress': {
+            'total_videos': snapshot['total_videos'],
+            'processed': snapshot['processed'],
+            'remaining': snapshot['total_videos'] - snapshot['processed'],
+        },
+        'stage': snapshot['stage'],
+        'estimated_time_remaining': humanize_seconds(estimated_seconds),
+        'estimated_seconds_remaining': estimated_seconds,
+    }
+    if snapshot['status'] in MESSAGES:
+        data['message'] = MESSAGES[snapshot['status']]
+    if snapshot['status'] == 'failed':
+        data['error'] = snapshot['error']
+    return data
+
+
+def format_event(snapshot):
+    return f"event: status\ndata: {json.dumps(status_response(snapshot))}\n\n"
+
+
+def _stream_settings():
+    return (
+        getattr(settings, 'PROCESSING_EVENTS_MAX_SECONDS', 300),
+        getattr(settings, 'PROCESSING_EVENTS_HEARTBEAT', 15),
+    )
+
+
+def event_stream(snapshot):
+    """
+    SSE body for WSGI: the current snapshot, then every published update
+
+    Subscribes before re-reading the stored snapshot, so a transition that
+    lands between the initial read and the subscription is not lost.
+    """
+    yield f"retry: {RETRY_MS}\n" + format_event(snapshot)
+    if snapshot['status'] in FINAL_STATUSES:
+        return
+
+    max_seconds, heartbeat = _stream_settings()
+    try:
+        redis = _get_redis()
+        pubsub = redis.pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(channel_name(snapshot['interview_id']))
+    except Exception as e:
+        logger.warning(f"Processing events unavailable for interview {snapshot['interview_id']}: {e}")
+        return
+
+    try:
+        raw = redis.get(snapshot_key(snapshot['interview_id']))
+        deadline = time.monotonic() + max_seconds
+        while time.monotonic() < deadline:
+            if raw is not None:
+                latest = json.loads(raw)
+                if latest['updated_at'] > snapshot['updated_at']:
+                    snapshot = latest
+                    yield format_event(snapshot)
+                    if snapshot['status'] in FINAL_STATUSES:
+                        return
+            message = pubsub.get_message(timeout=heartbeat)
+            raw = message['data'] if message else None
+            if raw is None:
+                yield ": keepalive\n\n"
+    except Exception as e:
+        logger.warning(f"Processing events stream for interview {snapshot['interview_id']} ended: {e}")
+    finally:
+        pubsub.close()
+
+
+async def aevent_stream(snapshot):
+    """
+    event_stream() for ASGI, without tying up a thread per client
+
+    Streams share one client and connection pool; each holds only the
+    connection of its own pub/sub subscription.
+    """
+    yield f"retry: {RETRY_MS}\n" + format_event(snapshot)
+    if snapshot['status'] in FINAL_STATUSES:
+        return
+
+    max_seconds, heartbeat = _stream_settings()
+    redis = _get_async_redis()
+    pubsub = redis.pubsub(ignore_subscribe_messages=True)
+    try:
+        await pubsub.subscribe(channel_name(snapshot['interview_id']))
+        raw = await redis.get(snapshot_key(snapshot['interview_id']))
+        deadline = time.monotonic() + max_seconds
+        while time.monotonic() < deadline:
+            if raw is not None:
+                latest = json.loads(raw)
+                if latest['updated_at'] > snapshot['updated_at']:
+                    snapshot = latest
+                    yield format_event(snapshot)
+                    if snapshot['status'] in FINAL_STATUSES:
+                        return
+            message = await pubsub.get_message(timeout=heartbeat)
+            raw = message['data'] if message else None
+            if raw is None:
+                yield ": keepalive\n\n"
+    except Exception as e:
+        logger.warning(f"Processing events stream for interview {snapshot['interview_id']} ended: {e}")
+    finally:
+        await pubsub.aclose()
@@ -0,0 +1,18 @@
+"""
+Celery tasks for processing bookkeeping
+"""
+
+from celery import shared_task
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def refresh_eta_model():
+    """Periodic (beat): rebuild the cached completion-time model from recent stage timings"""
+    from processing.eta import refresh_model
+
+    model = refresh_model()
+    logger.info(f"ETA model refreshed from stage runs over the last {model['window_hours']}h")
+    return {'stages': sorted(model['stages']), 'pipelines': model['pipeline']['count']}
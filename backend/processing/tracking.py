@@ -0,0 +1,173 @@
+"""
+Stage timing and batched processing logs for the interview pipeline
+
+Each pipeline task wraps its work in track_stage(). That records a
+ProcessingStage row (task id, attempt, start/end, duration) against the
+interview and, once it has been submitted, its latest ProcessingQueue entry.
+Log lines collected during the stage are written to ProcessingLog with one
+bulk insert when it ends; upload-time stages, which have no queue entry yet,
+send them to the application log instead.
+
+Every start and end is also published as a status snapshot
+(processing.status), which is what clients polling or streaming status see.
+
+Tracking is best effort: a failure to record timings is logged and never
+fails the stage being measured.
+"""
+
+import logging
+import math
+import time
+from contextlib import contextmanager
+
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+
+class StageTracker:
+    """Collects timing and log lines for one stage run"""
+
+    def __init__(self, stage, interview_id=None, video_response_id=None, task=None):
+        self.stage = stage
+        self.interview_id = interview_id
+        self.video_response_id = video_response_id
+        self.task_id = getattr(getattr(task, 'request', None), 'id', None) or ''
+        self.attempt = getattr(getattr(task, 'request', None), 'retries', 0) or 0
+        self.record = None
+        self._logs = []
+        self._started = None
+
+    def log(self, message, level='info'):
+        """Queue a ProcessingLog line, written when the stage ends"""
+        self._logs.append((level, message))
+
+    def start(self):
+        from interviews.models import VideoResponse
+        from processing.models import ProcessingQueue, ProcessingStage
+
+        self._started = time.monotonic()
+        try:
+            if self.interview_id is None:
+                self.interview_id = (
+                    VideoResponse.objects.filter(id=self.video_response_id).values_list('interview_id', flat=True).first()
+                )
+            # Upload-time stages run before the interview is submitted; they are
+            # recorded against the interview alone
+            queue_item_id = (
+                ProcessingQueue.objects.filter(interview_id=self.interview_id, processing_type='bulk_analysis')
+                .order_by('-created_at').values_list('id', flat=True).first()
+            )
+            self.record = ProcessingStage.objects.create(
+                interview_id=self.interview_id,
+                queue_item_id=queue_item_id,
+                stage=self.stage,
+                video_response_id=self.video_response_id,
+                celery_task_id=self.task_id,
+                attempt=self.attempt,
+                started_at=timezone.now(),
+            )
+        except Exception as e:
+            logger.warning(f"Could not record start of {self.stage} stage: {e}")
+            self.record = None
+            return
+        self._publish()
+
+    def _publish(self):
+        from processing.status import publish_for_queue_item
+
+        if self.record.queue_item_id is None:
+            return
+        publish_for_queue_item(self.record.queue_item_id, stage={
+            'name': self.stage,
+            'status': self.record.status,
+            'video_response_id': self.video_response_id,
+        })
+
+    def finish(self, error=None):
+        from processing.models import ProcessingLog
+
+        duration_ms = int((time.monotonic() - self._started) * 1000)
+        if self.record is None:
+            return
+
+        subject = f"video {self.video_response_id}" if self.video_response_id else "interview"
+        if error is None:
+            self.log(f"{self.record.get_stage_display()} for {subject} completed in {duration_ms}ms")
+        else:
+            self.log(
+                f"{self.record.get_stage_display()} for {subject} failed after {duration_ms}ms "
+                f"(attempt {self.attempt + 1}): {error}",
+                level='error',
+            )
+
+        try:
+            self.record.status = 'completed' if error is None else 'failed'
+            self.record.error_message = '' if error is None else str(error)
+            self.record.finished_at = timezone.now()
+            self.record.duration_ms = duration_ms
+            self.record.save(update_fields=['status', 'error_message', 'finished_at', 'duration_ms'])
+            if self.record.queue_item_id is not None:
+                ProcessingLog.objects.bulk_create([
+                    ProcessingLog(queue_item_id=self.record.queue_item_id, log_level=level, message=message)
+                    for level, message in self._logs
+                ])
+            else:
+                for level, message in self._logs:
+                    logger.log(logging.ERROR if level == 'error' else logging.INFO, message)
+        except Exception as e:
+            logger.warning(f"Could not record end of {self.stage} stage: {e}")
+            return
+        self._publish()
+
+
+@contextmanager
+def track_stage(stage, interview_id=None, video_response_id=None, task=None):
+    """
+    Time a pipeline stage; yields the StageTracker so the stage can add log lines
+
+    Exceptions (including Celery Retry) mark the run failed and propagate.
+    """
+    tracker = StageTracker(stage, interview_id=interview_id, video_response_id=video_response_id, task=task)
+    tracker.start()
+    try:
+        yield tracker
+    except Exception as e:
+        tracker.finish(error=e)
+        raise
+    tracker.finish()
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(fraction * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def stage_latency(since, until=None):
+    """
+    p50/p95 duration per stage for completed runs started in [since, until)
+
+    Returns {stage: {'count', 'p50_ms', 'p95_ms', 'max_ms'}} for every stage.
+    """
+    from processing.models import ProcessingStage
+
+    runs = ProcessingStage.objects.filter(status='completed', started_at__gte=since, duration_ms__isnull=False)
+    if until is not None:
+        runs = runs.filter(started_at__lt=until)
+
+    durations = {stage: [] for stage, _ in ProcessingStage.STAGE_CHOICES}
+    for stage, duration_ms in runs.values_list('stage', 'duration_ms').order_by('stage', 'duration_ms'):
+        durations.setdefault(stage, []).append(duration_ms)
+
+    return {
+        stage: {
+            'count': len(values),
+            'p50_ms': percentile(values, 0.50),
+            'p95_ms': percentile(values, 0.95),
+            'max_ms': values[-1] if values else None,
+        }
+        for stage, values in durations.items()
+    }
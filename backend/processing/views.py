@@ -0,0 +1,60 @@
+"""
+ViewSet for processing pipeline stage timings
+"""
+
+from datetime import timedelta
+
+from django.utils import timezone
+from rest_framework import viewsets
+from rest_framework.decorators import action
+from rest_framework.response import Response
+
+from accounts.permissions import RolePermission
+from .models import ProcessingStage
+from .serializers import ProcessingStageSerializer
+from .tracking import stage_latency
+
+
+class ProcessingStageViewSet(viewsets.ReadOnlyModelViewSet):
+    """
+    API endpoints for pipeline stage timings
+    
+    Only HR Managers and IT Support can access
+    """
+    
+    queryset = ProcessingStage.objects.all()
+    serializer_class = ProcessingStageSerializer
+    permission_classes = [RolePermission(required_roles=["HR_MANAGER", "IT_SUPPORT"])]
+    
+    def get_queryset(self):
+        """Filter based on query parameters"""
+        queryset = super().get_queryset().order_by('-started_at')
+        
+        stage = self.request.query_params.get('stage')
+        if stage:
+            queryset = queryset.filter(stage=stage)
+        
+        interview_id = self.request.query_params.get('interview_id')
+        if interview_id:
+            queryset = queryset.filter(interview_id=interview_id)
+        
+        return queryset
+    
+    @action(detail=False, methods=['get'])
+    def latency(self, request):
+        """
+        p50/p95 latency per stage over a time window
+        
+        GET /api/system/processing-stages/latency/?hours=24
+        """
+        try:
+            hours = max(1, min(int(request.query_params.get('hours', 24)), 24 * 90))
+        except ValueError:
+            hours = 24
+        
+        since = timezone.now() - timedelta(hours=hours)
+        return Response({
+            'window_hours': hours,
+            'since': since,
+            'stages': stage_latency(since),
+        })
@@ -36,7 +36,7 @@ class SystemSettingsAdmin(admin.ModelAdmin):
             'fields': ['max_concurrent_interviews', 'interview_expiry_days'],
         }),
         ('AI Features', {
-            'fields': ['enable_script_detection', 'enable_sentiment_analysis'],
+            'fields': ['enable_script_detection', 'enable_sentiment_analysis', 'face_detector_backend'],
         }),
         ('Metadata', {
             'fields': ['last_modified', 'modified_by'],
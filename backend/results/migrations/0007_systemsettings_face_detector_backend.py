@@ -0,0 +1,25 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("results", "0006_interviewresult_hr_decision_fields"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="systemsettings",
+            name="face_detector_backend",
+            field=models.CharField(
+                choices=[
+                    ("haar", "Haar cascade"),
+                    ("yunet", "YuNet (OpenCV DNN)"),
+                    ("ssd", "ResNet-10 SSD (OpenCV DNN)"),
+                ],
+                default="haar",
+                help_text="Face detection backend used by script reading detection (DNN backends need model files)",
+                max_length=20,
+            ),
+        ),
+    ]
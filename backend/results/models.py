@@ -191,6 +191,18 @@ class SystemSettings(models.Model):
         help_text="Enable sentiment analysis in interviews"
     )
     
+    FACE_DETECTOR_CHOICES = [
+        ('haar', 'Haar cascade'),
+        ('yunet', 'YuNet (OpenCV DNN)'),
+        ('ssd', 'ResNet-10 SSD (OpenCV DNN)'),
+    ]
+    face_detector_backend = models.CharField(
+        max_length=20,
+        choices=FACE_DETECTOR_CHOICES,
+        default='haar',
+        help_text="Face detection backend used by script reading detection (DNN backends need model files)"
+    )
+    
     # Metadata
     last_modified = models.DateTimeField(auto_now=True)
     modified_by = models.CharField(max_length=100, blank=True)
@@ -5,6 +5,7 @@ Serializers for interview results and HR review
 from rest_framework import serializers
 from .models import InterviewResult
 from interviews.models import Interview, VideoResponse, InterviewQuestion
+from interviews.streaming import stream_url
 from applicants.serializers import ApplicantSerializer
 
 
@@ -41,13 +42,8 @@ class VideoResponseReviewSerializer(serializers.ModelSerializer):
         ]
     
     def get_video_url(self, obj):
-        """Get video file URL"""
-        if obj.video_file_path:
-            request = self.context.get('request')
-            if request:
-                return request.build_absolute_uri(obj.video_file_path.url)
-            return obj.video_file_path.url
-        return None
+        """Get the seekable playback URL (signed for <video> elements)"""
+        return stream_url(self.context.get('request'), obj)
     
     def get_hr_reviewer_name(self, obj):
         """Get HR reviewer's full name"""
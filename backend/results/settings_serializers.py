@@ -16,6 +16,7 @@ class SystemSettingsSerializer(serializers.ModelSerializer):
             'interview_expiry_days',
             'enable_script_detection',
             'enable_sentiment_analysis',
+            'face_detector_backend',
             'last_modified',
             'modified_by',
         ]
@@ -22,6 +22,7 @@ from results.serializers import (
     FinalDecisionSerializer,
 )
 from interviews.models import Interview, VideoResponse
+from interviews.streaming import stream_url
 
 
 class InterviewResultViewSet(viewsets.ModelViewSet):
@@ -194,7 +195,7 @@ class InterviewResultViewSet(viewsets.ModelViewSet):
                     'question_type': vr.question.question_type.name if vr.question.question_type else None,
                     'order': vr.question.order
                 },
-                'video_file': vr.video_file_path.url if vr.video_file_path else None,
+                'video_file': stream_url(request, vr, absolute=False),
                 'transcript': vr.transcript or '',
                 'ai_score': vr.ai_score or 0,
                 'ai_assessment': ai_assessment,
@@ -334,7 +335,7 @@ class InterviewResultViewSet(viewsets.ModelViewSet):
         """
         Recalculate overall score considering HR overrides
         """
-        from interviews.tasks import calculate_interview_score
+        from interviews.tasks import calculate_interview_score, update_applicant_status
         
         # Calculate new score (will use final_score property which includes overrides)
         score_data = calculate_interview_score(result.interview.id)
@@ -346,14 +347,7 @@ class InterviewResultViewSet(viewsets.ModelViewSet):
             result.save()
             
             # Update applicant status
-            applicant = result.interview.applicant
-            if score_data['recommendation'] == 'pass':
-                applicant.status = 'passed'
-            elif score_data['recommendation'] == 'fail':
-                applicant.status = 'failed'
-            else:
-                applicant.status = 'under_review'
-            applicant.save()
+            update_applicant_status(result.interview.applicant, score_data['recommendation'])
     
     @action(detail=True, methods=['post'], url_path='authenticity-check')
     def authenticity_check(self, request, pk=None):
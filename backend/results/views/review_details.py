@@ -5,6 +5,7 @@ from django.shortcuts import get_object_or_404
 
 from results.models import InterviewResult
 from interviews.models import VideoResponse
+from interviews.streaming import stream_url
 from common.permissions import IsHRUser
 
 
@@ -62,8 +63,8 @@ class InterviewReviewDetails(APIView):
                         "question_type": vr.question.question_type.name if vr.question.question_type else None,
                         "order": vr.question.order,
                     },
-                    "video_file": vr.video_file_path.url if vr.video_file_path else None,
-                    "video_url": request.build_absolute_uri(vr.video_file_path.url) if vr.video_file_path else None,
+                    "video_file": stream_url(request, vr, absolute=False),
+                    "video_url": stream_url(request, vr),
                     "transcript": vr.transcript or "",
                     "ai_score": vr.ai_score or 0,
                     "ai_assessment": ai_assessment,
@@ -5,6 +5,7 @@ from django.utils import timezone
 from .models import TrainingModule, TrainingSession, TrainingResponse
 from .serializers import TrainingModuleSerializer, TrainingSessionSerializer, TrainingResponseSerializer
 from interviews.ai_service import get_ai_service
+from interviews.llm_fanout import call_with_timeout
 import os
 from django.conf import settings
 
@@ -141,7 +142,9 @@ class TrainingSessionViewSet(viewsets.ModelViewSet):
                 # 2. Generate coaching feedback (works with both real and mock transcripts)
                 print(f"🤖 Generating coaching feedback...")
                 try:
-                    feedback = ai_service.generate_coaching_feedback(transcript, question_text)
+                    feedback = call_with_timeout(
+                        lambda: ai_service.generate_coaching_feedback(transcript, question_text)
+                    )
                     response.ai_feedback = feedback
                     response.scores = feedback.get('scores', {})
                     response.save()